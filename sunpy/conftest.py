@@ -11,6 +11,8 @@ from sunpy.extern.six.moves.urllib.error import URLError
 
 import pytest
 
+from sunpy.extern import six
+
 
 # Force MPL to use non-gui backends for testing.
 try:
@@ -27,6 +29,10 @@ from sunpy.tests.helpers import new_hash_library, figure_test_pngfiles
 
 GOOGLE_URL = 'http://www.google.com'
 
+# Modules that use Python 3 only syntax.
+if six.PY2:
+    collect_ignore = ['net/asyncdownload.py', 'net/tests/test_asyncdownload.py']
+
 
 def site_reachable(url):
     try:
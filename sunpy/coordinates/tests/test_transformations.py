@@ -1,9 +1,13 @@
 import numpy as np
 
 import astropy.units as u
+from astropy.coordinates import Longitude
+from astropy.time import Time
 from astropy.tests.helper import quantity_allclose
 
-from sunpy.coordinates import Helioprojective
+from sunpy import sun
+from sunpy.coordinates import (Helioprojective, HeliographicStonyhurst,
+                               HeliographicCarrington)
 
 
 def test_hpc_hpc():
@@ -44,3 +48,45 @@ def test_hpc_hpc_null():
     assert quantity_allclose(hpc_new.D0, hpc_in.D0)
     assert quantity_allclose(hpc_new.B0, hpc_in.B0)
     assert quantity_allclose(hpc_new.L0, hpc_in.L0)
+
+
+def test_hgs_hgc_offset_cache():
+    from sunpy.coordinates import transformations
+
+    transformations._carrington_offset_cache.clear()
+    dateobs = "2011/01/01T00:00:00"
+    hgs = HeliographicStonyhurst([0, 10]*u.deg, [0, 5]*u.deg, dateobs=dateobs)
+
+    hgc = hgs.transform_to(HeliographicCarrington(dateobs=dateobs))
+    assert len(transformations._carrington_offset_cache) == 1
+
+    hgs_new = hgc.transform_to(HeliographicStonyhurst(dateobs=dateobs))
+    assert len(transformations._carrington_offset_cache) == 1
+    assert quantity_allclose(hgs_new.lon, hgs.lon)
+    assert quantity_allclose(hgs_new.lat, hgs.lat)
+
+    offset = sun.heliographic_solar_center(hgs.dateobs)[0]
+    difference = Longitude(hgc.lon - hgs.lon - offset, wrap_angle=180*u.deg)
+    assert quantity_allclose(difference, 0*u.deg, atol=1e-8*u.deg)
+
+
+def test_hpc_hpc_roundtrip():
+    hpc_in = Helioprojective([100, -300]*u.arcsec, [200, 50]*u.arcsec,
+                             B0=5*u.deg, L0=10*u.deg, dateobs="2011/01/01T00:00:00")
+    hpc_out = Helioprojective(B0=-3*u.deg, D0=0.9*u.au, dateobs="2011/01/01T00:00:00")
+
+    hpc_new = hpc_in.transform_to(hpc_out).transform_to(hpc_in)
+
+    assert quantity_allclose(hpc_new.Tx, hpc_in.Tx, atol=1e-6*u.arcsec)
+    assert quantity_allclose(hpc_new.Ty, hpc_in.Ty, atol=1e-6*u.arcsec)
+
+
+def test_carrington_offset_array_dateobs():
+    from sunpy.coordinates import transformations
+
+    transformations._carrington_offset_cache.clear()
+    dateobs = Time(["2011-01-01T00:00:00", "2011-06-01T00:00:00"])
+    offset = transformations._carrington_offset(dateobs)
+    assert offset.shape == (2,)
+    assert len(transformations._carrington_offset_cache) == 0
+    assert quantity_allclose(offset[1], transformations._carrington_offset(dateobs[1]))
@@ -7,6 +7,8 @@ This module contains the functions for converting one
 """
 from __future__ import absolute_import, division
 
+from collections import OrderedDict
+
 import numpy as np
 
 from astropy import units as u
@@ -25,6 +27,13 @@ from .frames import (HeliographicStonyhurst, HeliographicCarrington,
 __all__ = ['hgs_to_hgc', 'hgc_to_hgs', 'hcc_to_hpc',
            'hpc_to_hcc', 'hcc_to_hgs', 'hgs_to_hcc']
 
+# Carrington offsets are cached by observation time, so that transforming many
+# coordinates (or coordinate arrays) sharing a dateobs does not recompute the
+# solar ephemeris every time.
+_CARRINGTON_OFFSET_CACHE_SIZE = 128
+_carrington_offset_cache = OrderedDict()
+
+
 def _carrington_offset(dateobs):
     """
     Calculate the HG Longitude offest based on a time
@@ -32,7 +41,18 @@ def _carrington_offset(dateobs):
     if dateobs is None:
         raise ValueError("To perform this transformation the coordinate"
                          " Frame needs a dateobs Attribute")
-    return sun.heliographic_solar_center(dateobs)[0]
+    if not dateobs.isscalar:
+        # Only single observation times are cached.
+        return sun.heliographic_solar_center(dateobs)[0]
+    key = (dateobs.scale, float(dateobs.jd1), float(dateobs.jd2))
+    try:
+        offset = _carrington_offset_cache.pop(key)
+    except KeyError:
+        offset = sun.heliographic_solar_center(dateobs)[0]
+        if len(_carrington_offset_cache) >= _CARRINGTON_OFFSET_CACHE_SIZE:
+            _carrington_offset_cache.popitem(last=False)
+    _carrington_offset_cache[key] = offset
+    return offset
 
 # =============================================================================
 # ------------------------- Transformation Framework --------------------------
@@ -181,7 +201,9 @@ def hgs_to_hcc(heliogcoord, heliocframe):
 def hpc_to_hpc(heliopcoord, heliopframe):
     """
     This converts from HPC to HPC, with different observer location parameters.
-    It does this by transforming through HGS.
+    It does this by transforming through HCC and HGS, calling the
+    transformation functions directly rather than searching the
+    transformation graph for each leg.
     """
     if (heliopcoord.B0 == heliopframe.B0 and
         heliopcoord.L0 == heliopframe.L0 and
@@ -189,13 +211,14 @@ def hpc_to_hpc(heliopcoord, heliopframe):
 
         return heliopframe.realize_frame(heliopcoord._data)
 
-    hgs = heliopcoord.transform_to(HeliographicStonyhurst)
-    hgs.B0 = heliopframe.B0
-    hgs.L0 = heliopframe.L0
-    hgs.D0 = heliopframe.D0
-    hpc = hgs.transform_to(heliopframe)
+    hcc = hpc_to_hcc(heliopcoord, Heliocentric(B0=heliopcoord.B0, L0=heliopcoord.L0,
+                                               D0=heliopcoord.D0,
+                                               dateobs=heliopcoord.dateobs))
+    hgs = hcc_to_hgs(hcc, HeliographicStonyhurst(dateobs=heliopcoord.dateobs))
+    hcc = hgs_to_hcc(hgs, Heliocentric(B0=heliopframe.B0, L0=heliopframe.L0,
+                                       D0=heliopframe.D0, dateobs=heliopframe.dateobs))
 
-    return hpc
+    return hcc_to_hpc(hcc, heliopframe)
 
 
 # Make a transformation graph for the documentation, borrowed lovingly from
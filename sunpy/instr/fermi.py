@@ -13,7 +13,7 @@ import numpy as np
 import astropy.units as u
 from astropy.coordinates import Longitude, Latitude
 
-from sunpy.time import parse_time, TimeRange
+from sunpy.time import parse_time
 from sunpy import sun
 from sunpy.io.fits import fits
 
@@ -21,6 +21,17 @@ __all__ = ['download_weekly_pointing_file', 'get_detector_sun_angles_for_time',
            'get_detector_sun_angles_for_date', 'plot_detector_sun_angles',
            'met_to_utc']
 
+# The reference time of the Fermi Mission Elapsed Time (MET).
+_MET_REFERENCE = np.datetime64('2001-01-01T00:00:00', 'us')
+
+# Pointing data read from weekly pointing files, keyed by file path.  Each
+# entry also records the modification time of the file, so that the data is
+# only read again if the file has been replaced.
+_pointing_file_cache = {}
+
+_NAI_DETECTORS = ['n0', 'n1', 'n2', 'n3', 'n4', 'n5', 'n6', 'n7', 'n8', 'n9',
+                  'n10', 'n11']
+
 
 def download_weekly_pointing_file(date):
     """
@@ -96,24 +107,20 @@ def get_detector_sun_angles_for_time(time, file):
     """
 
     time = parse_time(time)
-    scx, scz, tt = get_scx_scz_at_time(time, file)
-    # retrieve the detector angle information in spacecraft coordinates
-    detectors = nai_detector_angles()
-
-    # get the detector pointings in RA/DEC given the input spacecraft x and z
-    # axes
-    detector_radecs = nai_detector_radecs(detectors, scx, scz, tt)
-
-    # this gets the sun position with RA in hours in decimal format (e.g. 4.3).
-    # DEC is already in degrees
-    sunpos_ra_not_in_deg = [sun.sun.apparent_rightascension(time),
-                            sun.sun.apparent_declination(time)]
-    # now Sun position with RA in degrees
-    sun_pos = [sunpos_ra_not_in_deg[0].to('deg'), sunpos_ra_not_in_deg[1]]
-    # sun_pos = [(sunpos_ra_not_in_deg[0] / 24) * 360., sunpos_ra_not_in_deg[1]]
-    # now get the angle between each detector and the Sun
-    detector_to_sun_angles = (get_detector_separation_angles(detector_radecs,
-                                                             sun_pos))
+    pointing = _read_pointing_file(file)
+    ind = np.searchsorted(pointing['time'], np.datetime64(time))
+
+    # get the angle between each detector and the Sun, with the Sun position
+    # at the input time and the spacecraft pointing of the next entry in the
+    # pointing file.
+    angles = _detector_sun_angles(
+        pointing['ra_scx'][ind:ind + 1], pointing['dec_scx'][ind:ind + 1],
+        pointing['ra_scz'][ind:ind + 1], pointing['dec_scz'][ind:ind + 1],
+        np.array([time], dtype='datetime64[us]'))
+
+    detector_to_sun_angles = dict((detector, angles[detector][0] * u.deg)
+                                  for detector in _NAI_DETECTORS)
+    detector_to_sun_angles['time'] = pointing['time'][ind].astype(datetime.datetime)
 
     return detector_to_sun_angles
 
@@ -135,45 +142,55 @@ def get_detector_sun_angles_for_date(date, file):
     """
 
     date = parse_time(date)
-    tran = TimeRange(date, date + datetime.timedelta(days=1))
-    scx, scz, times = get_scx_scz_in_timerange(tran, file)
-
-    # retrieve the detector angle information in spacecraft coordinates
-    detectors = nai_detector_angles()
-
-    detector_to_sun_angles = []
-    # get the detector vs Sun angles for each t and store in a list of
-    # dictionaries.
-    for i in range(len(scx)):
-        detector_radecs = nai_detector_radecs(detectors, scx[i], scz[i],
-                                              times[i])
-
-        # this gets the sun position with RA in hours in decimal format
-        # (e.g. 4.3). DEC is already in degrees
-        sunpos_ra_not_in_deg = [sun.sun.apparent_rightascension(times[i]),
-                                sun.sun.apparent_declination(times[i])]
-        # now Sun position with RA in degrees
-        sun_pos = [sunpos_ra_not_in_deg[0].to('deg'), sunpos_ra_not_in_deg[1]]
-        # now get the angle between each detector and the Sun
-        detector_to_sun_angles.append(
-            get_detector_separation_angles(detector_radecs, sun_pos))
-
-    # slice the list of dictionaries to get the angles for each detector in a
-    # list form
+    pointing = _read_pointing_file(file)
+    startind, endind = np.searchsorted(
+        pointing['time'], np.array([date, date + datetime.timedelta(days=1)],
+                                   dtype='datetime64[us]'))
+    times = pointing['time'][startind:endind]
+
+    # get the detector vs Sun angles for all the times at once.
+    detector_to_sun_angles = _detector_sun_angles(
+        pointing['ra_scx'][startind:endind], pointing['dec_scx'][startind:endind],
+        pointing['ra_scz'][startind:endind], pointing['dec_scz'][startind:endind],
+        times)
+
     angles = OrderedDict()
-    key_list = ['n0', 'n1', 'n2', 'n3', 'n4', 'n5', 'n6', 'n7', 'n8', 'n9',
-                'n10', 'n11', 'time']
-    for i in range(13):
-        if not key_list[i] == 'time':
-            angles[key_list[i]] = [item[key_list[i]].value
-                                   for item in detector_to_sun_angles] * u.deg
-        else:
-            angles[key_list[i]] = [item[key_list[i]]
-                                   for item in detector_to_sun_angles]
+    for detector in _NAI_DETECTORS:
+        angles[detector] = detector_to_sun_angles[detector] * u.deg
+    angles['time'] = times.astype(datetime.datetime).tolist()
 
     return angles
 
 
+def _detector_sun_angles(ra_scx, dec_scx, ra_scz, dec_scz, times):
+    """
+    Calculates the angle between the Sun and each NaI detector for arrays of
+    spacecraft pointings and times.
+
+    Parameters
+    ----------
+    ra_scx, dec_scx, ra_scz, dec_scz : `numpy.ndarray`
+        The RA/DEC of the spacecraft x and z axes in degrees.
+    times : `numpy.ndarray`
+        The times of the pointings, as datetime64.
+
+    Returns
+    -------
+    `dict`
+        The separation angle in degrees between the Sun and each detector, as
+        an array with one value per time.
+    """
+    detector_radecs = _nai_detector_radecs(ra_scx, dec_scx, ra_scz, dec_scz)
+
+    # this gets the sun position, with RA in degrees
+    sun_ra = sun.sun.apparent_rightascension(times).to('deg').value
+    sun_dec = sun.sun.apparent_declination(times).to('deg').value
+
+    # now get the angle between each detector and the Sun
+    return dict((detector, _separation_angle(ra, dec, sun_ra, sun_dec))
+                for detector, (ra, dec) in detector_radecs.items())
+
+
 def plot_detector_sun_angles(angles):
     """
     Plots the Fermi/GBM detector angles as a function of time.
@@ -221,18 +238,15 @@ def get_scx_scz_at_time(time, file):
     """
 
     time = parse_time(time)
-    hdulist = fits.open(file)
-    timesinutc = []
-    for tim in hdulist[1].data['START']:
-        timesinutc.append(met_to_utc(tim))
-    ind = np.searchsorted(timesinutc, time)
+    pointing = _read_pointing_file(file)
+    ind = np.searchsorted(pointing['time'], np.datetime64(time))
 
-    scx_radec = (Longitude(hdulist[1].data['RA_SCX'][ind] * u.deg),
-                 Latitude(hdulist[1].data['DEC_SCX'][ind] * u.deg))
-    scz_radec = (Longitude(hdulist[1].data['RA_SCZ'][ind] * u.deg),
-                 Latitude(hdulist[1].data['DEC_SCZ'][ind] * u.deg))
+    scx_radec = (Longitude(pointing['ra_scx'][ind] * u.deg),
+                 Latitude(pointing['dec_scx'][ind] * u.deg))
+    scz_radec = (Longitude(pointing['ra_scz'][ind] * u.deg),
+                 Latitude(pointing['dec_scz'][ind] * u.deg))
 
-    return scx_radec, scz_radec, timesinutc[ind]
+    return scx_radec, scz_radec, pointing['time'][ind].astype(datetime.datetime)
 
 
 def get_scx_scz_in_timerange(timerange, file):
@@ -250,22 +264,50 @@ def get_scx_scz_in_timerange(timerange, file):
         download_weekly_pointing_file function).
     """
 
-    hdulist = fits.open(file)
-    timesinutc = []
-    for tim in hdulist[1].data['START']:
-        timesinutc.append(met_to_utc(tim))
-
-    startind = np.searchsorted(timesinutc, timerange.start)
-    endind = np.searchsorted(timesinutc, timerange.end)
+    pointing = _read_pointing_file(file)
+    startind, endind = np.searchsorted(
+        pointing['time'], np.array([timerange.start, timerange.end],
+                                   dtype='datetime64[us]'))
 
     scx_radec = []
     scz_radec = []
     for i in range(startind, endind):
-        scx_radec.append((Longitude(hdulist[1].data['RA_SCX'][i] * u.deg),
-                          Latitude(hdulist[1].data['DEC_SCX'][i] * u.deg)))
-        scz_radec.append((Longitude(hdulist[1].data['RA_SCZ'][i] * u.deg),
-                          Latitude(hdulist[1].data['DEC_SCZ'][i] * u.deg)))
-    return scx_radec, scz_radec, timesinutc[startind:endind]
+        scx_radec.append((Longitude(pointing['ra_scx'][i] * u.deg),
+                          Latitude(pointing['dec_scx'][i] * u.deg)))
+        scz_radec.append((Longitude(pointing['ra_scz'][i] * u.deg),
+                          Latitude(pointing['dec_scz'][i] * u.deg)))
+    return (scx_radec, scz_radec,
+            pointing['time'][startind:endind].astype(datetime.datetime).tolist())
+
+
+def _read_pointing_file(file):
+    """
+    Returns the start times and spacecraft x and z axis RA/DEC of the entries
+    in a Fermi/LAT weekly pointing file.
+
+    The file is read the first time it is requested and kept in memory
+    afterwards.
+
+    Returns
+    -------
+    `dict`
+        'time' is a datetime64 array of the start times of the entries, and
+        'ra_scx', 'dec_scx', 'ra_scz' and 'dec_scz' arrays of the axes RA/DEC
+        in degrees.
+    """
+    path = os.path.abspath(file)
+    mtime = os.path.getmtime(path)
+    cached = _pointing_file_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with fits.open(path) as hdulist:
+        data = hdulist[1].data
+        pointing = {'time': _met_to_datetime64(data['START'])}
+        for column in ['ra_scx', 'dec_scx', 'ra_scz', 'dec_scz']:
+            pointing[column] = np.array(data[column.upper()], dtype=np.float64)
+    _pointing_file_cache[path] = (mtime, pointing)
+    return pointing
 
 
 def nai_detector_angles():
@@ -394,6 +436,75 @@ def rotate_vector(vector, axis, theta):
     return np.dot(rot_matrix, vector)
 
 
+def _radec_to_vectors(ra, dec):
+    """Returns the unit vectors for RA/DEC arrays in degrees, shape (n, 3)."""
+    ra = np.deg2rad(ra)
+    dec = np.deg2rad(dec)
+    return np.stack([np.cos(ra) * np.cos(dec), np.sin(ra) * np.cos(dec),
+                     np.sin(dec)], axis=-1)
+
+
+def _rotate_vectors(vectors, axes, theta):
+    """
+    Rotates each vector around the corresponding axis in the same sense as
+    rotate_vector, using Rodrigues' rotation formula.
+
+    Parameters
+    ----------
+    vectors, axes : `numpy.ndarray`
+        (n, 3) arrays of the vectors and of the axes to rotate them around.
+    theta : `float`
+        the angle (in radians) by which to rotate the vectors
+    """
+    axes = axes / np.sqrt(np.sum(axes * axes, axis=-1))[:, np.newaxis]
+    return (vectors * np.cos(theta) +
+            np.cross(axes, vectors) * np.sin(theta) +
+            axes * np.sum(axes * vectors, axis=-1)[:, np.newaxis] * (1 - np.cos(theta)))
+
+
+def _nai_detector_radecs(ra_scx, dec_scx, ra_scz, dec_scz):
+    """
+    Calculates the RA/DEC of each NaI detector for arrays of spacecraft x and
+    z axis RA/DEC, as nai_detector_radecs does for a single pointing.
+
+    Returns
+    -------
+    `dict`
+        The RA and DEC arrays in degrees of each detector.
+    """
+    scx_vectors = _radec_to_vectors(ra_scx, dec_scx)
+    scz_vectors = _radec_to_vectors(ra_scz, dec_scz)
+
+    detector_radecs = {}
+    for l, d in nai_detector_angles().items():
+        phi = np.deg2rad(d[0].value)
+        theta = np.deg2rad(d[1].value)
+
+        # rotate about spacecraft z-axis first, then around the rotated
+        # spacecraft y-axis
+        vx_primed = _rotate_vectors(scx_vectors, scz_vectors, phi)
+        vy_primed = np.cross(scz_vectors, vx_primed)
+        vz_primed = _rotate_vectors(scz_vectors, vy_primed, theta)
+
+        ra = np.degrees(np.arctan2(vz_primed[:, 1], vz_primed[:, 0])) % 360
+        dec = np.degrees(np.arcsin(vz_primed[:, 2]))
+        detector_radecs[l] = (ra, dec)
+
+    return detector_radecs
+
+
+def _separation_angle(ra1, dec1, ra2, dec2):
+    """
+    Calculates the separation angle in degrees between RA/DEC positions
+    given in degrees, in the same way as separation_angle.
+    """
+    colat1 = np.deg2rad(90 - dec1)
+    colat2 = np.deg2rad(90 - dec2)
+    cosine_of_angle = (np.cos(colat1) * np.cos(colat2) +
+                       np.sin(colat1) * np.sin(colat2) * np.cos(np.deg2rad(ra1 - ra2)))
+    return np.degrees(np.arccos(cosine_of_angle))
+
+
 def get_detector_separation_angles(detector_radecs, sunpos):
     """
     Finds the separation angle between the Sun and each NaI detector,
@@ -473,6 +584,15 @@ def met_to_utc(timeinsec):
     return time_in_utc
 
 
+def _met_to_datetime64(timeinsec):
+    """
+    Converts an array of Fermi Mission Elapsed Times in seconds to
+    datetime64, in the same way as met_to_utc.
+    """
+    microseconds = np.round(np.asarray(timeinsec, dtype=np.float64) * 1e6)
+    return _MET_REFERENCE + microseconds.astype('timedelta64[us]')
+
+
 def utc_to_met(time_ut):
     """
     Converts a UT (in datetime format) to a Fermi Mission Elapsed Time (MET) float.
@@ -95,6 +95,73 @@ FILE_EM_COR = "goes_chianti_em_cor.csv"
 FILE_EM_PHO = "goes_chianti_em_pho.csv"
 FILE_RAD_COR = "chianti7p1_rad_loss.txt"
 
+# Model tables read from the files above, keyed by file path and column.
+# Each entry also records the modification time of the file, so that a table
+# is only read again if the file has been replaced, e.g. by a new download.
+_chianti_table_cache = {}
+
+
+def _get_chianti_table(data_file, label=None, invert=False):
+    """
+    Return a GOES CHIANTI model table and its spline representation.
+
+    The table is read from ``data_file`` in the SunPy download directory the
+    first time it is requested and kept in memory afterwards.
+
+    Parameters
+    ----------
+    data_file : `str`
+        Name of the table file, e.g. FILE_TEMP_COR.
+
+    label : `str` (optional)
+        Name of the column of a csv table to return along with the
+        "log10temp_MK" column.  If None, the two columns of the radiative
+        loss table (FILE_RAD_COR) are returned.
+
+    invert : `bool` (optional)
+        If True, the spline gives temperature as a function of the model
+        values rather than the other way round.
+
+    Returns
+    -------
+    modeltemp, modelvalues : `numpy.ndarray`
+        Model temperatures and the corresponding values of the column.
+
+    spline : `tuple`
+        Spline representation of the relationship, as returned by
+        `scipy.interpolate.splrep`.
+    """
+    path = os.path.join(DATA_PATH, data_file)
+    key = (path, label, invert)
+    mtime = os.path.getmtime(path)
+    cached = _chianti_table_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    if label is None:
+        # Skip the seven header lines of the radiative loss table.
+        modeltemp, modelvalues = np.loadtxt(path, skiprows=7, usecols=(0, 1),
+                                            unpack=True)
+    else:
+        modeltemp = []
+        modelvalues = []
+        with open(path, "r") as csvfile:
+            startline = dropwhile(lambda l: l.startswith("#"), csvfile)
+            csvreader = csv.DictReader(startline, delimiter=";")
+            for row in csvreader:
+                modeltemp.append(float(row["log10temp_MK"]))
+                modelvalues.append(float(row[label]))
+        modeltemp = np.asarray(modeltemp)
+        modelvalues = np.asarray(modelvalues)
+
+    if invert:
+        spline = interpolate.splrep(modelvalues, modeltemp, s=0)
+    else:
+        spline = interpolate.splrep(modeltemp, modelvalues, s=0)
+    table = (modeltemp, modelvalues, spline)
+    _chianti_table_cache[key] = (mtime, table)
+    return table
+
 
 def get_goes_event_list(timerange, goes_class_filter=None):
     """
@@ -535,23 +602,14 @@ def _goes_get_chianti_temp(fluxratio, satellite=8, abundances="coronal",
         raise ValueError("abundances must be a string equalling "
                          "'coronal' or 'photospheric'.")
 
-    # Initialize lists to hold model data of flux ratio - temperature
-    # relationship read in from csv file
-    modeltemp = []  # modelled temperature is in log_10 space in units of MK
-    modelratio = []
     # Determine name of column in csv file containing model ratio values
     # for relevant GOES satellite
     label = "ratioGOES{0}".format(satellite)
-    # Read data representing appropriate temperature--flux ratio
-    # relationship depending on satellite number and assumed abundances.
-    with open(os.path.join(DATA_PATH, data_file), "r") as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelratio.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelratio = np.asarray(modelratio)
+    # Get the model data representing the appropriate temperature--flux
+    # ratio relationship depending on satellite number and assumed
+    # abundances.  modelled temperature is in log_10 space in units of MK.
+    modeltemp, modelratio, spline = _get_chianti_table(data_file, label,
+                                                       invert=True)
 
     # Ensure input values of flux ratio are within limits of model table
     if np.min(fluxratio) < np.min(modelratio) or \
@@ -561,9 +619,8 @@ def _goes_get_chianti_temp(fluxratio, satellite=8, abundances="coronal",
             "the range {1} - {2}.".format(satellite, np.min(modelratio),
                                           np.max(modelratio)))
 
-    # Perform spline fit to model data to get temperatures for input
+    # Evaluate spline fit to model data to get temperatures for input
     # values of flux ratio
-    spline = interpolate.splrep(modelratio, modeltemp, s=0)
     temp = 10.**interpolate.splev(fluxratio.value, spline, der=0)
     temp = u.Quantity(temp, unit='MK')
 
@@ -697,24 +754,14 @@ def _goes_get_chianti_em(longflux, temp, satellite=8, abundances="coronal",
         raise ValueError("longflux and temp must have same number of "
                          "elements.")
 
-    # Initialize lists to hold model data of temperature - long channel
-    # flux relationship read in from csv file.
-    modeltemp = [] # modelled temperature is in log_10 space in units of MK
-    modelflux = []
     # Determine name of column in csv file containing model ratio values
     # for relevant GOES satellite
     label = "longfluxGOES{0}".format(satellite)
 
-    # Read data representing appropriate temperature--long flux
-    # relationship depending on satellite number and assumed abundances.
-    with open(os.path.join(DATA_PATH, data_file), "r") as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelflux.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelflux = np.asarray(modelflux)
+    # Get the model data representing the appropriate temperature--long
+    # flux relationship depending on satellite number and assumed
+    # abundances.  modelled temperature is in log_10 space in units of MK.
+    modeltemp, modelflux, spline = _get_chianti_table(data_file, label)
 
     # Ensure input values of flux ratio are within limits of model table
     if np.min(log10_temp) < np.min(modeltemp) or \
@@ -724,8 +771,7 @@ def _goes_get_chianti_em(longflux, temp, satellite=8, abundances="coronal",
                          "{0} - {1} MK.".format(np.min(10**modeltemp),
                                                 np.max(10**modeltemp)))
 
-    # Perform spline fit to model data
-    spline = interpolate.splrep(modeltemp, modelflux, s=0)
+    # Evaluate spline fit to model data
     denom = interpolate.splev(log10_temp, spline, der=0)
     em = longflux.value/denom * 1e55
     em = u.Quantity(em, unit='cm**(-3)')
@@ -956,31 +1002,16 @@ def _calc_rad_loss(temp, em, obstime=None, force_download=False,
     check_download_file(FILE_RAD_COR, GOES_REMOTE_PATH, download_dir,
                         replace=force_download)
 
-    # Initialize lists to hold model data of temperature - rad loss rate
-    # relationship read in from csv file
-    modeltemp = [] # modelled temperature is in log_10 space in units of MK
-    model_loss_rate = []
-
-    # Read data from csv file into lists, being sure to skip commented
-    # lines beginning with "#"
-    with open(os.path.join(DATA_PATH, FILE_RAD_COR),
-              "r") as csvfile:
-        startline = csvfile.readlines()[7:]
-        csvreader = csv.reader(startline, delimiter=" ")
-        for row in csvreader:
-            modeltemp.append(float(row[0]))
-            model_loss_rate.append(float(row[1]))
-    modeltemp = np.asarray(modeltemp)
-    model_loss_rate = np.asarray(model_loss_rate)
+    # Get the model data of the temperature - rad loss rate relationship
+    modeltemp, model_loss_rate, spline = _get_chianti_table(FILE_RAD_COR)
     # Ensure input values of flux ratio are within limits of model table
     if temp.value.min() < modeltemp.min() or \
         temp.value.max() > modeltemp.max():
         raise ValueError("All values in temp must be within the range " +
                          "{0} - {1} MK.".format(np.min(modeltemp/1e6),
                                                 np.max(modeltemp/1e6)))
-    # Perform spline fit to model data to get temperatures for input
-    # values of flux ratio
-    spline = interpolate.splrep(modeltemp, model_loss_rate, s=0)
+    # Evaluate spline fit to model data to get radiative loss rates for
+    # input values of temperature
     rad_loss = em.value * interpolate.splev(temp.value, spline, der=0)
     rad_loss = u.Quantity(rad_loss, unit='erg/s')
     rad_loss = rad_loss.to(u.J/u.s)
@@ -6,6 +6,7 @@ from warnings import warn
 import copy
 import csv
 import sqlite3
+from collections import namedtuple
 
 import numpy as np
 from astropy.io import fits
@@ -16,11 +17,74 @@ from sunpy import config
 from sunpy.util.net import check_download_file
 from sunpy import lightcurve
 
+from sunpy.extern import six
 from sunpy.extern.six.moves import urllib
 
 LYTAF_REMOTE_PATH = "http://proba2.oma.be/lyra/data/lytaf/"
 LYTAF_PATH = config.get("downloads", "download_dir")
 
+# The record array dtype of the events returned by get_lytaf_events().
+LYTAF_DTYPE = [("insertion_time", object),
+               ("begin_time", object),
+               ("reference_time", object),
+               ("end_time", object),
+               ("event_type", object),
+               ("event_definition", object)]
+
+# The local store combining the events of the LYTAF databases, indexed by
+# time and event type, is kept in LYTAF_STORE_DIR, or next to the databases
+# if that is None.  Databases in different directories are kept apart.
+LYTAF_STORE_NAME = "lytaf_store.db"
+LYTAF_STORE_DIR = None
+
+# The events of each LYTAF database, read from the store, keyed by file path.
+# Each entry also records the modification time of the file, so that the
+# events are only read again once the file has changed and been merged into
+# the store again, e.g. after a new download.
+_lytaf_table_cache = {}
+
+_LytafTable = namedtuple("_LytafTable", ["insertion_time", "begin_time",
+                                         "reference_time", "end_time",
+                                         "max_end_time", "event_type",
+                                         "event_definition", "event_types"])
+"""
+The events in a LYTAF database, sorted by begin time.  The times are int64
+arrays of microseconds since 1970-01-01 and max_end_time[i] is the latest end
+time of events 0 to i, so the events overlapping a time range can be found
+with two binary searches.  event_types lists every type in the database.
+"""
+
+_LYTAF_STORE_SCHEMA = """
+create table if not exists source (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE,
+    mtime REAL,
+    n_events INTEGER,
+    last_insertion_time INTEGER,
+    first_begin_time NUMERIC,
+    last_end_time NUMERIC,
+    max_duration NUMERIC
+);
+create table if not exists event (
+    source_id INTEGER REFERENCES source(id),
+    insertion_time INTEGER,
+    begin_time NUMERIC,
+    reference_time NUMERIC,
+    end_time NUMERIC,
+    event_type TEXT,
+    event_definition TEXT
+);
+create index if not exists event_time_index
+    on event (source_id, begin_time, end_time);
+create index if not exists event_type_index on event (event_type);
+create table if not exists event_type (
+    source_id INTEGER REFERENCES source(id),
+    id INTEGER,
+    type TEXT,
+    definition TEXT
+);
+"""
+
 
 def remove_lytaf_events_from_lightcurve(lc, artifacts=None,
                                         return_artifacts=False,
@@ -97,19 +161,15 @@ def remove_lytaf_events_from_lightcurve(lc, artifacts=None,
         lytaf_path = LYTAF_PATH
     if not isinstance(lc, lightcurve.LightCurve):
         raise TypeError("lc must be a LightCurve object.")
-    # Remove artifacts from time series
-    data_columns = lc.data.columns
-    time, channels, artifact_status = _remove_lytaf_events(
-        lc.data.index,
-        channels=[np.asanyarray(lc.data[col]) for col in data_columns],
-        artifacts=artifacts, return_artifacts=True, lytaf_path=lytaf_path,
+    # Find the times of artifacts in time series
+    bad_times, artifact_status = _find_lytaf_artifacts(
+        lc.data.index, artifacts, lytaf_path=lytaf_path,
         force_use_local_lytaf=force_use_local_lytaf)
-    # Create new copy copy of lightcurve and replace data with
-    # artifact-free time series.
-    lc_new = copy.deepcopy(lc)
-    lc_new.data = pandas.DataFrame(
-        index=time, data=dict((col, channels[i])
-                              for i, col in enumerate(data_columns)))
+    # Create new copy of lightcurve with artifact-free time series.  The
+    # data is selected directly, rather than copied and then replaced.
+    lc_new = copy.copy(lc)
+    lc_new.meta = copy.deepcopy(lc.meta)
+    lc_new.data = lc.data[~bad_times]
     if return_artifacts:
         return lc_new, artifact_status
     else:
@@ -220,70 +280,20 @@ def _remove_lytaf_events(time, channels=None, artifacts=None,
 
     """
     # Check inputs
-    if not lytaf_path:
-        lytaf_path = LYTAF_PATH
     if channels and type(channels) is not list:
         raise TypeError("channels must be None or a list of numpy arrays "
                         "of dtype 'float64'.")
-    if not artifacts:
-        raise ValueError("User has supplied no artifacts to remove.")
-    if type(artifacts) is str:
-        artifacts = [artifacts]
-    if not all(isinstance(artifact_type, str) for artifact_type in artifacts):
-        raise TypeError("All elements in artifacts must in strings.")
-    all_lytaf_event_types = get_lytaf_event_types(lytaf_path=lytaf_path,
-                                                  print_event_types=False)
-    for artifact in artifacts:
-        if artifact not in all_lytaf_event_types:
-            print(all_lytaf_event_types)
-            raise ValueError("{0} is not a valid artifact type. See above.".format(artifact))
-    # Define outputs
-    clean_time = np.array([parse_time(t) for t in time])
-    clean_channels = copy.deepcopy(channels)
-    artifacts_not_found = []
-    # Get LYTAF file for given time range
-    lytaf = get_lytaf_events(time[0], time[-1], lytaf_path=lytaf_path,
-                             force_use_local_lytaf=force_use_local_lytaf)
-
-    # Find events in lytaf which are to be removed from time series.
-    artifact_indices = np.empty(0, dtype="int64")
-    for artifact_type in artifacts:
-        indices = np.where(lytaf["event_type"] == artifact_type)[0]
-        # If none of a given type of artifact is found, record this
-        # type in artifact_not_found list.
-        if len(indices) == 0:
-            artifacts_not_found.append(artifact_type)
-        else:
-            # Else, record the indices of the artifacts of this type
-            artifact_indices = np.concatenate((artifact_indices, indices))
-    artifact_indices.sort()
-
-    # Remove relevant artifacts from timeseries. If none of the
-    # artifacts the user wanted removed were found, raise a warning and
-    # continue with code.
-    if not len(artifact_indices):
-        warn("None of user supplied artifacts were found.")
-        artifacts_not_found = artifacts
+    # Find and remove periods corresponding to artifacts from flux and time
+    # arrays.
+    bad_times, artifact_status = _find_lytaf_artifacts(
+        time, artifacts, lytaf_path=lytaf_path,
+        force_use_local_lytaf=force_use_local_lytaf)
+    clean_time = np.array([parse_time(t) for t in
+                           np.asarray(time, dtype=object)[~bad_times]])
+    if channels:
+        clean_channels = [np.asarray(f)[~bad_times] for f in channels]
     else:
-        # Remove periods corresponding to artifacts from flux and time
-        # arrays.
-        bad_indices = np.empty(0, dtype="int64")
-        all_indices = np.arange(len(time))
-        for index in artifact_indices:
-            bad_period = np.logical_and(time >= lytaf["begin_time"][index],
-                                        time <= lytaf["end_time"][index])
-            bad_indices = np.append(bad_indices, all_indices[bad_period])
-        clean_time = np.delete(clean_time, bad_indices)
-        if channels:
-            for i, f in enumerate(clean_channels):
-                clean_channels[i] = np.delete(f, bad_indices)
-    # If return_artifacts kwarg is True, return a list containing
-    # information on what artifacts found, removed, etc.  See docstring.
-    if return_artifacts:
-        artifact_status = {"lytaf": lytaf,
-                           "removed": lytaf[artifact_indices],
-                           "not_removed": np.delete(lytaf, artifact_indices),
-                           "not_found": artifacts_not_found}
+        clean_channels = channels
     # Output FITS file if fits kwarg is set
     if fitsfile:
         # Create time array of time strings rather than datetime objects
@@ -339,9 +349,274 @@ def _remove_lytaf_events(time, channels=None, artifacts=None,
             return clean_time, clean_channels
 
 
+def _find_lytaf_artifacts(time, artifacts, lytaf_path=None,
+                          force_use_local_lytaf=False):
+    """
+    Finds the times within LYRA artifacts of the given types.
+
+    Parameters
+    ----------
+    time : `numpy.ndarray` of `datetime.datetime` or `pandas.DatetimeIndex`
+        Gives the times of the timeseries.
+
+    artifacts : `list` of strings
+        Contain the artifact types to be found.
+
+    lytaf_path : `str`
+        directory path where the LYRA annotation files are stored.
+
+    force_use_local_lytaf : `bool`
+        Ensures current local version of lytaf files are not replaced by
+        up-to-date online versions.
+
+    Returns
+    -------
+    bad_times : `numpy.ndarray` of `bool`
+        True for the times within any of the artifacts.
+
+    artifact_status : `dict`
+        Information on what artifacts were found, removed, etc., as described
+        in _remove_lytaf_events().
+
+    """
+    if not lytaf_path:
+        lytaf_path = LYTAF_PATH
+    if not artifacts:
+        raise ValueError("User has supplied no artifacts to remove.")
+    if type(artifacts) is str:
+        artifacts = [artifacts]
+    if not all(isinstance(artifact_type, str) for artifact_type in artifacts):
+        raise TypeError("All elements in artifacts must in strings.")
+    all_lytaf_event_types = get_lytaf_event_types(lytaf_path=lytaf_path,
+                                                  print_event_types=False)
+    for artifact in artifacts:
+        if artifact not in all_lytaf_event_types:
+            print(all_lytaf_event_types)
+            raise ValueError("{0} is not a valid artifact type. See above.".format(artifact))
+    artifacts_not_found = []
+    # Get LYTAF file for given time range
+    lytaf = get_lytaf_events(time[0], time[-1], lytaf_path=lytaf_path,
+                             force_use_local_lytaf=force_use_local_lytaf)
+
+    # Find events in lytaf which are to be removed from time series.
+    artifact_indices = np.empty(0, dtype="int64")
+    for artifact_type in artifacts:
+        indices = np.where(lytaf["event_type"] == artifact_type)[0]
+        # If none of a given type of artifact is found, record this
+        # type in artifact_not_found list.
+        if len(indices) == 0:
+            artifacts_not_found.append(artifact_type)
+        else:
+            # Else, record the indices of the artifacts of this type
+            artifact_indices = np.concatenate((artifact_indices, indices))
+    artifact_indices.sort()
+
+    # If none of the artifacts the user wanted removed were found, raise a
+    # warning and continue with code.
+    if not len(artifact_indices):
+        warn("None of user supplied artifacts were found.")
+        artifacts_not_found = artifacts
+    bad_times = _lytaf_event_mask(time, lytaf["begin_time"][artifact_indices],
+                                  lytaf["end_time"][artifact_indices])
+    artifact_status = {"lytaf": lytaf,
+                       "removed": lytaf[artifact_indices],
+                       "not_removed": np.delete(lytaf, artifact_indices),
+                       "not_found": artifacts_not_found}
+    return bad_times, artifact_status
+
+
+def _as_ns(times):
+    """Returns times as int64 nanoseconds since 1970-01-01."""
+    if not isinstance(times, pandas.DatetimeIndex):
+        times = pandas.DatetimeIndex(np.asarray(times))
+    return np.asarray(times.values, dtype="datetime64[ns]").view(np.int64)
+
+
+def _lytaf_event_mask(time, begin_time, end_time):
+    """
+    Returns a boolean array which is True for the times within any of the
+    events with the given begin and end times (inclusive).
+
+    Rather than comparing every time with every event, the positions of the
+    event boundaries in the sorted times are found with a binary search.  The
+    number of events covering each time is then the cumulative sum of +1 at
+    each begin position and -1 after each end position.
+    """
+    times = _as_ns(time)
+    begins = _as_ns(begin_time)
+    ends = _as_ns(end_time)
+    valid = begins <= ends
+    begins, ends = begins[valid], ends[valid]
+    n = len(times)
+    order = None
+    if n > 1 and np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind="mergesort")
+        times = times[order]
+    starts = np.searchsorted(times, begins, side="left")
+    stops = np.searchsorted(times, ends, side="right")
+    depth = np.cumsum(np.bincount(starts, minlength=n + 1)[:n] -
+                      np.bincount(stops, minlength=n + 1)[:n])
+    mask = depth > 0
+    if order is not None:
+        unsorted = np.empty_like(mask)
+        unsorted[order] = mask
+        mask = unsorted
+    return mask
+
+
+def _uts_to_us(uts):
+    """Converts UNIX timestamps to int64 microseconds since 1970-01-01."""
+    return np.round(np.asarray(uts, dtype=np.float64) * 1e6).astype(np.int64)
+
+
+def _us_to_datetime(us):
+    """Converts int64 microseconds since 1970-01-01 to datetime objects."""
+    return np.asarray(us, dtype=np.int64).astype("datetime64[us]").astype(object)
+
+
+def _connect_lytaf_store(lytaf_path):
+    """
+    Opens the LYTAF store for the databases in lytaf_path, creating it if
+    needed.  If the store can't be written, e.g. because the databases are
+    in a read-only directory, a temporary store in memory is used instead.
+    """
+    directory = lytaf_path if LYTAF_STORE_DIR is None else LYTAF_STORE_DIR
+    try:
+        connection = sqlite3.connect(os.path.join(directory, LYTAF_STORE_NAME))
+        connection.executescript(_LYTAF_STORE_SCHEMA)
+    except sqlite3.Error:
+        connection = sqlite3.connect(":memory:")
+        connection.executescript(_LYTAF_STORE_SCHEMA)
+    return connection
+
+
+def _update_lytaf_store(connection, lytaf_path, suffix):
+    """
+    Merges the events of a LYTAF database into the LYTAF store, if the
+    database file has changed since it was last merged.
+
+    Events are only ever added to the annotation files, so if all the events
+    in the store from the file are still there, only the events inserted
+    since are copied.  Otherwise all the events from the file are replaced.
+
+    Returns
+    -------
+    source_id : `int`
+        The id of the database in the source table of the store.
+    """
+    path = os.path.abspath(os.path.join(lytaf_path,
+                                        "annotation_{0}.db".format(suffix)))
+    mtime = os.path.getmtime(path)
+    cursor = connection.cursor()
+    cursor.execute("select id, mtime, n_events, last_insertion_time "
+                   "from source where path = ?", (path,))
+    state = cursor.fetchone()
+    if state is not None and state[1] == mtime:
+        return state[0]
+
+    cursor.execute("attach database ? as annotation", (path,))
+    try:
+        with connection:
+            if state is None:
+                cursor.execute("insert into source (path) values (?)", (path,))
+                source_id = cursor.lastrowid
+            else:
+                source_id = state[0]
+            insert = ("insert into event select ?, e.insertion_time, "
+                      "e.begin_time, e.reference_time, e.end_time, t.type, "
+                      "t.definition from annotation.event e left join "
+                      "annotation.eventType t on e.eventType_id = t.id")
+            kept = None
+            if state is not None and state[3] is not None:
+                cursor.execute("select count(*) from annotation.event "
+                               "where insertion_time <= ?", (state[3],))
+                kept = cursor.fetchone()[0]
+            if kept is not None and kept == state[2]:
+                cursor.execute(insert + " where e.insertion_time > ?",
+                               (source_id, state[3]))
+            else:
+                cursor.execute("delete from event where source_id = ?",
+                               (source_id,))
+                cursor.execute(insert, (source_id,))
+            cursor.execute("delete from event_type where source_id = ?",
+                           (source_id,))
+            cursor.execute("insert into event_type select ?, id, type, "
+                           "definition from annotation.eventType",
+                           (source_id,))
+            cursor.execute("select count(*), max(insertion_time), "
+                           "min(begin_time), max(end_time), "
+                           "max(end_time - begin_time) from event "
+                           "where source_id = ?", (source_id,))
+            cursor.execute("update source set mtime = ?, n_events = ?, "
+                           "last_insertion_time = ?, first_begin_time = ?, "
+                           "last_end_time = ?, max_duration = ? where id = ?",
+                           (mtime,) + cursor.fetchone() + (source_id,))
+    finally:
+        cursor.execute("detach database annotation")
+    return source_id
+
+
+def _read_lytaf_table(connection, source_id):
+    """Reads the events of a database in the LYTAF store as a _LytafTable."""
+    cursor = connection.cursor()
+    cursor.execute("select insertion_time, begin_time, reference_time, "
+                   "end_time, event_type, event_definition from event "
+                   "where source_id = ? order by begin_time", (source_id,))
+    rows = np.array(cursor.fetchall(),
+                    dtype=[(name, np.float64 if name.endswith("_time")
+                            else object) for name, _ in LYTAF_DTYPE])
+    cursor.execute("select type from event_type where source_id = ? "
+                   "order by id", (source_id,))
+    event_types = [row[0] for row in cursor.fetchall()]
+    end_time = _uts_to_us(rows["end_time"])
+    return _LytafTable(insertion_time=_uts_to_us(rows["insertion_time"]),
+                       begin_time=_uts_to_us(rows["begin_time"]),
+                       reference_time=_uts_to_us(rows["reference_time"]),
+                       end_time=end_time,
+                       max_end_time=np.maximum.accumulate(end_time),
+                       event_type=rows["event_type"],
+                       event_definition=rows["event_definition"],
+                       event_types=event_types)
+
+
+def _get_lytaf_tables(lytaf_path, combine_files):
+    """
+    Returns the events of the given LYTAF databases in lytaf_path as
+    _LytafTables.  Missing databases are downloaded.
+
+    The events are kept in memory after they are first read.  A database is
+    only merged into the LYTAF store and read from it again once its file
+    has changed.
+    """
+    tables = []
+    stale = []
+    for suffix in combine_files:
+        dbname = "annotation_{0}.db".format(suffix)
+        check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path)
+        path = os.path.abspath(os.path.join(lytaf_path, dbname))
+        mtime = os.path.getmtime(path)
+        cached = _lytaf_table_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            tables.append(cached[1])
+        else:
+            tables.append(None)
+            stale.append((len(tables) - 1, suffix, path, mtime))
+    if stale:
+        connection = _connect_lytaf_store(lytaf_path)
+        try:
+            for i, suffix, path, mtime in stale:
+                source_id = _update_lytaf_store(connection, lytaf_path, suffix)
+                tables[i] = _read_lytaf_table(connection, source_id)
+                _lytaf_table_cache[path] = (mtime, tables[i])
+        finally:
+            connection.close()
+    return tables
+
+
 def get_lytaf_events(start_time, end_time, lytaf_path=None,
                      combine_files=("lyra", "manual", "ppt", "science"),
-                     csvfile=None, force_use_local_lytaf=False):
+                     csvfile=None, force_use_local_lytaf=False,
+                     event_types=None):
     """
     Extracts combined lytaf file for given time range.
 
@@ -370,6 +645,10 @@ def get_lytaf_events(start_time, end_time, lytaf_path=None,
         cover entire input time range etc.
         Default=False
 
+    event_types : `str` or `list` of strings
+        If given, only events of these types are returned.
+        Default=None, i.e. events of all types are returned.
+
     Returns
     -------
     lytaf : `numpy.recarray`
@@ -393,6 +672,12 @@ def get_lytaf_events(start_time, end_time, lytaf_path=None,
     annotation_science.db : contains events in the data scientifically
         interesting, e.g. GOES flares.
 
+    The events of the annotation files are merged into a local store,
+    lytaf_store.db next to them (or in LYTAF_STORE_DIR if that is set),
+    indexed by time and event type, the first time they are used and
+    whenever the files are updated, e.g. by download_lytaf_database().  The
+    events of each file are then kept in memory until the file changes.
+
     References
     ----------
     Further documentation: http://proba2.oma.be/data/TARDIS
@@ -419,85 +704,54 @@ def get_lytaf_events(start_time, end_time, lytaf_path=None,
     # Remove any duplicates from combine_files input
     combine_files = list(set(combine_files))
     combine_files.sort()
-    # Convert input times to UNIX timestamp format since this is the
-    # time format in the annotation files
-    start_time_uts = (start_time - datetime.datetime(1970, 1, 1)).total_seconds()
-    end_time_uts = (end_time - datetime.datetime(1970, 1, 1)).total_seconds()
-
-    # Define numpy record array which will hold the information from
-    # the annotation file.
-    lytaf = np.empty((0,), dtype=[("insertion_time", object),
-                                  ("begin_time", object),
-                                  ("reference_time", object),
-                                  ("end_time", object),
-                                  ("event_type", object),
-                                  ("event_definition", object)])
-    # Access annotation files
-    for suffix in combine_files:
-        # Check database files are present
-        dbname = "annotation_{0}.db".format(suffix)
-        check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path)
-        # Open SQLITE3 annotation files
-        connection = sqlite3.connect(os.path.join(lytaf_path, dbname))
-        # Create cursor to manipulate data in annotation file
-        cursor = connection.cursor()
-        # Check if lytaf file spans the start and end times defined by
-        # user.  If not, download newest version.
-        # First get start time of first event and end time of last
-        # event in lytaf.
-        cursor.execute("select begin_time from event order by begin_time asc "
-                       "limit 1;")
-        db_first_begin_time = cursor.fetchone()[0]
-        db_first_begin_time = datetime.datetime.fromtimestamp(db_first_begin_time)
-        cursor.execute("select end_time from event order by end_time desc "
-                       "limit 1;")
-        db_last_end_time = cursor.fetchone()[0]
-        db_last_end_time = datetime.datetime.fromtimestamp(db_last_end_time)
-        # If lytaf does not include entire input time range...
-        if not force_use_local_lytaf:
-            if end_time > db_last_end_time or start_time < db_first_begin_time:
-                # ...close lytaf file...
-                cursor.close()
-                connection.close()
-                # ...Download latest lytaf file...
-                check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path,
-                                    replace=True)
-                # ...and open new version of lytaf database.
-                connection = sqlite3.connect(os.path.join(lytaf_path, dbname))
-                cursor = connection.cursor()
-        # Select and extract the data from event table within file within
-        # given time range
-        cursor.execute("select insertion_time, begin_time, reference_time, "
-                       "end_time, eventType_id from event where end_time >= "
-                       "{0} and begin_time <= "
-                       "{1}".format(start_time_uts, end_time_uts))
-        event_rows = cursor.fetchall()
-        # Select and extract the event types from eventType table
-        cursor.row_factory = sqlite3.Row
-        cursor.execute("select * from eventType")
-        eventType_rows = cursor.fetchall()
-        eventType_id = []
-        eventType_type = []
-        eventType_definition = []
-        for eventType_row in eventType_rows:
-            eventType_id.append(eventType_row["id"])
-            eventType_type.append(eventType_row["type"])
-            eventType_definition.append(eventType_row["definition"])
-        # Enter desired information into the lytaf numpy record array
-        for event_row in event_rows:
-            id_index = eventType_id.index(event_row[4])
-            lytaf = np.append(lytaf,
-                              np.array((datetime.datetime.utcfromtimestamp(event_row[0]),
-                                        datetime.datetime.utcfromtimestamp(event_row[1]),
-                                        datetime.datetime.utcfromtimestamp(event_row[2]),
-                                        datetime.datetime.utcfromtimestamp(event_row[3]),
-                                        eventType_type[id_index],
-                                        eventType_definition[id_index]), dtype=lytaf.dtype))
-        # Close file
-        cursor.close()
-        connection.close()
+    if isinstance(event_types, six.string_types):
+        event_types = [event_types]
+    if event_types is not None:
+        event_types = set(event_types)
+    # Convert input times to microseconds since 1970-01-01, the format of the
+    # times in the event tables.
+    start_time_us = _uts_to_us((start_time - datetime.datetime(1970, 1, 1)).total_seconds())
+    end_time_us = _uts_to_us((end_time - datetime.datetime(1970, 1, 1)).total_seconds())
+
+    tables = _get_lytaf_tables(lytaf_path, combine_files)
+    # Check if lytaf files span the start and end times defined by user.  If
+    # not, download newest versions.
+    if not force_use_local_lytaf:
+        outdated = [suffix for suffix, table in zip(combine_files, tables)
+                    if len(table.begin_time) == 0 or
+                    start_time_us < table.begin_time[0] or
+                    end_time_us > table.max_end_time[-1]]
+        if outdated:
+            download_lytaf_database(lytaf_path, combine_files=outdated)
+            tables = _get_lytaf_tables(lytaf_path, combine_files)
+
+    # Collect the events from each annotation file within the given time
+    # range, i.e. with end_time >= start_time and begin_time <= end_time.
+    # The events are sorted by begin time, so every event from first on could
+    # end after start_time and the events before last begin before end_time.
+    selected = []
+    for table in tables:
+        first = np.searchsorted(table.max_end_time, start_time_us, side="left")
+        last = np.searchsorted(table.begin_time, end_time_us, side="right")
+        indices = np.arange(first, max(first, last))
+        keep = table.end_time[indices] >= start_time_us
+        if event_types is not None:
+            keep &= np.array([event_type in event_types
+                              for event_type in table.event_type[indices]],
+                             dtype=bool)
+        selected.append((table, indices[keep]))
+
+    # Enter desired information into the lytaf numpy record array
+    lytaf = np.empty((sum(len(indices) for _, indices in selected),),
+                     dtype=LYTAF_DTYPE)
+    for name in lytaf.dtype.names:
+        values = [getattr(table, name)[indices] for table, indices in selected]
+        values = np.concatenate(values) if values else np.empty(0)
+        if name.endswith("_time"):
+            values = _us_to_datetime(values)
+        lytaf[name] = values
     # Sort lytaf in ascending order of begin time
-    np.recarray.sort(lytaf, order="begin_time")
+    lytaf = lytaf[np.argsort(_as_ns(lytaf["begin_time"]), kind="mergesort")]
 
     # If csvfile kwarg is set, write out lytaf to csv file
     if csvfile:
@@ -545,36 +799,48 @@ def get_lytaf_event_types(lytaf_path=None, print_event_types=True):
     # For each database file extract the event types and print them.
     if print_event_types:
         print("\nLYTAF Event Types\n-----------------\n")
-    for suffix in suffixes:
-        dbname = "annotation_{0}.db".format(suffix)
-        # Check database file exists, else download it.
-        check_download_file(dbname, LYTAF_REMOTE_PATH, lytaf_path)
-        # Open SQLITE3 LYTAF files
-        connection = sqlite3.connect(os.path.join(lytaf_path, dbname))
-        # Create cursor to manipulate data in annotation file
-        cursor = connection.cursor()
-        cursor.execute("select type from eventType;")
-        event_types = cursor.fetchall()
-        all_event_types.append(event_types)
+    # Check database files exist, else download them, and get their event
+    # types.
+    for suffix, table in zip(suffixes, _get_lytaf_tables(lytaf_path, suffixes)):
+        all_event_types.append(table.event_types)
         if print_event_types:
             print("----------------\n{0} database\n----------------"
                   .format(suffix))
-            for event_type in event_types:
-                print(str(event_type[0]))
+            for event_type in table.event_types:
+                print(str(event_type))
             print(" ")
     # Unpack event types in all_event_types into single list
-    all_event_types = [event_type[0] for event_types in all_event_types
+    all_event_types = [event_type for event_types in all_event_types
                        for event_type in event_types]
     return all_event_types
 
 
-def download_lytaf_database(lytaf_dir=''):
-    """download latest Proba2 pointing database from Proba2 Science Center"""
-    url = 'http://proba2.oma.be/lyra/data/lytaf/annotation_ppt.db'
-    destination = os.path.join(lytaf_dir, 'annotation_ppt.db')
-    urllib.request.urlretrieve(url, destination)
+def download_lytaf_database(lytaf_dir='', combine_files=("ppt",)):
+    """
+    Downloads the latest LYRA annotation databases from the Proba2 Science
+    Center and merges their new events into the local LYTAF store.
 
-    return
+    Parameters
+    ----------
+    lytaf_dir : `str`
+        directory path where the LYRA annotation files are stored.
+
+    combine_files : `tuple` of strings
+        States which LYRA annotation files are to be downloaded, any of
+        lyra, manual, ppt and science.  Default is the pointing database
+        only, i.e. ppt.
+
+    """
+    connection = _connect_lytaf_store(lytaf_dir)
+    try:
+        for suffix in combine_files:
+            dbname = "annotation_{0}.db".format(suffix)
+            url = urllib.parse.urljoin(LYTAF_REMOTE_PATH, dbname)
+            destination = os.path.join(lytaf_dir, dbname)
+            urllib.request.urlretrieve(url, destination)
+            _update_lytaf_store(connection, lytaf_dir, suffix)
+    finally:
+        connection.close()
 
 
 def split_series_using_lytaf(timearray, data, lytaf):
@@ -9,10 +9,11 @@ from __future__ import absolute_import, print_function
 
 import csv
 import socket
+from multiprocessing.pool import ThreadPool
 from datetime import datetime
-from datetime import timedelta
 
 import numpy as np
+import pandas
 
 from astropy.io import fits
 from astropy import units as u
@@ -39,6 +40,13 @@ data_servers = ('http://hesperia.gsfc.nasa.gov/hessidata/',
                 'http://hessi.ssl.berkeley.edu/hessidata/',
                 'http://soleil.i4ds.ch/hessidata/')
 
+# The count rate for each value of the compressed count rate byte in an
+# observing summary file.  The bytes are 16 groups of 16 values, the values in
+# group i being 2**i apart and continuing on from the previous group.
+_countrate_lookup_table = (np.arange(16) * 2 ** np.arange(16)[:, np.newaxis] +
+                           16 * (2 ** np.arange(16)[:, np.newaxis] - 1)).ravel()
+_countrate_lookup_table.flags.writeable = False
+
 lc_linecolors = ('black', 'pink', 'green', 'blue', 'brown', 'red',
                  'navy', 'orange', 'green')
 
@@ -272,30 +280,8 @@ def parse_obssumm_file(filename):
 
     """
 
-    afits = fits.open(filename)
-    header = afits[0].header
-
-    reference_time_ut = parse_time(afits[5].data.field('UT_REF')[0])
-    time_interval_sec = afits[5].data.field('TIME_INTV')[0]
-    # label_unit = fits[5].data.field('DIM1_UNIT')[0]
-    # labels = fits[5].data.field('DIM1_IDS')
-    labels = ['3 - 6 keV', '6 - 12 keV', '12 - 25 keV', '25 - 50 keV',
-              '50 - 100 keV', '100 - 300 keV', '300 - 800 keV', '800 - 7000 keV',
-              '7000 - 20000 keV']
-
-    # The data stored in the FITS file are "compressed" countrates stored as
-    # one byte
-    compressed_countrate = np.array(afits[6].data.field('countrate'))
-
-    countrate = uncompress_countrate(compressed_countrate)
-    dim = np.array(countrate[:,0]).size
-
-    time_array = [reference_time_ut + timedelta(0,time_interval_sec * a) for a in np.arange(dim)]
-
-    # TODO generate the labels for the dict automatically from labels
-    data = {'time': time_array, 'data': countrate, 'labels': labels}
-
-    return header, data
+    with fits.open(filename) as afits:
+        return parse_obssumm_hdulist(afits)
 
 def parse_obssumm_hdulist(hdulist):
     """
@@ -323,18 +309,18 @@ def parse_obssumm_hdulist(hdulist):
               '7000 - 20000 keV']
 
     # the data stored in the fits file are "compressed" countrates stored as one byte
-    compressed_countrate = np.array(hdulist[6].data.field('countrate'))
-
-    countrate = uncompress_countrate(compressed_countrate)
-    dim = np.array(countrate[:,0]).size
+    countrate = uncompress_countrate(hdulist[6].data.field('countrate'))
+    dim = countrate.shape[0]
 
-    time_array = [reference_time_ut + timedelta(0, time_interval_sec * a) for a in np.arange(dim)]
+    time_array = pandas.Timestamp(reference_time_ut) + pandas.to_timedelta(
+        np.arange(dim) * float(time_interval_sec), unit='s')
 
     #TODO generate the labels for the dict automatically from labels
     data = {'time': time_array, 'data': countrate, 'labels': labels}
 
     return header, data
 
+
 def uncompress_countrate(compressed_countrate):
     """Convert the compressed count rate inside of observing summary file from
     a compressed byte to a true count rate
@@ -348,14 +334,7 @@ def uncompress_countrate(compressed_countrate):
     ----------
     Hsi_obs_summ_decompress.pro `<http://hesperia.gsfc.nasa.gov/ssw/hessi/idl/qlook_archive/hsi_obs_summ_decompress.pro>`_
     """
-    ll = np.arange(0, 16, 1)
-    lkup = np.zeros(256, dtype='int')
-    sum = 0
-    for i in range(0, 16):
-        lkup[16 * i:16 * (i + 1)] = ll * 2 ** i + sum
-        if i < 15:
-            sum = lkup[16 * (i + 1) - 1] + 2 ** i
-    return lkup[compressed_countrate]
+    return _countrate_lookup_table[compressed_countrate]
 
 
 def hsi_linecolors():
@@ -375,6 +354,93 @@ def hsi_linecolors():
     """
     return ('black', 'magenta', 'lime', 'cyan', 'y', 'red', 'blue', 'orange', 'olive')
 
+def _read_detector_events(afits, detector):
+    """
+    Read the columns of the stacked calibrated event list of a detector
+    needed for its back projection.
+
+    Parameters
+    ----------
+    afits : `~astropy.io.fits.HDUList`
+        an open RHESSI calibrated event list
+    detector : int
+        the detector number
+
+    Returns
+    -------
+    events : tuple of ndarray
+        the roll angle, modulation amplitude, phase map center, grid
+        transmission and count of each event.
+    """
+    data = afits[detector + 2].data
+    return tuple(np.asarray(data.field(name), dtype=np.float64)
+                 for name in ('roll_angle', 'modamp', 'phase_map_ctr',
+                              'gridtran', 'count'))
+
+
+def _backproject_events(events, detector=8, pixel_size=(1., 1.),
+                        image_dim=(64, 64), chunk_size=65536):
+    """
+    Create a back projection image for an individual detector from the
+    columns of its stacked calibrated event list.
+
+    The probability of transmission of each event at each pixel is
+    ``gridtran * (modamp * cos(phase) + 1)``, where the phase is linear in
+    the x and y pixel coordinates.  Expanding the cosine of the sum of the x
+    and y parts of the phase, the sum over events of the cosine terms is two
+    matrix products of arrays with one row per column or row of the image,
+    so the image is accumulated over blocks of ``chunk_size`` events without
+    forming a (pixels x events) array.
+
+    Parameters
+    ----------
+    events : tuple of ndarray
+        the event columns, as returned by `_read_detector_events`
+    detector : int
+        the detector number
+    pixel_size : 2-tuple
+        the size of the pixels in arcseconds. Default is (1,1).
+    image_dim : 2-tuple
+        the size of the output image in number of pixels
+    chunk_size : int
+        the number of events to process at once
+
+    Returns
+    -------
+    out : ndarray
+        Return a backprojection image.
+    """
+    roll_angle, modamp, phase_map_center, grid_transmission, count = events
+    image_dim = [int(dim) for dim in image_dim]
+    npix = image_dim[0] * image_dim[1]
+
+    detector_index = detector - 1
+    grid_angle = np.pi/2. - grid_orientation[detector_index]
+    harm_ang_pitch = grid_pitch[detector_index]/1
+
+    # The x and y coordinates of each pixel, and their distinct values.
+    tempa = (np.arange(npix) % image_dim[0]) - (image_dim[0]-1)/2.
+    tempb = tempa.reshape(image_dim[0], image_dim[1]).transpose().reshape(npix)
+    pixel_x, x_index = np.unique(tempa * pixel_size[0], return_inverse=True)
+    pixel_y, y_index = np.unique(tempb * pixel_size[0], return_inverse=True)
+
+    wavenumber = 2*np.pi/harm_ang_pitch
+    weight = grid_transmission * count
+    image = np.zeros((len(pixel_x), len(pixel_y)))
+    for start in range(0, len(count), chunk_size):
+        block = slice(start, start + chunk_size)
+        angle = roll_angle[block] - grid_angle
+        phase_x = wavenumber * np.outer(pixel_x, np.cos(angle))
+        phase_y = phase_map_center[block] - wavenumber * np.outer(pixel_y, np.sin(angle))
+        modulation = modamp[block] * weight[block]
+        # cos(phase_x + phase_y) summed over the events of the block
+        image += np.dot(np.cos(phase_x), (np.cos(phase_y) * modulation).T)
+        image -= np.dot(np.sin(phase_x), (np.sin(phase_y) * modulation).T)
+    image += weight.sum()
+
+    return image[x_index, y_index].reshape(image_dim)
+
+
 def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
                  image_dim=(64, 64)):
     """
@@ -384,8 +450,8 @@ def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
 
     Parameters
     ----------
-    calibrated_event_list : string
-        filename of a RHESSI calibrated event list
+    calibrated_event_list : string or `~astropy.io.fits.HDUList`
+        filename of a RHESSI calibrated event list, or the open file
     detector : int
         the detector number
     pixel_size : 2-tuple
@@ -403,40 +469,18 @@ def _backproject(calibrated_event_list, detector=8, pixel_size=(1., 1.),
     >>> import sunpy.instr.rhessi as rhessi
 
     """
-    afits = fits.open(calibrated_event_list)
-
-    # info_parameters = fits[2]
-    # detector_efficiency = info_parameters.data.field('cbe_det_eff$$REL')
-
-    afits = fits.open(calibrated_event_list)
-
-    fits_detector_index = detector + 2
-    detector_index = detector - 1
-    grid_angle = np.pi/2. - grid_orientation[detector_index]
-    harm_ang_pitch = grid_pitch[detector_index]/1
-
-    phase_map_center = afits[fits_detector_index].data.field('phase_map_ctr')
-    this_roll_angle = afits[fits_detector_index].data.field('roll_angle')
-    modamp = afits[fits_detector_index].data.field('modamp')
-    grid_transmission = afits[fits_detector_index].data.field('gridtran')
-    count = afits[fits_detector_index].data.field('count')
-
-    tempa = (np.arange(image_dim[0]*image_dim[1]) %  image_dim[0]) - (image_dim[0]-1)/2.
-    tempb = tempa.reshape(image_dim[0],image_dim[1]).transpose().reshape(image_dim[0]*image_dim[1])
-
-    pixel = np.array(list(zip(tempa,tempb)))*pixel_size[0]
-    phase_pixel = (2*np.pi/harm_ang_pitch)* ( np.outer(pixel[:,0], np.cos(this_roll_angle - grid_angle)) -
-                                              np.outer(pixel[:,1], np.sin(this_roll_angle - grid_angle))) + phase_map_center
-    phase_modulation = np.cos(phase_pixel)
-    gridmod = modamp * grid_transmission
-    probability_of_transmission = gridmod*phase_modulation + grid_transmission
-    bproj_image = np.inner(probability_of_transmission, count).reshape(image_dim)
+    if isinstance(calibrated_event_list, fits.HDUList):
+        events = _read_detector_events(calibrated_event_list, detector)
+    else:
+        with fits.open(calibrated_event_list) as afits:
+            events = _read_detector_events(afits, detector)
 
-    return bproj_image
+    return _backproject_events(events, detector=detector,
+                               pixel_size=pixel_size, image_dim=image_dim)
 
 
 def backprojection(calibrated_event_list, pixel_size=(1., 1.) * u.arcsec,
-                   image_dim=(64, 64) * u.pix):
+                   image_dim=(64, 64) * u.pix, threads=None):
     """
     Given a stacked calibrated event list fits file create a back
     projection image.
@@ -451,6 +495,9 @@ def backprojection(calibrated_event_list, pixel_size=(1., 1.) * u.arcsec,
         the size of the pixels in arcseconds. Default is (1,1).
     image_dim : `~astropy.units.Quantity` instance
         the size of the output image in number of pixels
+    threads : int
+        the number of detectors to back project at once. Default is one per
+        detector used.
 
     Returns
     -------
@@ -476,28 +523,35 @@ def backprojection(calibrated_event_list, pixel_size=(1., 1.) * u.arcsec,
     if not (isinstance(image_dim, u.Quantity) and image_dim.unit == 'pix'):
         raise ValueError("Must be astropy Quantity in pixels")
 
+    import sunpy.map
+    import sunpy.sun.constants
+
+    with fits.open(calibrated_event_list) as afits:
+        info_parameters = afits[2]
+        xyoffset = info_parameters.data.field('USED_XYOFFSET')[0]
+        time_range = TimeRange(info_parameters.data.field('ABSOLUTE_TIME_RANGE')[0])
+
+        # find out what detectors were used
+        det_index_mask = afits[1].data.field('det_index_mask')[0]
+        detector_list = [detector for detector in (np.arange(9)+1) * np.array(det_index_mask)
+                         if detector > 0]
+        events = [_read_detector_events(afits, detector) for detector in detector_list]
+
+    # numpy releases the GIL in the trigonometric functions and matrix
+    # products, so the detectors are back projected in parallel threads.
+    def backproject(args):
+        return _backproject_events(args[0], detector=args[1],
+                                   pixel_size=pixel_size.value,
+                                   image_dim=image_dim.value)
+
+    pool = ThreadPool(threads or max(len(detector_list), 1))
     try:
-        import sunpy.data.sample
-    except ImportError:
-        import sunpy.data
-        sunpy.data.download_sample()
-    # This may need to be moved up to data from sample
-    calibrated_event_list = sunpy.data.sample.RHESSI_EVENT_LIST
-
-    afits = fits.open(calibrated_event_list)
-    info_parameters = afits[2]
-    xyoffset = info_parameters.data.field('USED_XYOFFSET')[0]
-    time_range = TimeRange(info_parameters.data.field('ABSOLUTE_TIME_RANGE')[0])
-
-    image = np.zeros(image_dim.value)
-
-    # find out what detectors were used
-    det_index_mask = afits[1].data.field('det_index_mask')[0]
-    detector_list = (np.arange(9)+1) * np.array(det_index_mask)
-    for detector in detector_list:
-        if detector > 0:
-            image = image + _backproject(calibrated_event_list, detector=detector, pixel_size=pixel_size.value,
-                                         image_dim=image_dim.value)
+        images = pool.map(backproject, list(zip(events, detector_list)))
+    finally:
+        pool.close()
+    image = np.zeros(image_dim.value.astype(int))
+    for detector_image in images:
+        image = image + detector_image
 
     dict_header = {
         "DATE-OBS": time_range.center().strftime("%Y-%m-%d %H:%M:%S"),
@@ -1,7 +1,12 @@
+import datetime
+
+import numpy as np
 import pytest
 from numpy.testing import assert_almost_equal
+from astropy.io import fits
+from sunpy import sun
 from sunpy.instr import fermi
-from sunpy.time import parse_time
+from sunpy.time import parse_time, TimeRange
 from sunpy.extern import six
 
 
@@ -50,3 +55,56 @@ def test_detector_angles():
     assert_almost_equal(det2['n7'].value, 127.35783, decimal=1)
     assert_almost_equal(det2['n8'].value, 122.98894, decimal=1)
     assert_almost_equal(det2['n9'].value, 126.95987, decimal=1)
+
+
+def make_pointing_file(path, start='2012-02-14', n=3 * 1440):
+    """Write a weekly pointing file with random 1 minute cadence pointings."""
+    random = np.random.RandomState(0)
+    scz = random.normal(size=(n, 3))
+    scx = np.cross(scz, random.normal(size=(n, 3)))
+    columns = [fits.Column(name='START', format='D',
+                           array=fermi.utc_to_met(parse_time(start)) + 60. * np.arange(n))]
+    for name, vectors in [('SCX', scx), ('SCZ', scz)]:
+        vectors = vectors / np.sqrt(np.sum(vectors**2, axis=1))[:, np.newaxis]
+        columns.append(fits.Column(name='RA_' + name, format='D',
+                                   array=np.degrees(np.arctan2(vectors[:, 1], vectors[:, 0])) % 360))
+        columns.append(fits.Column(name='DEC_' + name, format='D',
+                                   array=np.degrees(np.arcsin(vectors[:, 2]))))
+    fits.HDUList([fits.PrimaryHDU(),
+                  fits.BinTableHDU.from_columns(columns)]).writeto(path)
+    return path
+
+
+def test_detector_angles_for_date_vectorized(tmpdir):
+    afile = make_pointing_file(str(tmpdir.join('pointing.fits')))
+    det = fermi.get_detector_sun_angles_for_date('2012-02-15', afile)
+    assert len(det) == 13
+    assert len(det['time']) == 1440
+    assert det['time'][0] == datetime.datetime(2012, 2, 15)
+
+    # Compare with the angles calculated for single pointings
+    scx, scz, times = fermi.get_scx_scz_in_timerange(
+        TimeRange('2012-02-15', '2012-02-16'), afile)
+    for i in [0, 700, 1439]:
+        radecs = fermi.nai_detector_radecs(fermi.nai_detector_angles(),
+                                           scx[i], scz[i], times[i])
+        sun_pos = [sun.sun.apparent_rightascension(times[i]).to('deg'),
+                   sun.sun.apparent_declination(times[i])]
+        expected = fermi.get_detector_separation_angles(radecs, sun_pos)
+        assert det['time'][i] == expected['time']
+        for detector in ['n0', 'n1', 'n2', 'n3', 'n4', 'n5', 'n6', 'n7', 'n8',
+                         'n9', 'n10', 'n11']:
+            assert_almost_equal(det[detector][i].value, expected[detector].value,
+                                decimal=6)
+
+
+def test_pointing_file_read_once(tmpdir, monkeypatch):
+    afile = make_pointing_file(str(tmpdir.join('pointing.fits')))
+    expected = fermi.get_detector_sun_angles_for_time('2012-02-15 02:00', afile)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Pointing file read again")
+    monkeypatch.setattr(fermi.fits, 'open', fail)
+    det = fermi.get_detector_sun_angles_for_time('2012-02-15 02:00', afile)
+    assert type(det) == dict
+    assert det == expected
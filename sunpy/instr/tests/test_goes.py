@@ -218,6 +218,33 @@ def test_goes_chianti_tem_case8():
     assert all(em8 < Quantity(9.39e+48, unit="1/cm**3")) and \
       all(em8 > Quantity(9.38e+48, unit="1/cm**3"))
 
+def test_get_chianti_table_cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(goes, "DATA_PATH", str(tmpdir))
+    monkeypatch.setattr(goes, "_chianti_table_cache", {})
+    table = tmpdir.join(goes.FILE_TEMP_COR)
+    table.write("# comment\nlog10temp_MK;ratioGOES15\n"
+                "0.0;0.01\n0.5;0.05\n1.0;0.2\n1.5;0.4\n")
+    modeltemp, modelratio, spline = goes._get_chianti_table(
+        goes.FILE_TEMP_COR, "ratioGOES15", invert=True)
+    assert_array_equal(modeltemp, [0.0, 0.5, 1.0, 1.5])
+    assert_array_equal(modelratio, [0.01, 0.05, 0.2, 0.4])
+    # The table is only read once...
+    assert goes._get_chianti_table(goes.FILE_TEMP_COR, "ratioGOES15",
+                                   invert=True)[2] is spline
+    # ...unless the file has changed since.
+    table.write("# comment\nlog10temp_MK;ratioGOES15\n"
+                "0.0;0.02\n0.5;0.05\n1.0;0.2\n1.5;0.4\n")
+    table.setmtime(table.mtime() + 10)
+    modeltemp, modelratio, spline = goes._get_chianti_table(
+        goes.FILE_TEMP_COR, "ratioGOES15", invert=True)
+    assert modelratio[0] == 0.02
+
+    rad_loss = tmpdir.join(goes.FILE_RAD_COR)
+    rad_loss.write("header\n" * 7 + "1e4 1e-22\n1e5 2e-22\n1e6 3e-22\n1e7 4e-22\n")
+    modeltemp, model_loss_rate, spline = goes._get_chianti_table(goes.FILE_RAD_COR)
+    assert_array_equal(modeltemp, [1e4, 1e5, 1e6, 1e7])
+    assert_array_equal(model_loss_rate, [1e-22, 2e-22, 3e-22, 4e-22])
+
 @pytest.mark.online
 def test_calculate_radiative_loss_rate():
     # Define input variables.
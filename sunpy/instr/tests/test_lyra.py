@@ -2,6 +2,8 @@ from __future__ import absolute_import, division
 
 import tempfile
 import os.path
+import shutil
+import sqlite3
 import pytest
 import datetime
 
@@ -18,6 +20,13 @@ from sunpy.extern.six.moves import range
 # Define location for test LYTAF database files
 TEST_DATA_PATH = rootdir
 
+
+@pytest.fixture(autouse=True)
+def lytaf_store(tmpdir, monkeypatch):
+    """Keep the LYTAF store made by the tests in a temporary directory."""
+    monkeypatch.setattr(lyra, "LYTAF_STORE_DIR", str(tmpdir))
+    monkeypatch.setattr(lyra, "_lytaf_table_cache", {})
+
 # Define some test data for test_remove_lytaf_events()
 TIME = np.array([datetime.datetime(2013, 2, 1) + datetime.timedelta(minutes=i)
                  for i in range(120)])
@@ -379,3 +388,134 @@ def test_prep_columns():
     with pytest.raises(ValueError):
         string_time_test = lyra._prep_columns(time_input,
                                           filecolumns=filecolumns_input)
+
+
+def test_lytaf_event_mask():
+    """Test _lytaf_event_mask() against comparing every time with every event."""
+    np.random.seed(0)
+    time = pandas.date_range("2013-02-01", periods=10000, freq="50ms")
+    begin = np.random.randint(0, len(time), 50)
+    end = np.minimum(begin + np.random.randint(0, 500, 50), len(time) - 1)
+    begin_time = time[begin].to_pydatetime()
+    end_time = time[end].to_pydatetime()
+    expected = np.zeros(len(time), dtype=bool)
+    for b, e in zip(begin_time, end_time):
+        expected |= (time >= b) & (time <= e)
+    np.testing.assert_array_equal(
+        lyra._lytaf_event_mask(time, begin_time, end_time), expected)
+    # Unsorted times give the same result for each time
+    order = np.random.permutation(len(time))
+    np.testing.assert_array_equal(
+        lyra._lytaf_event_mask(time[order], begin_time, end_time),
+        expected[order])
+    assert not lyra._lytaf_event_mask(time, [], []).any()
+
+
+def test_remove_lytaf_events_from_local_lightcurve():
+    """Test removing artifacts from a LYRALightCurve created from data."""
+    lyralc = lightcurve.LYRALightCurve(
+        pandas.DataFrame(index=TIME, data={"CHANNEL1": CHANNELS[0],
+                                           "CHANNEL2": CHANNELS[1]}),
+        {"instrume": "LYRA"})
+    lyralc_test = lyra.remove_lytaf_events_from_lightcurve(
+        lyralc, artifacts=["LAR", "UV occ."], lytaf_path=TEST_DATA_PATH,
+        force_use_local_lytaf=True)
+    time, channels = lyra._remove_lytaf_events(
+        TIME, channels=CHANNELS, artifacts=["LAR", "UV occ."],
+        lytaf_path=TEST_DATA_PATH, force_use_local_lytaf=True)
+    np.testing.assert_array_equal(lyralc_test.data.index.to_pydatetime(), time)
+    np.testing.assert_array_equal(lyralc_test.data["CHANNEL1"], channels[0])
+    np.testing.assert_array_equal(lyralc_test.data["CHANNEL2"], channels[1])
+    assert lyralc_test.meta == lyralc.meta
+    assert len(lyralc.data) == len(TIME)
+
+
+def test_lytaf_store_update(tmpdir):
+    """Test that new events in the LYTAF databases are added to the store."""
+    lytaf_path = str(tmpdir.join("lytaf"))
+    shutil.copytree(TEST_DATA_PATH, lytaf_path)
+    lytaf_expected = lyra.get_lytaf_events("2008-01-01", "2014-01-01",
+                                           lytaf_path=lytaf_path,
+                                           force_use_local_lytaf=True)
+    # Add a new event to one of the databases.
+    dbpath = os.path.join(lytaf_path, "annotation_ppt.db")
+    connection = sqlite3.connect(dbpath)
+    with connection:
+        connection.execute("insert into event values "
+                            "(1371470000, 1359677300, 1359677310, 1359677320, 1)")
+    connection.close()
+    os.utime(dbpath, (1371470000, 1371470000))
+    lytaf_test = lyra.get_lytaf_events("2008-01-01", "2014-01-01",
+                                       lytaf_path=lytaf_path,
+                                       force_use_local_lytaf=True)
+    assert len(lytaf_test) == len(lytaf_expected) + 1
+    assert lytaf_test["begin_time"][1] == \
+        datetime.datetime.utcfromtimestamp(1359677300)
+    assert lytaf_test["event_type"][1] == "LAR"
+    np.testing.assert_array_equal(np.delete(lytaf_test, 1), lytaf_expected)
+
+    # Events can be selected by type
+    lytaf_lar = lyra.get_lytaf_events("2008-01-01", "2014-01-01",
+                                      lytaf_path=lytaf_path,
+                                      force_use_local_lytaf=True,
+                                      event_types=["LAR"])
+    np.testing.assert_array_equal(lytaf_lar,
+                                  lytaf_test[lytaf_test["event_type"] == "LAR"])
+    np.testing.assert_array_equal(
+        lyra.get_lytaf_events("2008-01-01", "2014-01-01",
+                              lytaf_path=lytaf_path, force_use_local_lytaf=True,
+                              event_types="LAR"),
+        lytaf_lar)
+    assert "LAR" in lyra.get_lytaf_event_types(lytaf_path=lytaf_path,
+                                               print_event_types=False)
+
+
+def test_lytaf_store_location(tmpdir, monkeypatch):
+    """Test that the store is kept with the databases, or in memory if it
+    can't be written."""
+    lytaf_path = str(tmpdir.join("lytaf"))
+    shutil.copytree(TEST_DATA_PATH, lytaf_path)
+    monkeypatch.setattr(lyra, "LYTAF_STORE_DIR", None)
+    lytaf_expected = lyra.get_lytaf_events("2008-01-01", "2014-01-01",
+                                           lytaf_path=lytaf_path,
+                                           force_use_local_lytaf=True)
+    assert os.path.isfile(os.path.join(lytaf_path, lyra.LYTAF_STORE_NAME))
+
+    monkeypatch.setattr(lyra, "LYTAF_STORE_DIR", str(tmpdir.join("missing")))
+    lyra._lytaf_table_cache.clear()
+    lytaf_test = lyra.get_lytaf_events("2008-01-01", "2014-01-01",
+                                       lytaf_path=lytaf_path,
+                                       force_use_local_lytaf=True)
+    np.testing.assert_array_equal(lytaf_test, lytaf_expected)
+    assert not os.path.exists(str(tmpdir.join("missing")))
+
+
+def test_lytaf_events_kept_in_memory(tmpdir, monkeypatch):
+    """Test that the events are only read from the store again once a
+    database has changed."""
+    lytaf_path = str(tmpdir.join("lytaf"))
+    shutil.copytree(TEST_DATA_PATH, lytaf_path)
+    lytaf_expected = lyra.get_lytaf_events("2008-01-01", "2014-01-01",
+                                           lytaf_path=lytaf_path,
+                                           force_use_local_lytaf=True)
+    connect = lyra._connect_lytaf_store
+    connections = []
+
+    def counting_connect(path):
+        connections.append(path)
+        return connect(path)
+    monkeypatch.setattr(lyra, "_connect_lytaf_store", counting_connect)
+    lytaf_test = lyra.get_lytaf_events("2008-01-01", "2014-01-01",
+                                       lytaf_path=lytaf_path,
+                                       force_use_local_lytaf=True)
+    np.testing.assert_array_equal(lytaf_test, lytaf_expected)
+    lyra.get_lytaf_event_types(lytaf_path=lytaf_path, print_event_types=False)
+    assert connections == []
+
+    os.utime(os.path.join(lytaf_path, "annotation_ppt.db"),
+             (1371470000, 1371470000))
+    lytaf_test = lyra.get_lytaf_events("2008-01-01", "2014-01-01",
+                                       lytaf_path=lytaf_path,
+                                       force_use_local_lytaf=True)
+    np.testing.assert_array_equal(lytaf_test, lytaf_expected)
+    assert connections == [lytaf_path]
@@ -0,0 +1,81 @@
+"""
+Unit tests for `sunpy.instr.rhessi`
+"""
+from __future__ import absolute_import, division
+
+import os.path
+import datetime
+
+import numpy as np
+import pytest
+
+import astropy.units as u
+
+import sunpy.data.test
+from sunpy.instr import rhessi
+
+CALIBRATED_EVENT_LIST = os.path.join(
+    sunpy.data.test.rootdir, "hsi_calib_ev_20020220_1106_20020220_1106_25_40.fits")
+OBSSUMM_FILE = os.path.join(sunpy.data.test.rootdir,
+                            "hsi_obssumm_20120601_018_truncated.fits.gz")
+
+
+def outer_backproject(events, detector, image_dim):
+    """Back project with one (pixels x events) phase matrix."""
+    roll_angle, modamp, phase_map_center, grid_transmission, count = events
+    grid_angle = np.pi/2. - rhessi.grid_orientation[detector - 1]
+    npix = image_dim[0] * image_dim[1]
+    tempa = (np.arange(npix) % image_dim[0]) - (image_dim[0] - 1)/2.
+    tempb = tempa.reshape(image_dim).transpose().reshape(npix)
+    phase_pixel = (2*np.pi/rhessi.grid_pitch[detector - 1]) * (
+        np.outer(tempa, np.cos(roll_angle - grid_angle)) -
+        np.outer(tempb, np.sin(roll_angle - grid_angle))) + phase_map_center
+    probability_of_transmission = (modamp * grid_transmission * np.cos(phase_pixel) +
+                                   grid_transmission)
+    return np.inner(probability_of_transmission, count).reshape(image_dim)
+
+
+@pytest.mark.parametrize("detector", [1, 5, 8])
+def test_backproject(detector):
+    from astropy.io import fits
+    with fits.open(CALIBRATED_EVENT_LIST) as afits:
+        events = rhessi._read_detector_events(afits, detector)
+    expected = outer_backproject(events, detector, (32, 32))
+    image = rhessi._backproject(CALIBRATED_EVENT_LIST, detector=detector,
+                                image_dim=(32, 32))
+    np.testing.assert_allclose(image, expected, rtol=1e-10)
+
+    # The result does not depend on how the events are split up
+    chunked = rhessi._backproject_events(events, detector=detector,
+                                         image_dim=(32, 32), chunk_size=50)
+    np.testing.assert_allclose(chunked, expected, rtol=1e-10)
+
+
+def test_backprojection():
+    result = rhessi.backprojection(CALIBRATED_EVENT_LIST, image_dim=(32, 32) * u.pix)
+    expected = sum(rhessi._backproject(CALIBRATED_EVENT_LIST, detector=detector,
+                                       image_dim=(32, 32))
+                   for detector in range(1, 9))
+    np.testing.assert_allclose(result.data, expected)
+    assert result.data.shape == (32, 32)
+
+
+def test_uncompress_countrate():
+    # Each group of 16 compressed values continues on from the previous
+    # group in steps of twice the size.
+    expected = []
+    for i in range(16):
+        start = expected[-1] + 2 ** (i - 1) if expected else 0
+        expected.extend(start + 2 ** i * np.arange(16))
+    compressed = np.arange(256, dtype=np.uint8)
+    np.testing.assert_array_equal(rhessi.uncompress_countrate(compressed), expected)
+    np.testing.assert_array_equal(rhessi.uncompress_countrate(compressed.reshape(16, 16)),
+                                  np.reshape(expected, (16, 16)))
+
+
+def test_parse_obssumm_file():
+    header, data = rhessi.parse_obssumm_file(OBSSUMM_FILE)
+    assert data['data'].shape == (len(data['time']), 9)
+    assert len(data['labels']) == 9
+    assert data['time'][0] == datetime.datetime(2012, 6, 1)
+    assert (np.diff(data['time']) == datetime.timedelta(seconds=4)).all()
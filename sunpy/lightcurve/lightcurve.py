@@ -17,6 +17,8 @@ import pandas
 from sunpy import config
 from sunpy.time import is_time, TimeRange, parse_time
 from sunpy.util.cond_dispatch import ConditionalDispatch, run_cls
+from sunpy.timeseries.decimation import plot_decimated
+from sunpy.timeseries.windowing import window_times, time_range_bounds, iter_windows
 from sunpy.extern.six.moves import urllib
 from sunpy.extern import six
 
@@ -209,7 +211,7 @@ for compatibility with map, please use meta instead""", Warning)
 
         return cls(dataframe, meta)
 
-    def plot(self, axes=None, **plot_args):
+    def plot(self, axes=None, decimate=False, decimate_method='minmax', **plot_args):
         """Plot a plot of the light curve
 
         Parameters
@@ -218,6 +220,15 @@ for compatibility with map, please use meta instead""", Warning)
             If provided the image will be plotted on the given axes. Otherwise
             the current axes will be used.
 
+        decimate : `bool` or `int`
+            Whether to decimate the data to the width of the axes (True), or
+            a number of bins, before plotting, see
+            `~sunpy.timeseries.decimation.plot_decimated`. Default is False.
+
+        decimate_method : `str`
+            The method used to decimate, one of ``'minmax'``, ``'lttb'`` or
+            ``'mean'``, see `sunpy.timeseries.decimation.decimate_dataframe`.
+
         **plot_args : `dict`
             Any additional plot arguments that should be used
             when plotting.
@@ -232,7 +243,8 @@ for compatibility with map, please use meta instead""", Warning)
         if axes is None:
             axes = plt.gca()
 
-        axes = self.data.plot(ax=axes, **plot_args)
+        axes = plot_decimated(self.data, axes, decimate, decimate_method,
+                              **plot_args)
 
         return axes
 
@@ -360,6 +372,40 @@ for compatibility with map, please use meta instead""", Warning)
         truncated = self.data.truncate(time_range.start, time_range.end)
         return self.__class__.create(truncated, self.meta.copy())
 
+    def windows(self, time_ranges):
+        """Returns an iterator over the parts of the lightcurve in each of the
+        given time ranges, such as those from `sunpy.time.TimeRange.window`.
+        The data of each window is a view of this lightcurve's data, see
+        `sunpy.timeseries.windowing.iter_windows`.
+
+        Parameters
+        ----------
+        time_ranges : `list` of `~sunpy.time.TimeRange`
+            The time ranges of the windows, inclusive of both ends.
+
+        Returns
+        -------
+        windows : iterator of `~sunpy.lightcurve.LightCurve`
+            A lightcurve for each time range.
+        """
+        return iter_windows(self.data, *time_range_bounds(time_ranges),
+                            make_window=self._window)
+
+    def iter_windows(self, cadence, width, start=None, end=None):
+        """Returns an iterator over windows of the lightcurve ``width`` long,
+        starting every ``cadence``, from ``start`` until a window reaches
+        ``end`` (by default the start and end of the data), in the same way
+        as `windows`. ``cadence`` and ``width`` are
+        `~astropy.units.Quantity` or `datetime.timedelta`.
+        """
+        start = self.data.index.min() if start is None else start
+        end = self.data.index.max() if end is None else end
+        return iter_windows(self.data, *window_times(start, end, cadence, width),
+                            make_window=self._window)
+
+    def _window(self, window_data):
+        return self.__class__(window_data, self.meta.copy())
+
     def extract(self, column_name):
         """Returns a new lightcurve with the chosen column.
 
@@ -15,6 +15,7 @@ import datetime
 
 import sunpy
 import sunpy.lightcurve
+import astropy.units as u
 from sunpy.data.test import get_test_filepath
 
 EVE_AVERAGES_CSV = get_test_filepath("EVE_He_II_304_averages.csv")
@@ -95,3 +96,19 @@ def test_concatenate_fail():
         lc1.concatenate(eve)
 
 
+
+
+def test_windows():
+    lc = sunpy.lightcurve.LightCurve.create(base_input, index=dates)
+    time_ranges = lc.time_range().window(60 * 60 * u.s, 10 * 60 * u.s)
+    windows = list(lc.windows(time_ranges))
+    assert len(windows) == len(time_ranges)
+    for tr, window in zip(time_ranges, windows):
+        truncated = lc.truncate(tr)
+        assert np.all(window.data == truncated.data)
+        assert np.all(window.data.index == truncated.data.index)
+        assert window.meta == lc.meta
+
+    windows = list(lc.iter_windows(60 * 60 * u.s, 10 * 60 * u.s))
+    # As for TimeRange.window, the last window starts after the data ends
+    assert [len(window.data) for window in windows] == [11] * 24 + [0]
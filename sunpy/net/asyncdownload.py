@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+"""
+An asyncio download engine, with the same interface as
+`~sunpy.net.download.Downloader`.
+
+All downloads run as coroutines on one event loop, in a background thread.
+HTTP connections are kept alive and reused for later downloads from the same
+host, so fetching many small files from one server does not pay for a new
+connection (and thread) per file. This module needs Python 3.5 or later.
+"""
+from __future__ import absolute_import
+
+import io
+import os
+import ssl
+import asyncio
+import logging
+import threading
+import http.client
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+
+from sunpy.net.download import Downloader, _PartWriter, _is_transient, _resume_offset
+
+__all__ = ['AsyncDownloader']
+
+# The response statuses that redirect to another URL.
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+log = logging.getLogger(__name__)
+
+
+class _Response(object):
+    """
+    The URL, status and headers of a response, passed to the ``path``
+    function of a download in place of the socket used by
+    `~sunpy.net.download.Downloader`.
+    """
+    def __init__(self, url, status, reason, headers):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+
+    def geturl(self):
+        return self.url
+
+    def getcode(self):
+        return self.status
+
+
+class _Connection(object):
+    """An open HTTP connection to one host."""
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncDownloader(Downloader):
+    """
+    Download files with asyncio, keeping a pool of open connections to each
+    host.
+
+    Downloads are queued with `download` exactly as for
+    `~sunpy.net.download.Downloader`, and the callbacks are called from the
+    thread running the event loop.
+
+    Parameters
+    ----------
+    max_conn : `int`
+        The maximum number of simultaneous downloads from one host.
+
+    max_total : `int`
+        The maximum number of simultaneous downloads in total.
+
+    chunk_size : `int`
+        The number of bytes to read from the connection at a time.
+
+    max_redirects : `int`
+        The maximum number of redirects to follow for one download.
+
+    retries, backoff
+        As for `~sunpy.net.download.Downloader`: the number of times to retry
+        a download after a transient error, and the wait before the first
+        retry in seconds. Retries continue from the end of the ``.part``
+        file.
+
+    cache : `bool`, `~sunpy.net.cache.DownloadCache` or None
+        As for `~sunpy.net.download.Downloader`: whether to use the download
+        cache, or the cache to use.
+
+    decompress : `bool`
+        As for `~sunpy.net.download.Downloader`: whether to decompress ``.gz``
+        files while they are downloaded.
+    """
+    def __init__(self, max_conn=5, max_total=20, chunk_size=65536, max_redirects=5,
+                 retries=3, backoff=1.0, cache=None, decompress=False):
+        super(AsyncDownloader, self).__init__(max_conn, max_total, retries, backoff, cache,
+                                              decompress)
+        self.buf = chunk_size
+        self.max_redirects = max_redirects
+
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        # Idle connections for each (scheme, host, port).
+        self._pools = defaultdict(list)
+        # Created on the event loop, when first needed.
+        self._host_semaphores = {}
+        self._total_semaphore = None
+        self._running = set()
+
+    @property
+    def chunk_size(self):
+        return self.buf
+
+    def _get_loop(self):
+        """Return the event loop, starting it in a new thread if needed."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever)
+                thread.daemon = True
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _attempt_download(self, url, path, callback, errback):
+        """
+        Start the download on the event loop. The connection limits are
+        enforced there, so downloads are never queued here.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._start_download(url, path, callback, errback), self._get_loop())
+        # The event loop only keeps weak references to its tasks.
+        with self.mutex:
+            self._running.add(future)
+        future.add_done_callback(self._discard_running)
+        return True
+
+    def _discard_running(self, future):
+        with self.mutex:
+            self._running.discard(future)
+        # An exception raised by the callback, or by the errback (the default
+        # one re-raises the download error), has no caller to go to.
+        if not future.cancelled() and future.exception() is not None:
+            error = future.exception()
+            log.error("Download failed: %s", error, exc_info=error)
+
+    def _semaphores(self, server):
+        host_semaphore = self._host_semaphores.get(server)
+        if host_semaphore is None:
+            host_semaphore = self._host_semaphores[server] = asyncio.Semaphore(self.max_conn)
+        if self._total_semaphore is None:
+            self._total_semaphore = asyncio.Semaphore(self.max_total)
+        return host_semaphore, self._total_semaphore
+
+    async def _start_download(self, url, path, callback, errback):
+        host_semaphore, total_semaphore = self._semaphores(self._get_server(url))
+        async with host_semaphore, total_semaphore:
+            self.conns += 1
+            try:
+                fullname = await self._fetch_with_retries(url, path)
+                callback({'path': fullname})
+            except Exception as e:
+                if errback is not None:
+                    errback(e)
+            finally:
+                self.conns -= 1
+
+    async def _fetch_with_retries(self, url, path):
+        """
+        Download ``url``, retrying after transient errors, and return the
+        name of the downloaded file.
+        """
+        state = {}
+        attempt = 0
+        while True:
+            try:
+                return await self._fetch(url, path, state)
+            except Exception as e:
+                if attempt >= self.retries or not _is_transient(e):
+                    raise
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+            attempt += 1
+
+    async def _fetch(self, url, path, state):
+        """
+        Download ``url`` to a ``.part`` file, continuing from the end of any
+        partial download, and move it into place once it is complete.
+        ``state`` keeps the name of the file between attempts.
+        """
+        for _ in range(self.max_redirects + 1):
+            if urllib.parse.urlsplit(url).scheme not in ('http', 'https'):
+                return await self._loop.run_in_executor(
+                    None, Downloader._fetch, self, url, path, state)
+
+            offset = self._offset(state)
+            key, connection, response = await self._request(url, offset)
+            location = response.headers.get('Location')
+            if response.status in REDIRECT_STATUSES and location:
+                await self._read_body(key, connection, response, None)
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if response.status == 416 and offset:
+                # The partial download already holds the whole file.
+                await self._read_body(key, connection, response, None)
+                return self._complete(url, None, state)
+            if not 200 <= response.status < 300:
+                connection.close()
+                raise urllib.error.HTTPError(url, response.status, response.reason,
+                                             response.headers, None)
+
+            if 'fullname' not in state:
+                self._set_name(state, path(response, url))
+                if self._offset(state):
+                    # Continue a download left unfinished by an earlier run.
+                    connection.close()
+                    continue
+            fullname = state['fullname']
+
+            dir_ = os.path.abspath(os.path.dirname(fullname))
+            if not os.path.exists(dir_):
+                os.makedirs(dir_)
+
+            start = _resume_offset(response)
+            if start not in (0, offset):
+                connection.close()
+                raise http.client.HTTPException(
+                    "Server resumed the download from byte {0}, not {1}".format(start, offset))
+
+            if not start and self.cache is not None and \
+                    self.cache.get(self._cache_url(url, state), response.headers, fullname):
+                connection.close()
+                return fullname
+
+            with _PartWriter(self, state, start) as writer:
+                await self._read_body(key, connection, response, writer)
+            return self._complete(url, response.headers, state)
+        raise urllib.error.HTTPError(url, response.status, "Too many redirects",
+                                     response.headers, None)
+
+    async def _connect(self, key):
+        """
+        Return an idle connection to ``key`` from the pool, or a new one.
+        The second value returned is True for a reused connection.
+        """
+        pool = self._pools[key]
+        while pool:
+            connection = pool.pop()
+            if not connection.reader.at_eof():
+                return connection, True
+            connection.close()
+        scheme, host, port = key
+        context = ssl.create_default_context() if scheme == 'https' else None
+        reader, writer = await asyncio.open_connection(host, port, ssl=context)
+        return _Connection(reader, writer), False
+
+    async def _request(self, url, offset=0):
+        """
+        Send a GET request for ``url``, from byte ``offset`` on, and read the
+        response headers.
+        """
+        parts = urllib.parse.urlsplit(url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        key = (parts.scheme, parts.hostname, port)
+        target = urllib.parse.urlunsplit(('', '', parts.path or '/', parts.query, ''))
+        host = parts.hostname if parts.port is None else '{0}:{1}'.format(parts.hostname,
+                                                                         parts.port)
+        request = ('GET {0} HTTP/1.1\r\n'
+                   'Host: {1}\r\n'
+                   'User-Agent: Python-urllib/{2}\r\n'
+                   'Accept-Encoding: identity\r\n'
+                   'Connection: keep-alive\r\n').format(target, host,
+                                                        urllib.request.__version__)
+        if offset:
+            request += 'Range: bytes={0}-\r\n'.format(offset)
+        request += '\r\n'
+
+        while True:
+            connection, reused = await self._connect(key)
+            try:
+                connection.writer.write(request.encode('latin-1'))
+                await connection.writer.drain()
+                status_line = await connection.reader.readline()
+                if not status_line:
+                    raise ConnectionResetError("Connection closed by server")
+                header_lines = []
+                while True:
+                    line = await connection.reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    header_lines.append(line)
+            except OSError:
+                connection.close()
+                # The server may have closed an idle connection; try a new one.
+                if reused:
+                    continue
+                raise
+            break
+
+        _, status, reason = (status_line.decode('latin-1').rstrip('\r\n').split(' ', 2)
+                             + [''])[:3]
+        headers = http.client.parse_headers(io.BytesIO(b''.join(header_lines) + b'\r\n'))
+        return key, connection, _Response(url, int(status), reason, headers)
+
+    async def _read_body(self, key, connection, response, fd):
+        """
+        Read the response body into the file (or `_PartWriter`) ``fd``, or
+        discard it if ``fd`` is None,
+        returning the connection to the pool if it can be used again.
+        """
+        reader = connection.reader
+        headers = response.headers
+        keep_alive = headers.get('Connection', '').lower() != 'close'
+
+        try:
+            if response.status in (204, 304):
+                pass
+            elif 'chunked' in headers.get('Transfer-Encoding', '').lower():
+                while True:
+                    size = int((await reader.readline()).split(b';', 1)[0], 16)
+                    if size == 0:
+                        # Skip any trailers.
+                        while (await reader.readline()) not in (b'\r\n', b''):
+                            pass
+                        break
+                    await self._copy(reader, size, fd)
+                    await reader.readexactly(2)
+            elif headers.get('Content-Length') is not None:
+                await self._copy(reader, int(headers['Content-Length']), fd)
+            else:
+                # The body runs until the server closes the connection.
+                await self._copy(reader, None, fd)
+                keep_alive = False
+        except Exception:
+            connection.close()
+            raise
+
+        if keep_alive:
+            self._pools[key].append(connection)
+        else:
+            connection.close()
+
+    async def _copy(self, reader, size, fd):
+        """Copy ``size`` bytes (or up to the end of the stream) from ``reader``."""
+        while size is None or size > 0:
+            rec = await reader.read(self.buf if size is None else min(self.buf, size))
+            if not rec:
+                if size is None:
+                    return
+                raise http.client.IncompleteRead(b'', size)
+            if size is not None:
+                size -= len(rec)
+            if fd is not None:
+                fd.write(rec)
+
+    def close(self):
+        """Close all idle connections and stop the event loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        def shutdown():
+            for pool in self._pools.values():
+                for connection in pool:
+                    connection.close()
+            self._pools.clear()
+            self._host_semaphores.clear()
+            self._total_semaphore = None
+            loop.stop()
+        loop.call_soon_threadsafe(shutdown)
+
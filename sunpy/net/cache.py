@@ -0,0 +1,378 @@
+"""
+Local caches of downloaded files and query results for the `sunpy.net`
+clients.
+"""
+from __future__ import absolute_import, division, print_function
+
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+
+import sunpy
+from sunpy.extern.six.moves import configparser
+
+__all__ = ['DownloadCache', 'get_download_cache', 'QueryCache', 'get_query_cache']
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def _validator(headers):
+    """
+    Return a string identifying the version of a remote file from the headers
+    of the response serving it, or None if the headers don't identify it.
+
+    The ``ETag`` (or ``Content-MD5``) is used if the server sends one,
+    otherwise the size of the file with its ``Last-Modified`` time.
+    """
+    size = headers.get('Content-Length')
+    content_range = re.match(r'bytes \d+-\d+/(\d+)', headers.get('Content-Range', ''))
+    if content_range is not None:
+        size = content_range.group(1)
+    if size is None:
+        return None
+    for name in ('ETag', 'Content-MD5'):
+        if headers.get(name):
+            return '{0}: {1}; size: {2}'.format(name, headers[name], size)
+    return 'size: {0}; Last-Modified: {1}'.format(size, headers.get('Last-Modified'))
+
+
+def _link_or_copy(source, destination):
+    """Hard link ``source`` to ``destination``, or copy it if it can't be linked."""
+    dir_ = os.path.abspath(os.path.dirname(destination))
+    if not os.path.exists(dir_):
+        os.makedirs(dir_)
+    if os.path.exists(destination):
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except (OSError, AttributeError):
+        # Different file systems, or no hard links on this platform.
+        shutil.copyfile(source, destination)
+
+
+class DownloadCache(object):
+    """
+    A cache of downloaded files, keyed on their URL and the size and ETag (or
+    checksum, or modification time) the server reports for them.
+
+    The files are stored under names derived from the key, and described in
+    a JSON manifest in the same directory. Files are added to the cache by
+    hard linking them where possible, so a cached file takes no extra space
+    while the downloaded copy exists. When the cache grows past ``max_size``
+    bytes the least recently used files are removed.
+
+    Parameters
+    ----------
+    directory : `str`
+        The directory to store the cache in, created if needed.
+
+    max_size : `int`
+        The maximum total size of the cache in bytes.
+    """
+
+    def __init__(self, directory, max_size):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    @property
+    def _manifest_path(self):
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    def _read_manifest(self):
+        try:
+            with open(self._manifest_path) as fp:
+                return json.load(fp)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        # Write to a temporary file first so readers never see a partial manifest.
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        with os.fdopen(fd, 'w') as fp:
+            json.dump(manifest, fp, indent=1, sort_keys=True)
+        if os.path.exists(self._manifest_path):
+            os.remove(self._manifest_path)
+        os.rename(temp_path, self._manifest_path)
+
+    @staticmethod
+    def _entry_name(url, validator):
+        key = '{0}\n{1}'.format(url, validator)
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def get(self, url, headers, destination):
+        """
+        Hard link (or copy) the cached file for ``url`` to ``destination``, if
+        the cache has the version described by the response ``headers``.
+
+        Returns
+        -------
+        hit : `bool`
+            True if the file was in the cache.
+        """
+        validator = _validator(headers)
+        if validator is None:
+            return False
+        name = self._entry_name(url, validator)
+        entry_path = os.path.join(self.directory, name)
+        with self._lock:
+            manifest = self._read_manifest()
+            entry = manifest.get(name)
+            if entry is None:
+                return False
+            try:
+                if os.path.getsize(entry_path) != entry['size']:
+                    raise OSError("Cached file has changed")
+                _link_or_copy(entry_path, destination)
+            except (IOError, OSError):
+                self._remove(manifest, name)
+                self._write_manifest(manifest)
+                return False
+            entry['last_used'] = time.time()
+            self._write_manifest(manifest)
+        return True
+
+    def put(self, url, headers, path):
+        """
+        Add the file at ``path``, downloaded from ``url`` with the response
+        ``headers``, to the cache.
+
+        Returns
+        -------
+        stored : `bool`
+            True if the file was stored; files the server doesn't identify
+            the version of are not.
+        """
+        validator = _validator(headers)
+        if validator is None:
+            return False
+        name = self._entry_name(url, validator)
+        with self._lock:
+            manifest = self._read_manifest()
+            try:
+                _link_or_copy(path, os.path.join(self.directory, name))
+            except (IOError, OSError):
+                return False
+            manifest[name] = {'url': url,
+                              'validator': validator,
+                              'filename': os.path.basename(path),
+                              'size': os.path.getsize(path),
+                              'last_used': time.time()}
+            self._evict(manifest)
+            self._write_manifest(manifest)
+        return True
+
+    def _remove(self, manifest, name):
+        del manifest[name]
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
+
+    def _evict(self, manifest):
+        """Remove the least recently used files until under ``max_size``."""
+        total = sum(entry['size'] for entry in manifest.values())
+        for name in sorted(manifest, key=lambda name: manifest[name]['last_used']):
+            if total <= self.max_size:
+                break
+            total -= manifest[name]['size']
+            self._remove(manifest, name)
+
+    @property
+    def size(self):
+        """The total size of the cache in bytes."""
+        with self._lock:
+            return sum(entry['size'] for entry in self._read_manifest().values())
+
+    def clear(self):
+        """Remove every file from the cache."""
+        with self._lock:
+            manifest = self._read_manifest()
+            for name in list(manifest):
+                self._remove(manifest, name)
+            self._write_manifest(manifest)
+
+
+_download_cache = None
+
+
+def get_download_cache(cache=None):
+    """
+    Return the `DownloadCache` to use, or None if downloads are not cached.
+
+    Parameters
+    ----------
+    cache : `bool`, `DownloadCache` or None
+        Whether to use the cache set up in the ``[downloads]`` section of the
+        sunpyrc, or the cache to use. If None the ``cache`` option in that
+        section decides, and downloads are not cached if it is missing.
+    """
+    global _download_cache
+    if isinstance(cache, DownloadCache):
+        return cache
+    if cache is None:
+        try:
+            cache = sunpy.config.getboolean('downloads', 'cache')
+        except (configparser.NoSectionError, configparser.NoOptionError):
+            cache = False
+    if not cache:
+        return None
+
+    directory = sunpy.config.get('downloads', 'cache_dir')
+    max_size = int(float(sunpy.config.get('downloads', 'cache_size')) * 1024**2)
+    if (_download_cache is None or
+            _download_cache.directory != os.path.abspath(directory)):
+        _download_cache = DownloadCache(directory, max_size)
+    _download_cache.max_size = max_size
+    return _download_cache
+
+
+class QueryCache(object):
+    """
+    An on-disk cache of query results, which expire ``ttl`` seconds after
+    they are stored.
+
+    Queries are keyed on the client, the service URL and the normalized form
+    of the query (the output of the attr walker), so the same query written
+    in a different order is a hit. Each result is stored as JSON in its own
+    file. The number of hits and misses is counted in ``hits`` and
+    ``misses``.
+
+    Parameters
+    ----------
+    directory : `str`
+        The directory to store the cache in, created if needed.
+
+    ttl : `float`
+        The number of seconds a result is kept for.
+    """
+
+    def __init__(self, directory, ttl):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts):
+        """Return the key for a query from JSON serializable ``parts``."""
+        normalized = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    def get(self, key):
+        """
+        Return the result stored for ``key``, or None if there isn't one that
+        has not expired.
+        """
+        try:
+            with open(self._entry_path(key)) as fp:
+                entry = json.load(fp)
+            fresh = time.time() - entry['time'] <= self.ttl
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            fresh = False
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry['result'] if fresh else None
+
+    def put(self, key, result):
+        """
+        Store the JSON serializable ``result`` for ``key``.
+
+        Returns
+        -------
+        stored : `bool`
+            True if the result was stored.
+        """
+        try:
+            data = json.dumps({'time': time.time(), 'result': result})
+        except (TypeError, ValueError):
+            return False
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        self._remove_expired()
+
+        # Write to a temporary file first so readers never see a partial entry.
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                fp.write(data)
+            if os.path.exists(self._entry_path(key)):
+                os.remove(self._entry_path(key))
+            os.rename(temp_path, self._entry_path(key))
+        except (IOError, OSError):
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+        return True
+
+    def _remove_expired(self):
+        """Remove the entries stored more than ``ttl`` seconds ago."""
+        oldest = time.time() - self.ttl
+        for name in os.listdir(self.directory):
+            entry_path = os.path.join(self.directory, name)
+            try:
+                if name.endswith('.json') and os.path.getmtime(entry_path) < oldest:
+                    os.remove(entry_path)
+            except OSError:
+                continue
+
+    @property
+    def stats(self):
+        """The number of hits and misses, and the hit rate, as a `dict`."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses,
+                    'hit_rate': self.hits / total if total else 0.0}
+
+    def clear(self):
+        """Remove every result from the cache, and reset the statistics."""
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.directory, name))
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+_query_cache = None
+
+
+def get_query_cache(cache=None):
+    """
+    Return the `QueryCache` to use, or None if query results are not cached.
+
+    Parameters
+    ----------
+    cache : `bool`, `QueryCache` or None
+        Whether to use the cache set up in the ``[net]`` section of the
+        sunpyrc, or the cache to use. If None the ``query_cache`` option in
+        that section decides.
+    """
+    global _query_cache
+    if isinstance(cache, QueryCache):
+        return cache
+    if cache is None:
+        cache = sunpy.config.getboolean('net', 'query_cache')
+    if not cache:
+        return None
+
+    directory = sunpy.config.get('net', 'query_cache_dir')
+    ttl = float(sunpy.config.get('net', 'query_cache_ttl'))
+    if _query_cache is None or _query_cache.directory != os.path.abspath(directory):
+        _query_cache = QueryCache(directory, ttl)
+    _query_cache.ttl = ttl
+    return _query_cache
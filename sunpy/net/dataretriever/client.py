@@ -258,6 +258,10 @@ class GenericClient(object):
         qres : `~sunpy.net.dataretriever.QueryResponse`
             Results to download.
 
+        error_callback : function
+            Called with the exception for each download that fails. The
+            exceptions are also kept in ``Results.errors``.
+
         Returns
         -------
         Results Object
@@ -293,15 +297,20 @@ class GenericClient(object):
 
             paths.append(fname)
 
-        res = Results(lambda x: None, 0, lambda map_: self._link(map_))
-
         dobj = Downloader(max_conn=len(urls), max_total=len(urls))
+        res = Results(lambda x: None, 0, lambda map_: self._link(map_), dobj)
 
         # We cast to list here in list(zip... to force execution of 
         # res.require([x]) at the start of the loop.
+        def errback(exception):
+            # Failed downloads are recorded in the Results, so it still completes.
+            if error_callback is not None:
+                error_callback(exception)
+            res.add_error(exception)
+
         for aurl, ncall, fname in list(zip(urls, map(lambda x: res.require([x]),
                                               urls), paths)):
-            dobj.download(aurl, fname, ncall, error_callback)
+            dobj.download(aurl, fname, ncall, errback)
 
         return res
 
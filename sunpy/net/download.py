@@ -9,6 +9,8 @@ from __future__ import absolute_import
 
 import os
 import re
+import time
+import zlib
 import threading
 
 from functools import partial
@@ -16,23 +18,138 @@ from contextlib import closing
 from collections import defaultdict, deque
 
 from sunpy.extern import six
-from sunpy.extern.six.moves import urllib
+from sunpy.extern.six.moves import urllib, http_client
 from sunpy.extern.six import iteritems
 
 import sunpy
+from sunpy.net.cache import get_download_cache
 from sunpy.util.progressbar import TTYProgressBar as ProgressBar
 
 
+# The HTTP error codes that are worth retrying a download for.
+TRANSIENT_HTTP_ERRORS = (408, 429, 500, 502, 503, 504)
+
+
 def default_name(path, sock, url):
     name = sock.headers.get('Content-Disposition', url.rsplit('/', 1)[-1])
     return os.path.join(path, name)
 
 
+def _is_transient(error):
+    """Return True if a download that failed with ``error`` may succeed if retried."""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in TRANSIENT_HTTP_ERRORS
+    return isinstance(error, (urllib.error.URLError, http_client.HTTPException,
+                              IOError, OSError))
+
+
+def _part_size(fullname):
+    """Return the size of the partial download of ``fullname``, or 0."""
+    try:
+        return os.path.getsize(fullname + '.part')
+    except OSError:
+        return 0
+
+
+def _finish_part(fullname):
+    """Move a completed partial download into place, returning its name."""
+    if os.path.exists(fullname):
+        os.remove(fullname)
+    os.rename(fullname + '.part', fullname)
+    return fullname
+
+
+def _resume_offset(sock):
+    """Return the offset a (partial content) response starts at."""
+    if sock.getcode() != 206:
+        return 0
+    match = re.match(r'bytes (\d+)-', sock.headers.get('Content-Range', ''))
+    if match is None:
+        raise http_client.HTTPException("Invalid Content-Range header in partial response")
+    return int(match.group(1))
+
+
+class _PartWriter(object):
+    """
+    Writes the body of a download to its ``.part`` file, counting the bytes
+    received and written. For a download being decompressed the gzip data
+    is decompressed as it arrives, with a decompressor kept in the download
+    ``state`` so a retry can continue the stream.
+    """
+    def __init__(self, downloader, state, start):
+        self.downloader = downloader
+        self.state = state
+        self.received = 0
+        if state.get('gunzip') and not start:
+            state['decompressor'] = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            state['received'] = 0
+        self.fd = open(state['fullname'] + '.part', 'ab' if start else 'wb')
+
+    def write(self, data):
+        received = len(data)
+        self.received += received
+        decompressor = self.state.get('decompressor')
+        if decompressor is not None:
+            self.state['received'] += received
+            chunks = []
+            while data:
+                chunks.append(decompressor.decompress(data))
+                data = decompressor.unused_data
+                if data:
+                    # The next member of a multi-member gzip file.
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    self.state['decompressor'] = decompressor
+            data = b''.join(chunks)
+        self.fd.write(data)
+        self.downloader._count(received, len(data))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.fd.close()
+
+
 class Downloader(object):
-    def __init__(self, max_conn=5, max_total=20):
+    """
+    Download files in background threads, with at most ``max_conn``
+    simultaneous downloads from one server and ``max_total`` in total.
+
+    Each file is written to ``<name>.part`` and renamed once complete. A
+    download that fails with a network error, or a server error, is retried
+    up to ``retries`` times, waiting ``backoff`` seconds before the first
+    retry and twice as long before each one after that. Retries (and new
+    downloads of a file that left a ``.part`` file behind) continue from the
+    end of the partial file with a HTTP ``Range`` request, where the server
+    supports it.
+
+    If ``cache`` is True, or a `~sunpy.net.cache.DownloadCache`, a file the
+    cache already holds the current version of is linked from the cache
+    instead of being downloaded, and downloaded files are added to it. By
+    default the ``[downloads]`` section of the sunpyrc decides.
+
+    If ``decompress`` is True, files whose names end in ``.gz`` are
+    decompressed as they are downloaded and saved without the ``.gz``, so
+    ``file.fts.gz`` becomes a plain ``file.fts``. A retry continues the
+    download (and the decompression) where it stopped, but a ``.part`` file
+    left by an earlier run is downloaded again from the start.
+
+    The total number of bytes received from the servers, and written to
+    disk after any decompression, are counted in ``received`` and
+    ``written``, and shown by `Results.wait` for the results given this
+    downloader.
+    """
+    def __init__(self, max_conn=5, max_total=20, retries=3, backoff=1.0, cache=None,
+                 decompress=False):
         self.max_conn = max_conn
         self.max_total = max_total
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = get_download_cache(cache)
+        self.decompress = decompress
         self.conns = 0
+        self.received = 0
+        self.written = 0
 
         self.connections = defaultdict(int)  # int() -> 0
         self.q = defaultdict(deque)
@@ -43,33 +160,133 @@ class Downloader(object):
         self.mutex = threading.Lock()
 
     def _start_download(self, url, path, callback, errback):
-        try:
-            server = self._get_server(url)
+        server = self._get_server(url)
+        with self.mutex:
+            self.connections[server] += 1
+            self.conns += 1
 
+        try:
+            fullname = self._fetch_with_retries(url, path)
             with self.mutex:
-                self.connections[server] += 1
-                self.conns += 1
-
-            with closing(urllib.request.urlopen(url)) as sock:
-                fullname = path(sock, url)
-                dir_ = os.path.abspath(os.path.dirname(fullname))
-                if not os.path.exists(dir_):
-                    os.makedirs(dir_)
-
-                with open(fullname, 'wb') as fd:
-                    while True:
-                        rec = sock.read(self.buf)
-                        if not rec:
-                            with self.mutex:
-                                self._close(callback, [{'path': fullname}], server)
-                            break
-                        else:
-                            fd.write(rec)
+                self._close(callback, [{'path': fullname}], server)
         except Exception as e:
-            # TODO: Fix the silent failing
-            if errback is not None:
-                with self.mutex:
-                    self._close(errback, [e], server)
+            with self.mutex:
+                self._close(errback or self._default_callback, [e], server)
+
+    def _fetch_with_retries(self, url, path):
+        """
+        Download ``url``, retrying after transient errors, and return the
+        name of the downloaded file.
+        """
+        state = {}
+        attempt = 0
+        while True:
+            try:
+                return self._fetch(url, path, state)
+            except Exception as e:
+                if attempt >= self.retries or not _is_transient(e):
+                    raise
+            time.sleep(self.backoff * 2 ** attempt)
+            attempt += 1
+
+    def _fetch(self, url, path, state):
+        """
+        Download ``url`` to a ``.part`` file, continuing from the end of any
+        partial download, and move it into place once it is complete.
+        ``state`` keeps the name of the file between attempts.
+        """
+        offset = self._offset(state)
+        request = urllib.request.Request(url)
+        if offset:
+            request.add_header('Range', 'bytes={0}-'.format(offset))
+        try:
+            sock = urllib.request.urlopen(request)
+        except urllib.error.HTTPError as e:
+            # The partial download already holds the whole file.
+            if e.code == 416 and offset:
+                return self._complete(url, None, state)
+            raise
+
+        with closing(sock):
+            if 'fullname' not in state:
+                self._set_name(state, path(sock, url))
+                if self._offset(state):
+                    # Continue a download left unfinished by an earlier run.
+                    return self._fetch(url, path, state)
+            fullname = state['fullname']
+
+            dir_ = os.path.abspath(os.path.dirname(fullname))
+            if not os.path.exists(dir_):
+                os.makedirs(dir_)
+
+            start = _resume_offset(sock)
+            if start not in (0, offset):
+                raise http_client.HTTPException(
+                    "Server resumed the download from byte {0}, not {1}".format(start, offset))
+            if not start and self.cache is not None and \
+                    self.cache.get(self._cache_url(url, state), sock.headers, fullname):
+                return fullname
+            length = sock.headers.get('Content-Length')
+
+            with _PartWriter(self, state, start) as writer:
+                while True:
+                    rec = sock.read(self.buf)
+                    if not rec:
+                        break
+                    writer.write(rec)
+
+        if length is not None and writer.received < int(length):
+            raise http_client.IncompleteRead(b'', int(length) - writer.received)
+        return self._complete(url, sock.headers, state)
+
+    def _set_name(self, state, name):
+        """
+        Record the name to save a download to in its ``state``, without the
+        ``.gz`` for a file to decompress.
+        """
+        if self.decompress and name.lower().endswith('.gz'):
+            state['fullname'] = name[:-len('.gz')]
+            state['gunzip'] = True
+        else:
+            state['fullname'] = name
+
+    def _offset(self, state):
+        """Return the offset in the remote file to continue a download from."""
+        if state.get('gunzip'):
+            # Only a download decompressed in this run can be continued.
+            return state['received'] if 'decompressor' in state else 0
+        return _part_size(state['fullname']) if 'fullname' in state else 0
+
+    def _cache_url(self, url, state):
+        """The URL to look a download up in the cache under."""
+        # Decompressed files are cached apart from the files as served.
+        return url + '#gunzip' if state.get('gunzip') else url
+
+    def _complete(self, url, headers, state):
+        """
+        Move a completed download into place, add it to the cache if the
+        response ``headers`` are given, and return its name.
+        """
+        fullname = state['fullname']
+        decompressor = state.pop('decompressor', None)
+        if decompressor is not None:
+            rest = decompressor.flush()
+            with open(fullname + '.part', 'ab') as fd:
+                fd.write(rest)
+            self._count(0, len(rest))
+            # Python 2 can't tell if the gzip stream ended.
+            if not getattr(decompressor, 'eof', True):
+                raise zlib.error("{0} is not a complete gzip file".format(url))
+        _finish_part(fullname)
+        if self.cache is not None and headers is not None:
+            self.cache.put(self._cache_url(url, state), headers, fullname)
+        return fullname
+
+    def _count(self, received, written):
+        """Add to the counts of bytes received and written."""
+        with self.mutex:
+            self.received += received
+            self.written += written
 
     def _attempt_download(self, url, path, callback, errback):
         """ Attempt download. If max. connection limit reached, queue for download later.
@@ -167,7 +384,9 @@ class Downloader(object):
         self.conns -= 1
 
         if self.q[server]:
-            self._attempt_download(*self.q[server].pop())
+            # Only take the download off the queue once it has started.
+            if self._attempt_download(*self.q[server][-1]):
+                self.q[server].pop()
         else:
             for k, v in iteritems(self.q):  # pylint: disable=W0612
                 while v:
@@ -183,8 +402,12 @@ class Downloader(object):
 class Results(object):
     """ Returned by VSOClient.get. Use .wait to wait
     for completion of download.
+
+    If the `Downloader` doing the downloads is given, the bytes it has
+    received and written since the results were created are shown below
+    the progress bar when they are complete.
     """
-    def __init__(self, callback, n=0, done=None):
+    def __init__(self, callback, n=0, done=None, downloader=None):
         self.callback = callback
         self.n = self.total = n
         self.map_ = {}
@@ -194,6 +417,20 @@ class Results(object):
         self.lock = threading.RLock()
 
         self.progress = None
+        self.downloader = downloader
+        if downloader is not None:
+            self._start_counts = (downloader.received, downloader.written)
+
+    def transferred(self):
+        """
+        Return the number of bytes received from the servers, and written to
+        disk after any decompression, by the downloader since the results
+        were created, or None if the downloader is not known.
+        """
+        if self.downloader is None:
+            return None
+        return (self.downloader.received - self._start_counts[0],
+                self.downloader.written - self._start_counts[1])
 
     def submit(self, keys, value):
         """
@@ -251,6 +488,10 @@ class Results(object):
             pass
         if progress:
             self.progress.finish()
+            transferred = self.transferred()
+            if transferred is not None and transferred[0]:
+                print("{0:.1f} MB received, {1:.1f} MB written".format(
+                    transferred[0] / 1024.**2, transferred[1] / 1024.**2))
 
         return self.map_
 
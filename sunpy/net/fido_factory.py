@@ -9,6 +9,9 @@ well as defining ``Fido`` which is an instance of
 # Author: Rishabh Sharma <rishabh.sharma.gunner@gmail.com>
 # This module was developed under funding provided by
 # Google Summer of Code 2014
+import time
+import warnings
+import threading
 from collections import MutableSequence
 
 from sunpy.util.datatype_factory_base import BasicRegistrationFactory
@@ -158,8 +161,8 @@ def _create_and(walker, query, factory):
             error += str(at) + ', '
         raise ValueError(error)
 
-    # Return the response and the client
-    return [factory._make_query_to_client(*query.attrs)]
+    # Return the client to query, which is done later for all the blocks at once
+    return [(factory._check_registered_widgets(*query.attrs)[0], query.attrs)]
 
 
 @query_walker.add_creator(attr.AttrOr)
@@ -177,10 +180,13 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
 
     Search and Download data from a variety of supported sources.
     """
-    def search(self, *query):
+    def search(self, *query, **kwargs):
         """
         Query for data in form of multiple parameters.
 
+        The clients matching each part of the query are queried at the same
+        time, and their responses are returned in the order of the query.
+
         Examples
         --------
         Query for LYRALightCurve data for the time range ('2012/3/4','2012/3/6')
@@ -206,6 +212,12 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
             VSO and the JSOC.  The query can mix attributes from the VSO and
             the JSOC.
 
+        timeout : `float`, optional
+            The number of seconds to wait for the clients to respond. Clients
+            that fail, or have not responded in time, are left out of the
+            results with a warning (unless no client responds, when the first
+            error is raised). By default there is no time limit.
+
         Returns
         -------
         `sunpy.net.fido_factory.UnifiedResponse` object
@@ -218,8 +230,12 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
         This helps in modularising query into parts and handling each of the
         parts individually.
         """
+        timeout = kwargs.pop('timeout', None)
+        if kwargs:
+            raise TypeError("search() got unexpected keyword arguments {0}".format(
+                ', '.join(kwargs)))
         query = attr.and_(*query)
-        return UnifiedResponse(query_walker.create(query, self))
+        return UnifiedResponse(self._query_clients(query_walker.create(query, self), timeout))
 
     def fetch(self, query_result, wait=True, progress=True, **kwargs):
         """
@@ -307,9 +323,57 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
         client : Instance of client class
         """
         candidate_widget_types = self._check_registered_widgets(*query)
-        tmpclient = candidate_widget_types[0]()
+        return self._query_client(candidate_widget_types[0], query)
+
+    @staticmethod
+    def _query_client(client_class, query):
+        """Perform the query with a new instance of ``client_class``."""
+        tmpclient = client_class()
         return tmpclient.query(*query), tmpclient
 
+    def _query_clients(self, blocks, timeout=None):
+        """
+        Perform the queries for each (client class, query) in ``blocks``
+        concurrently, one thread per query, and return a (response, client)
+        for each of those that succeed within ``timeout`` seconds, in order.
+        """
+        results = [None] * len(blocks)
+        errors = [None] * len(blocks)
+
+        def run(i, client_class, query):
+            try:
+                results[i] = self._query_client(client_class, query)
+            except Exception as e:
+                errors[i] = e
+
+        threads = []
+        for i, (client_class, query) in enumerate(blocks):
+            thread = threading.Thread(target=run, args=(i, client_class, query))
+            # Don't let a client that never responds keep Python running.
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+        deadline = None if timeout is None else time.time() + timeout
+        for thread in threads:
+            thread.join(None if deadline is None else max(deadline - time.time(), 0))
+
+        # Take a copy, as clients that have timed out may still finish.
+        results = list(results)
+        responses = [result for result in results if result is not None]
+        for i, (client_class, query) in enumerate(blocks):
+            if results[i] is not None:
+                continue
+            error = errors[i]
+            if error is not None and not responses:
+                raise error
+            reason = "failed: {0!r}".format(error) if error is not None else \
+                "did not respond within {0} seconds".format(timeout)
+            warnings.warn("The query to {0} {1}, so its results are missing. The query "
+                          "was: {2}".format(client_class.__name__, reason,
+                                            ', '.join(str(at) for at in query)))
+        return responses
+
 
 Fido = UnifiedDownloaderFactory(registry=CLIENTS,
                                 additional_validation_functions=['_can_handle_query'])
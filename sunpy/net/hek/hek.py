@@ -15,7 +15,10 @@ import codecs
 
 from itertools import chain
 from datetime import datetime
+from collections import deque
+from multiprocessing.pool import ThreadPool
 from sunpy.net import attr
+from sunpy.net.cache import get_query_cache
 from sunpy.net.hek import attrs
 from sunpy.net.vso import attrs as v_attrs
 from sunpy.util import unique
@@ -37,10 +40,28 @@ def _freeze(obj):
     return obj
 
 
+def _record_key(record):
+    """ Hashable key identifying a HEK record: its archive ID, or the
+    frozen record if it has none. """
+    key = record.get('kb_archivid')
+    if key is None:
+        return _freeze(record)
+    return key
+
+
 class HEKClient(object):
     """ Client to interact with the Heliophysics Event Knowledgebase (HEK).
     The HEK stores solar feature and event data generated by algorithms and
-    human observers."""
+    human observers.
+
+    If ``cache`` is True, or a `~sunpy.net.cache.QueryCache`, the results of
+    queries are cached (by default the ``query_cache`` option in the
+    ``[net]`` section of the sunpyrc decides), and repeating a query within
+    the cache's time to live returns the stored result without contacting
+    the HEK.
+
+    Once the first page of results for a query shows there are more, up to
+    ``max_conn`` of the following pages are fetched at the same time."""
     # FIXME: Expose fields in .attrs with the right types
     # that is, not all StringParamWrapper!
 
@@ -53,34 +74,66 @@ class HEKClient(object):
     # Default to full disk.
     attrs.walker.apply(attrs.SpatialRegion(), {}, default)
 
-    def __init__(self, url=DEFAULT_URL):
+    def __init__(self, url=DEFAULT_URL, cache=None, max_conn=4):
         self.url = url
+        self.cache = get_query_cache(cache)
+        self.max_conn = max_conn
 
-    def _download(self, data):
-        """ Download all data, even if paginated. """
-        page = 1
-        results = []
+    def _fetch_page(self, data, page):
+        """ Download one page of results. """
+        data = dict(data, page=page)
         reader = codecs.getreader("utf-8")
-
-        while True:
-            data['page'] = page
-            fd = urllib.request.urlopen(
-                self.url, urllib.parse.urlencode(data).encode('utf-8'))
-            try:
-                result = json.load(reader(fd))
-            finally:
-                fd.close()
-            results.extend(result['result'])
-
-            if not result['overmax']:
-                return list(map(Response, results))
-            page += 1
+        fd = urllib.request.urlopen(
+            self.url, urllib.parse.urlencode(data).encode('utf-8'))
+        try:
+            return json.load(reader(fd))
+        finally:
+            fd.close()
+
+    def _iter_pages(self, data):
+        """ Yield the records in each page of results, in order. After the
+        first page, ``max_conn`` pages are requested ahead of the one being
+        read until a page says it is the last. """
+        result = self._fetch_page(data, 1)
+        yield result['result']
+        if not result['overmax']:
+            return
+
+        pool = ThreadPool(self.max_conn)
+        try:
+            pending = deque()
+            next_page = 2
+            while True:
+                while len(pending) < self.max_conn:
+                    pending.append(pool.apply_async(self._fetch_page, (data, next_page)))
+                    next_page += 1
+                result = pending.popleft().get()
+                yield result['result']
+                if not result['overmax']:
+                    return
+        finally:
+            pool.terminate()
 
     def query(self, *query):
         """ Retrieves information about HEK records matching the criteria
         given in the query expression. If multiple arguments are passed,
         they are connected with AND. The result of a query is a list of
         unique HEK Response objects that fulfill the criteria."""
+        return list(self.iter_query(*query))
+
+    def iter_query(self, *query):
+        """ Like `query`, but yields the Response objects as each page of
+        results arrives instead of waiting for all of them.
+
+        Examples
+        --------
+        >>> from sunpy.net import hek
+        >>> client = hek.HEKClient()
+        >>> for flare in client.iter_query(hek.attrs.Time('2011/08/09 07:23:56',
+        ...                                               '2011/08/09 12:40:29'),
+        ...                                hek.attrs.FL):   # doctest: +SKIP
+        ...     print(flare['fl_goescls'])   # doctest: +SKIP
+        """
         query = attr.and_(*query)
 
         data = attrs.walker.create(query, {})
@@ -90,14 +143,31 @@ class HEKClient(object):
             new.update(elem)
             ndata.append(new)
 
+        if self.cache is not None:
+            key = self.cache.key('HEKClient', self.url, ndata)
+            cached = self.cache.get(key)
+            if cached is not None:
+                for record in cached:
+                    yield Response(record)
+                return
+
+        pages = chain.from_iterable(self._iter_pages(data) for data in ndata)
         if len(ndata) == 1:
-            return self._download(ndata[0])
+            records = chain.from_iterable(pages)
         else:
-            return self._merge(self._download(data) for data in ndata)
+            records = self._merge(pages)
+
+        results = []
+        for record in records:
+            results.append(record)
+            yield Response(record)
+
+        if self.cache is not None:
+            self.cache.put(key, results)
 
     def _merge(self, responses):
         """ Merge responses, removing duplicates. """
-        return list(unique(chain.from_iterable(responses), _freeze))
+        return unique(chain.from_iterable(responses), _record_key)
 
 
 class Response(dict):
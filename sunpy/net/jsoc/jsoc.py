@@ -4,6 +4,8 @@ from __future__ import print_function, absolute_import
 import os
 import time
 import warnings
+import threading
+from multiprocessing.pool import ThreadPool
 
 import requests
 import numpy as np
@@ -26,6 +28,9 @@ JSOC_INFO_URL = 'http://jsoc.stanford.edu/cgi-bin/ajax/jsoc_info'
 JSOC_EXPORT_URL = 'http://jsoc.stanford.edu/cgi-bin/ajax/jsoc_fetch'
 BASE_DL_URL = 'http://jsoc.stanford.edu'
 
+# Export status codes of requests which are still being staged.
+JSOC_PENDING_STATUS = (1, 2, 6)
+
 
 class JSOCResponse(object):
     def __init__(self, table=None):
@@ -310,11 +315,18 @@ class JSOCClient(object):
         return allstatus
 
     def get(self, jsoc_response, path=None, overwrite=False, progress=True,
-            max_conn=5, downloader=None,sleep=10):
+            max_conn=5, downloader=None, sleep=10, pipeline=False):
         """
         Make the request for the data in jsoc_response and wait for it to be
         staged and then download the data.
 
+        With ``pipeline=True`` this returns as soon as the exports have been
+        requested. Their status is then checked in the background, at the
+        same time for every export, first after ``sleep / 10`` seconds and
+        then at intervals which double up to ``sleep`` seconds. Each export
+        starts downloading as soon as it is staged, while the others are
+        still being staged.
+
         Parameters
         ----------
         jsoc_response : JSOCResponse object
@@ -339,6 +351,10 @@ class JSOCClient(object):
             The number of seconds to wait between calls to JSOC to check the status
             of the request.
 
+        pipeline : bool
+            Download each export as soon as it is staged, instead of checking
+            the exports one at a time.
+
         Returns
         -------
         results : a :class:`sunpy.net.vso.Results` instance
@@ -349,6 +365,11 @@ class JSOCClient(object):
         requestIDs = self.request_data(jsoc_response)
         # Add them to the response for good measure
         jsoc_response.requestIDs = requestIDs
+        if pipeline:
+            return self._get_pipelined(list(requestIDs), path=path,
+                                       overwrite=overwrite, progress=progress,
+                                       max_conn=max_conn, downloader=downloader,
+                                       sleep=sleep)
         time.sleep(sleep/2.)
 
         r = Results(lambda x: None, done=lambda maps: [v['path'] for v in maps.values()])
@@ -360,7 +381,7 @@ class JSOCClient(object):
                 if progress:
                     self.check_request(request_id)
 
-                if u.status_code == 200 and u.json()['status'] == '0':
+                if self._is_ready(u):
                     rID = requestIDs.pop(i)
                     r = self.get_request(rID, path=path, overwrite=overwrite,
                                  progress=progress, results=r)
@@ -421,30 +442,14 @@ class JSOCClient(object):
         # A Results object tracks the number of downloads requested and the
         # number that have been completed.
         if results is None:
-            results = Results(lambda _: downloader.stop())
+            results = Results(lambda _: downloader.stop(), downloader=downloader)
 
         urls = []
         for request_id in requestIDs:
             u = self._request_status(request_id)
 
-            if u.status_code == 200 and u.json()['status'] == '0':
-                for ar in u.json()['data']:
-                    is_file = os.path.isfile(os.path.join(path, ar['filename']))
-                    if overwrite or not is_file:
-                        url_dir = BASE_DL_URL + u.json()['dir'] + '/'
-                        urls.append(urllib.parse.urljoin(url_dir, ar['filename']))
-
-                    else:
-                        print_message = "Skipping download of file {} as it " \
-                                        "has already been downloaded"
-                        print(print_message.format(ar['filename']))
-                        # Add the file on disk to the output
-                        results.map_.update({ar['filename']:{'path':os.path.join(path, ar['filename'])}})
-
-                if progress:
-                    print_message = "{0} URLs found for download. Totalling {1}MB"
-                    print(print_message.format(len(urls), u.json()['size']))
-
+            if self._is_ready(u):
+                urls += self._export_urls(u.json(), path, overwrite, progress, results)
             else:
                 if progress:
                     self.check_request(request_id)
@@ -452,7 +457,7 @@ class JSOCClient(object):
         if urls:
             for url in urls:
                 downloader.download(url, callback=results.require([url]),
-                                    errback=lambda x: print(x), path=path)
+                                    errback=results.add_error, path=path)
 
         else:
             # Make Results think it has finished.
@@ -461,6 +466,139 @@ class JSOCClient(object):
 
         return results
 
+    @staticmethod
+    def _is_ready(status_response):
+        """
+        Whether a response to a status request says the export is staged.
+        """
+        return (status_response.status_code == 200 and
+                int(status_response.json()['status']) == 0)
+
+    def _export_urls(self, status, path, overwrite, progress, results):
+        """
+        Return the URLs to download for a staged export from the JSON
+        ``status`` of the export. Files which have already been downloaded
+        to ``path`` are added to ``results`` instead, unless ``overwrite``.
+        """
+        urls = []
+        for ar in status['data']:
+            is_file = os.path.isfile(os.path.join(path, ar['filename']))
+            if overwrite or not is_file:
+                url_dir = BASE_DL_URL + status['dir'] + '/'
+                urls.append(urllib.parse.urljoin(url_dir, ar['filename']))
+
+            else:
+                print_message = "Skipping download of file {} as it " \
+                                "has already been downloaded"
+                print(print_message.format(ar['filename']))
+                # Add the file on disk to the output
+                results.map_.update({ar['filename']:{'path':os.path.join(path, ar['filename'])}})
+
+        if progress:
+            print_message = "{0} URLs found for download. Totalling {1}MB"
+            print(print_message.format(len(urls), status['size']))
+        return urls
+
+    def _get_pipelined(self, requestIDs, path=None, overwrite=False, progress=True,
+                       max_conn=5, downloader=None, sleep=10):
+        """
+        Download the exports ``requestIDs`` as each is staged, checking
+        their status in a background thread. See `get`.
+        """
+        if path is None:
+            path = config.get('downloads', 'download_dir')
+        path = os.path.expanduser(path)
+
+        if downloader is None:
+            downloader = Downloader(max_conn=max_conn, max_total=max_conn)
+
+        results = Results(lambda _: downloader.stop(),
+                          done=lambda maps: [v['path'] for v in maps.values()],
+                          downloader=downloader)
+        if not requestIDs:
+            # Make Results think it has finished.
+            results.require([])
+            results.poke()
+            return results
+
+        # Each export is required as well as its files, so the results are
+        # not finished until every export has been staged.
+        staged = {request_id: results.require([]) for request_id in requestIDs}
+        thread = threading.Thread(target=self._poll_exports,
+                                  args=(staged, results, downloader, path,
+                                        overwrite, progress, max_conn, sleep))
+        thread.daemon = True
+        thread.start()
+        return results
+
+    def _poll_exports(self, staged, results, downloader, path, overwrite,
+                      progress, max_conn, sleep):
+        """
+        Check the status of the exports in ``staged`` until each is staged
+        or has failed, queueing the downloads of each staged export.
+        """
+        # The time of the next check of each export, and the interval after it.
+        interval = dict.fromkeys(staged, sleep / 10.)
+        next_check = dict.fromkeys(staged, time.time() + sleep / 10.)
+        pool = ThreadPool(max(1, min(max_conn, len(staged))))
+        try:
+            while next_check:
+                time.sleep(max(0, min(next_check.values()) - time.time()))
+                due = [request_id for request_id, check in next_check.items()
+                       if check <= time.time()]
+                statuses = pool.map(self._export_status, due)
+                for request_id, (status, error) in zip(due, statuses):
+                    try:
+                        if error is not None:
+                            raise error
+                        code = int(status['status'])
+                        if code in JSOC_PENDING_STATUS:
+                            interval[request_id] = min(2 * interval[request_id], sleep)
+                            next_check[request_id] = time.time() + interval[request_id]
+                            continue
+
+                        del next_check[request_id]
+                        if code != 0:
+                            raise ValueError("Request {0} returned status: {1} with "
+                                             "error: {2}".format(request_id, code,
+                                                                 status.get('error')))
+                        urls = self._export_urls(status, path, overwrite, progress,
+                                                 results)
+                    except Exception as error:
+                        next_check.pop(request_id, None)
+                        results.add_error(error)
+                        continue
+
+                    for url in urls:
+                        callback = results.require([url])
+                        try:
+                            downloader.download(url, callback=callback,
+                                                errback=results.add_error, path=path)
+                        except Exception as error:
+                            results.add_error(error)
+                    staged[request_id](status)
+        except Exception as error:
+            # Fail the exports which will no longer be checked, rather than
+            # leave the results waiting for them forever.
+            for request_id in next_check:
+                results.add_error(error)
+        finally:
+            pool.terminate()
+
+    def _export_status(self, request_id):
+        """
+        Return the JSON status of an export with None, or None with the
+        exception raised getting it.
+        """
+        try:
+            response = self._request_status(request_id)
+            if response.status_code != 200:
+                raise ValueError("Status request for {0} returned code "
+                                 "{1}".format(request_id, response.status_code))
+            return response.json(), None
+        except Exception as error:
+            return None, error
+
     def _process_time(self, time):
         """
         Take a UTC time string or datetime instance and generate a astropy.time
@@ -5,6 +5,8 @@ Created on Wed Mar 26 20:17:06 2014
 @author: stuart
 """
 import os
+import json
+import time
 import tempfile
 import datetime
 import astropy.table
@@ -13,8 +15,10 @@ import astropy.units as u
 import pytest
 
 from sunpy.time import parse_time
-from sunpy.net.jsoc import JSOCClient, JSOCResponse
+from sunpy.extern.six.moves import urllib
+from sunpy.net.jsoc import jsoc, JSOCClient, JSOCResponse
 from sunpy.net.download import Results
+from sunpy.net.tests.server import LocalServer
 import sunpy.net.jsoc.attrs as attrs
 import sunpy.net.vso.attrs as vso_attrs
 
@@ -284,3 +288,135 @@ def test_results_filenames():
 def test_invalid_query():
     with pytest.raises(ValueError):
         client.query(attrs.Time('2012/1/1T01:00:00', '2012/1/1T01:00:45'))
+
+
+@pytest.fixture
+def export_server(monkeypatch):
+    """
+    A stand-in for the JSOC export system, which stages the exports of the
+    series ``fast`` in 0.1 seconds and of the series ``slow`` in 0.6 seconds,
+    logging when each export is first reported ready and each file is
+    downloaded.
+    """
+    exports = {}
+    log = []
+
+    def respond(handler, content):
+        body = json.dumps(content).encode('utf-8')
+        handler.send_response(200)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def fetch(handler):
+        if handler.command == 'POST':
+            series = urllib.parse.parse_qs(handler.body.decode('utf-8'))['ds'][0].split('[')[0]
+            request_id = 'JSOC_{0}'.format(len(exports))
+            exports[request_id] = {'series': series, 'polls': 0,
+                                   'ready': time.time() + (0.6 if series == 'slow' else 0.1)}
+            respond(handler, {'status': 2, 'requestid': request_id})
+            return
+
+        request_id = urllib.parse.parse_qs(handler.path.split('?', 1)[1])['requestid'][0]
+        export = exports.get(request_id)
+        if export is None:
+            respond(handler, {'status': 4, 'requestid': request_id,
+                              'error': 'unknown request'})
+            return
+        export['polls'] += 1
+        if time.time() < export['ready']:
+            respond(handler, {'status': 1, 'requestid': request_id, 'wait': 1})
+            return
+        if 'reported' not in export:
+            export['reported'] = True
+            log.append(('ready', export['series']))
+        names = ['{0}.{1}.fits'.format(export['series'], i) for i in range(2)]
+        respond(handler, {'status': 0, 'requestid': request_id, 'size': 1,
+                          'dir': '/SUM/' + request_id,
+                          'data': [{'filename': name} for name in names]})
+        for name in names:
+            server.files['/SUM/{0}/{1}'.format(request_id, name)] = download(name)
+
+    def download(name):
+        def handler(request):
+            log.append(('download', name.split('.')[0]))
+            request.send_response(200)
+            request.send_header('Content-Length', '4')
+            request.end_headers()
+            request.wfile.write(b'data')
+        return handler
+
+    server = LocalServer({'/cgi-bin/ajax/jsoc_fetch': fetch}).start()
+    server.exports = exports
+    server.log = log
+    monkeypatch.setattr(jsoc, 'JSOC_EXPORT_URL', server.url('cgi-bin/ajax/jsoc_fetch'))
+    monkeypatch.setattr(jsoc, 'BASE_DL_URL', server.url().rstrip('/'))
+    yield server
+    server.stop()
+
+
+def test_get_pipeline(export_server, tmpdir):
+    response = JSOCResponse()
+    response.query_args = [{'start_time': '2012/1/1T00:00:00', 'end_time': '2012/1/1T00:01:00',
+                            'series': series, 'notify': 'jsoc@example.com'}
+                           for series in ('slow', 'fast')]
+    start = time.time()
+    results = client.get(response, path=str(tmpdir), progress=False, sleep=0.4,
+                         pipeline=True)
+    assert isinstance(results, Results)
+    # Both exports are requested before any is staged
+    assert len(export_server.exports) == 2
+    assert time.time() - start < 0.1
+
+    paths = results.wait(progress=False)
+    assert not results.errors
+    assert sorted(paths) == sorted(str(tmpdir.join('{0}.{1}.fits'.format(series, i)))
+                                   for series in ('slow', 'fast') for i in range(2))
+    # The fast export is downloaded while the slow one is still being staged
+    assert export_server.log[:3] == [('ready', 'fast'), ('download', 'fast'),
+                                     ('download', 'fast')]
+    assert export_server.log[3:] == [('ready', 'slow'), ('download', 'slow'),
+                                     ('download', 'slow')]
+    # The checks of the slow export back off: 0.04, 0.08, 0.16, 0.32 s
+    assert export_server.exports['JSOC_0']['polls'] <= 5
+
+
+def test_get_pipeline_failed_export(export_server, tmpdir, monkeypatch):
+    response = JSOCResponse()
+    response.query_args = [{'start_time': '2012/1/1T00:00:00', 'end_time': '2012/1/1T00:01:00',
+                            'series': 'fast', 'notify': 'jsoc@example.com'}]
+    monkeypatch.setattr(client, 'request_data', lambda response: ['JSOC_0', 'JSOC_bad'])
+    export_server.exports['JSOC_0'] = {'series': 'fast', 'polls': 0, 'ready': 0}
+    results = client.get(response, path=str(tmpdir), progress=False, sleep=0.1,
+                         pipeline=True)
+    paths = results.wait(progress=False)
+    assert len(paths) == 2
+    assert len(results.errors) == 1
+
+
+def test_get_pipeline_unexpected_failures(tmpdir, monkeypatch):
+    response = JSOCResponse()
+    response.query_args = [{'start_time': '2012/1/1T00:00:00', 'end_time': '2012/1/1T00:01:00',
+                            'series': 'fast', 'notify': 'jsoc@example.com'}]
+    monkeypatch.setattr(client, 'request_data', lambda response: ['JSOC_0', 'JSOC_1'])
+    # A status without a status code, and a staged export whose download
+    # cannot be started.
+    statuses = {'JSOC_0': {'requestid': 'JSOC_0'},
+                'JSOC_1': {'status': 0, 'dir': '/SUM1', 'size': 1,
+                           'data': [{'filename': 'fast.0.fits'}]}}
+    monkeypatch.setattr(client, '_export_status',
+                        lambda request_id: (statuses[request_id], None))
+
+    class BrokenDownloader(object):
+        received = written = 0
+
+        def download(self, url, callback=None, errback=None, path=None):
+            raise IOError("disk full")
+
+        def stop(self):
+            pass
+
+    results = client.get(response, path=str(tmpdir), progress=False, sleep=0.1,
+                         pipeline=True, downloader=BrokenDownloader())
+    assert results.evt.wait(5)
+    assert len(results.errors) == 2
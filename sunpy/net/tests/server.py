@@ -0,0 +1,123 @@
+"""
+A local HTTP server for testing the download code without network access.
+"""
+from __future__ import absolute_import
+
+import threading
+
+from sunpy.extern.six.moves import BaseHTTPServer, socketserver
+
+__all__ = ['LocalServer', 'ranged']
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            content = server.files.get(self.path.split('?', 1)[0])
+            if content is None:
+                self.send_error(404)
+            elif callable(content):
+                content(self)
+            else:
+                if server.delay:
+                    server.delay_event.wait(server.delay)
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def do_POST(self):
+        self.body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+def ranged(content, drop_after=None, drops=0):
+    """
+    Return a handler that serves ``content`` with support for ``Range``
+    requests, recording the ranges asked for in ``handler.ranges``. The first
+    ``drops`` responses are cut off after ``drop_after`` bytes by closing the
+    connection.
+    """
+    state = {'drops': drops}
+
+    def handler(request):
+        byte_range = request.headers.get('Range')
+        handler.ranges.append(byte_range)
+        start = int(byte_range[len('bytes='):].split('-')[0]) if byte_range else 0
+        if start >= len(content):
+            request.send_error(416)
+            return
+        request.send_response(206 if start else 200)
+        if start:
+            request.send_header('Content-Range', 'bytes {0}-{1}/{2}'.format(
+                start, len(content) - 1, len(content)))
+        request.send_header('Content-Length', str(len(content) - start))
+        request.end_headers()
+        if state['drops'] and drop_after is not None:
+            state['drops'] -= 1
+            request.wfile.write(content[start:start + drop_after])
+            request.close_connection = True
+        else:
+            request.wfile.write(content[start:])
+
+    handler.ranges = []
+    return handler
+
+
+class LocalServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """
+    An HTTP/1.1 server on localhost, run in a background thread, which
+    keeps connections alive between requests.
+
+    ``files`` maps request paths to the bytes to serve, or to a function
+    called with the request handler to write a custom response (the body
+    of a POST request is in ``handler.body``). The server
+    records the paths requested, the number of connections opened, and the
+    largest number of requests it has handled at once.
+    """
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, files=None, delay=0):
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', 0), _Handler)
+        self.files = files if files is not None else {}
+        self.delay = delay
+        self.delay_event = threading.Event()
+        self.lock = threading.Lock()
+        self.requests = []
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self._thread = None
+
+    def url(self, path=''):
+        return 'http://127.0.0.1:{0}/{1}'.format(self.server_address[1], path.lstrip('/'))
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import os
+import time
+import zlib
+import logging
+import threading
+
+import pytest
+
+from sunpy.extern.six.moves import urllib
+from sunpy.net.asyncdownload import AsyncDownloader
+from sunpy.net.tests.server import LocalServer, ranged
+
+
+@pytest.fixture
+def server():
+    files = {'/file{0}.txt'.format(i): 'content {0}\n'.format(i).encode() * (i + 1)
+             for i in range(20)}
+    server = LocalServer(files).start()
+    yield server
+    server.stop()
+
+
+def download_all(downloader, urls, path):
+    """Download ``urls``, returning the results passed to each callback."""
+    results = []
+    errors = []
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def finish(result, store):
+        with lock:
+            store.append(result)
+            if len(results) + len(errors) == len(urls):
+                done.set()
+
+    for url in urls:
+        downloader.download(url, path, callback=lambda r: finish(r, results),
+                            errback=lambda e: finish(e, errors))
+    assert done.wait(30)
+    return results, errors
+
+
+def test_download_reuses_connections(server, tmpdir):
+    dw = AsyncDownloader(max_conn=2, max_total=2, chunk_size=4)
+    urls = [server.url(path) for path in sorted(server.files)]
+    results, errors = download_all(dw, urls, str(tmpdir))
+    dw.close()
+
+    assert not errors
+    assert sorted(result['path'] for result in results) == sorted(
+        str(tmpdir.join(path)) for path in server.files)
+    for path, content in server.files.items():
+        with open(str(tmpdir.join(path)), 'rb') as fd:
+            assert fd.read() == content
+    # Twenty files over at most two connections at a time
+    assert len(server.requests) == 20
+    assert server.connections <= 2
+
+
+@pytest.mark.parametrize('max_conn, max_total, expected', [(1, 5, 1), (5, 3, 3), (4, 8, 4)])
+def test_connection_limits(tmpdir, max_conn, max_total, expected):
+    server = LocalServer({'/file{0}'.format(i): b'data' for i in range(10)}, delay=0.05)
+    server.start()
+    try:
+        dw = AsyncDownloader(max_conn=max_conn, max_total=max_total)
+        results, errors = download_all(dw, [server.url('file{0}'.format(i)) for i in range(10)],
+                                       str(tmpdir))
+        dw.close()
+    finally:
+        server.stop()
+    assert len(results) == 10
+    assert server.max_active == expected
+
+
+def test_chunked_and_redirect(server, tmpdir):
+    def chunked(handler):
+        handler.send_response(200)
+        handler.send_header('Transfer-Encoding', 'chunked')
+        handler.end_headers()
+        for chunk in (b'abc', b'defgh', b''):
+            handler.wfile.write('{0:x}\r\n'.format(len(chunk)).encode() + chunk + b'\r\n')
+
+    def redirect(handler):
+        handler.send_response(302)
+        handler.send_header('Location', '/chunked')
+        handler.send_header('Content-Length', '0')
+        handler.end_headers()
+
+    server.files['/chunked'] = chunked
+    server.files['/redirect'] = redirect
+    dw = AsyncDownloader(max_conn=1)
+    path = lambda response, url: str(tmpdir.join(url.rsplit('/', 1)[-1] + '.out'))
+    results, errors = download_all(dw, [server.url('redirect'), server.url('file0.txt')], path)
+    dw.close()
+
+    assert not errors
+    assert sorted(result['path'] for result in results) == [str(tmpdir.join('chunked.out')),
+                                                            str(tmpdir.join('file0.txt.out'))]
+    assert tmpdir.join('chunked.out').read_binary() == b'abcdefgh'
+    assert server.connections == 1
+
+
+def test_download_error(server, tmpdir):
+    dw = AsyncDownloader()
+    results, errors = download_all(dw, [server.url('missing'), server.url('file1.txt')],
+                                   str(tmpdir))
+    dw.close()
+    assert len(results) == 1
+    assert len(errors) == 1
+    assert isinstance(errors[0], urllib.error.HTTPError)
+    assert errors[0].code == 404
+    assert not os.path.exists(str(tmpdir.join('missing')))
+
+
+def test_callback_errors_are_logged(server, tmpdir, caplog):
+    def callback(result):
+        raise RuntimeError("callback failed")
+
+    dw = AsyncDownloader()
+    with caplog.at_level(logging.ERROR, logger='sunpy.net.asyncdownload'):
+        dw.download(server.url('file1.txt'), str(tmpdir), callback=callback)
+        # The default errback re-raises the download error
+        dw.download(server.url('missing'), str(tmpdir))
+        deadline = time.time() + 30
+        while (len(caplog.records) < 2 or dw._running) and time.time() < deadline:
+            time.sleep(0.01)
+    dw.close()
+
+    errors = sorted((type(record.exc_info[1]) for record in caplog.records), key=str)
+    assert errors == [RuntimeError, urllib.error.HTTPError]
+
+
+def test_closed_connection_not_reused(server, tmpdir):
+    def close_after(handler):
+        handler.send_response(200)
+        handler.send_header('Content-Length', '4')
+        handler.end_headers()
+        handler.wfile.write(b'data')
+        handler.close_connection = True
+
+    server.files['/close'] = close_after
+    dw = AsyncDownloader(max_conn=1)
+    for path in ('close', 'file0.txt', 'file1.txt'):
+        results, errors = download_all(dw, [server.url(path)], str(tmpdir))
+        assert not errors
+    dw.close()
+    assert server.connections == 2
+
+
+def test_download_resumes_dropped_connection(server, tmpdir):
+    content = os.urandom(100000)
+    handler = server.files['/data.fits'] = ranged(content, drop_after=30000, drops=2)
+    tmpdir.join('data.fits.part').write_binary(content[:10000])
+
+    dw = AsyncDownloader(retries=3, backoff=0)
+    results, errors = download_all(dw, [server.url('data.fits')], str(tmpdir))
+    dw.close()
+    assert not errors
+    assert tmpdir.join('data.fits').read_binary() == content
+    assert not tmpdir.join('data.fits.part').exists()
+    # The first response only gives the name of the file
+    assert handler.ranges == [None, 'bytes=10000-', 'bytes=40000-']
+
+
+def test_download_retries_exhausted(server, tmpdir):
+    content = os.urandom(100000)
+    server.files['/data.fits'] = ranged(content, drop_after=20000, drops=3)
+
+    dw = AsyncDownloader(retries=2, backoff=0)
+    results, errors = download_all(dw, [server.url('data.fits')], str(tmpdir))
+    dw.close()
+    assert not results
+    assert len(errors) == 1
+    assert tmpdir.join('data.fits.part').size() == 60000
+
+
+def test_download_decompress(server, tmpdir):
+    content = os.urandom(50000) + b'\0' * 200000
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    compressed = compressor.compress(content) + compressor.flush()
+    handler = server.files['/data.fts.gz'] = ranged(compressed, drop_after=20000, drops=1)
+
+    dw = AsyncDownloader(retries=1, backoff=0, decompress=True)
+    results, errors = download_all(dw, [server.url('data.fts.gz')], str(tmpdir))
+    dw.close()
+    assert not errors
+    assert results[0]['path'] == str(tmpdir.join('data.fts'))
+    assert tmpdir.join('data.fts').read_binary() == content
+    assert handler.ranges == [None, 'bytes=20000-']
+    assert (dw.received, dw.written) == (len(compressed), len(content))
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import os
+import json
+import time
+
+import pytest
+
+import sunpy
+from sunpy.extern.six.moves import configparser
+from sunpy.net.cache import DownloadCache, QueryCache, get_download_cache, get_query_cache
+from sunpy.net.download import Downloader, Results
+from sunpy.net.tests.server import LocalServer
+
+URL = 'http://example.com/data/file.fits'
+
+
+@pytest.fixture
+def cache(tmpdir):
+    return DownloadCache(str(tmpdir.join('cache')), 10 * 1024**2)
+
+
+def make_file(tmpdir, name, content=b'data'):
+    path = tmpdir.join(name)
+    path.write_binary(content)
+    return str(path)
+
+
+def test_cache_round_trip(tmpdir, cache):
+    headers = {'Content-Length': '4', 'ETag': '"abc"'}
+    destination = str(tmpdir.join('out', 'file.fits'))
+    assert not cache.get(URL, headers, destination)
+
+    assert cache.put(URL, headers, make_file(tmpdir, 'file.fits'))
+    assert cache.get(URL, headers, destination)
+    with open(destination, 'rb') as fd:
+        assert fd.read() == b'data'
+
+    # A new version of the file on the server is not a hit
+    assert not cache.get(URL, {'Content-Length': '4', 'ETag': '"def"'}, destination)
+    assert not cache.get(URL + '?x', headers, destination)
+    # Nor is a file the server doesn't identify
+    assert not cache.put(URL, {}, make_file(tmpdir, 'other.fits'))
+
+
+def test_cache_partial_response_headers(tmpdir, cache):
+    cache.put(URL, {'Content-Length': '4', 'Last-Modified': 'Mon'},
+              make_file(tmpdir, 'file.fits'))
+    # The total size is taken from the Content-Range of a partial response
+    assert cache.get(URL, {'Content-Length': '2', 'Content-Range': 'bytes 2-3/4',
+                           'Last-Modified': 'Mon'}, str(tmpdir.join('copy.fits')))
+
+
+def test_cache_changed_file_dropped(tmpdir, cache):
+    headers = {'Content-Length': '4'}
+    path = make_file(tmpdir, 'file.fits')
+    cache.put(URL, headers, path)
+    # Rewriting the downloaded file in place also changes the hard linked copy
+    with open(path, 'ab') as fd:
+        fd.write(b'more')
+    assert not cache.get(URL, headers, str(tmpdir.join('copy.fits')))
+    assert cache.size == 0
+
+
+def test_cache_eviction(tmpdir, cache):
+    for i in range(3):
+        url = '{0}{1}'.format(URL, i)
+        cache.put(url, {'Content-Length': '1000'}, make_file(tmpdir, str(i), b'x' * 1000))
+    # Using the oldest file makes the second one the least recently used.
+    assert cache.get(URL + '0', {'Content-Length': '1000'}, str(tmpdir.join('copy')))
+
+    cache.max_size = 3000
+    cache.put(URL + '3', {'Content-Length': '1000'}, make_file(tmpdir, '3', b'x' * 1000))
+    assert cache.size == 3000
+    assert not cache.get(URL + '1', {'Content-Length': '1000'}, str(tmpdir.join('copy')))
+    assert cache.get(URL + '0', {'Content-Length': '1000'}, str(tmpdir.join('copy')))
+    assert cache.get(URL + '2', {'Content-Length': '1000'}, str(tmpdir.join('copy')))
+
+    cache.clear()
+    assert cache.size == 0
+    assert os.listdir(cache.directory) == ['manifest.json']
+
+
+def test_get_download_cache(cache):
+    assert get_download_cache(False) is None
+    assert get_download_cache(cache) is cache
+
+
+def test_get_download_cache_missing_option(monkeypatch):
+    config = configparser.RawConfigParser()
+    config.add_section('downloads')
+    monkeypatch.setattr(sunpy, 'config', config)
+    assert get_download_cache() is None
+
+
+def test_downloader_uses_cache(tmpdir, cache):
+    server = LocalServer({'/file.fits': b'fits data'}).start()
+    try:
+        paths = []
+        for name in ('first', 'second'):
+            dw = Downloader(cache=cache)
+            results = Results(lambda _: dw.stop())
+            dw.download(server.url('file.fits'), str(tmpdir.join(name)),
+                        callback=results.require(['file']), errback=results.add_error)
+            dw.wait()
+            assert not results.errors
+            paths.append(results.map_['file']['path'])
+    finally:
+        server.stop()
+
+    first, second = (os.stat(path) for path in paths)
+    with open(paths[1], 'rb') as fd:
+        assert fd.read() == b'fits data'
+    # Both downloads, and the cache, are links to the same file
+    assert first.st_ino == second.st_ino
+    assert second.st_nlink == 3
+
+
+def test_query_cache(tmpdir):
+    cache = QueryCache(str(tmpdir.join('queries')), 3600)
+    key = cache.key('Client', [{'a': 1, 'b': 2}])
+    # The order of the query parameters doesn't matter
+    assert key == cache.key('Client', [{'b': 2, 'a': 1}])
+    assert key != cache.key('OtherClient', [{'a': 1, 'b': 2}])
+
+    assert cache.get(key) is None
+    assert cache.put(key, [{'event': 'flare'}])
+    assert cache.get(key) == [{'event': 'flare'}]
+    assert cache.stats == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+    assert not cache.put(key, [object()])
+
+    cache.clear()
+    assert cache.get(key) is None
+    assert cache.stats == {'hits': 0, 'misses': 1, 'hit_rate': 0.0}
+
+
+def test_query_cache_expiry(tmpdir):
+    cache = QueryCache(str(tmpdir.join('queries')), 3600)
+    cache.put('old', 1)
+    cache.put('new', 2)
+    entry = tmpdir.join('queries', 'old.json')
+    entry.write(json.dumps({'time': time.time() - 7200, 'result': 1}))
+    os.utime(str(entry), (0, 0))
+    assert cache.get('old') is None
+    assert cache.get('new') == 2
+
+    # Expired results are removed when others are stored
+    cache.put('newer', 3)
+    assert not entry.exists()
+
+
+def test_get_query_cache(tmpdir):
+    cache = QueryCache(str(tmpdir), 10)
+    assert get_query_cache(False) is None
+    assert get_query_cache(cache) is cache
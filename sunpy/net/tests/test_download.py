@@ -8,6 +8,7 @@ from __future__ import absolute_import
 import pytest
 
 import os
+import zlib
 import tempfile
 import threading
 
@@ -15,7 +16,9 @@ from functools import partial
 
 import sunpy
 
-from sunpy.net.download import Downloader, default_name
+from sunpy.extern.six.moves import configparser, urllib
+from sunpy.net.download import Downloader, Results, default_name
+from sunpy.net.tests.server import LocalServer, ranged
 
 
 class CalledProxy(object):
@@ -36,8 +39,15 @@ class MockConfig(object):
         self.dct[name] = dct
 
     def get(self, one, other):
+        if one not in self.dct:
+            raise configparser.NoSectionError(one)
+        if other not in self.dct[one]:
+            raise configparser.NoOptionError(other, one)
         return self.dct[one][other]
 
+    def getboolean(self, one, other):
+        return str(self.get(one, other)).lower() in ('1', 'yes', 'true', 'on')
+
 
 def wait_for(n, callback): #pylint: disable=W0613
     items = []
@@ -160,3 +170,121 @@ def test_download_dir():
     assert not timeout.fired
     assert not errback.fired
     assert os.path.exists(os.path.join(tmpdir, 'jquery.min.js'))
+
+
+@pytest.fixture
+def server():
+    server = LocalServer().start()
+    yield server
+    server.stop()
+
+
+def download(downloader, url, path):
+    """Download ``url``, returning the `Results` once it is complete."""
+    results = Results(lambda _: downloader.stop())
+    downloader.download(url, path, callback=results.require([url]),
+                        errback=results.add_error)
+    downloader.wait()
+    return results
+
+
+def test_download_resumes_dropped_connection(server, tmpdir):
+    content = os.urandom(100000)
+    handler = server.files['/data.fits'] = ranged(content, drop_after=30000, drops=2)
+    url = server.url('data.fits')
+
+    results = download(Downloader(retries=3, backoff=0), url, str(tmpdir))
+    assert not results.errors
+    assert results.map_[url]['path'] == str(tmpdir.join('data.fits'))
+    assert tmpdir.join('data.fits').read_binary() == content
+    assert tmpdir.listdir() == [tmpdir.join('data.fits')]
+    assert handler.ranges == [None, 'bytes=30000-', 'bytes=60000-']
+
+
+def test_download_retries_exhausted(server, tmpdir):
+    content = os.urandom(100000)
+    handler = server.files['/data.fits'] = ranged(content, drop_after=20000, drops=3)
+    url = server.url('data.fits')
+
+    results = download(Downloader(retries=2, backoff=0), url, str(tmpdir))
+    assert len(results.errors) == 1
+    assert not results.map_
+    assert not tmpdir.join('data.fits').exists()
+    assert tmpdir.join('data.fits.part').size() == 60000
+
+    # A later download continues from the partial file, once the response
+    # has given the name of the file.
+    results = download(Downloader(retries=0), url, str(tmpdir))
+    assert not results.errors
+    assert tmpdir.join('data.fits').read_binary() == content
+    assert not tmpdir.join('data.fits.part').exists()
+    assert handler.ranges == [None, 'bytes=20000-', 'bytes=40000-', None, 'bytes=60000-']
+
+
+def test_download_error_not_retried(server, tmpdir):
+    results = download(Downloader(retries=3, backoff=0), server.url('missing.fits'),
+                       str(tmpdir))
+    assert len(results.errors) == 1
+    assert isinstance(results.errors[0], urllib.error.HTTPError)
+    assert len(server.requests) == 1
+    assert not tmpdir.listdir()
+
+
+def gzip_compress(content):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(content) + compressor.flush()
+
+
+def test_download_decompress(server, tmpdir):
+    content = b'SIMPLE  =                    T' + os.urandom(50000) + b'\0' * 200000
+    compressed = gzip_compress(content)
+    handler = server.files['/data.fts.gz'] = ranged(compressed, drop_after=20000, drops=1)
+    url = server.url('data.fts.gz')
+
+    dw = Downloader(retries=1, backoff=0, decompress=True)
+    results = download(dw, url, str(tmpdir))
+    assert not results.errors
+    assert results.map_[url]['path'] == str(tmpdir.join('data.fts'))
+    assert tmpdir.join('data.fts').read_binary() == content
+    assert tmpdir.listdir() == [tmpdir.join('data.fts')]
+    # The retry continues the compressed stream
+    assert handler.ranges == [None, 'bytes=20000-']
+    assert dw.received == len(compressed)
+    assert dw.written == len(content)
+
+
+def test_results_show_bytes_transferred(server, tmpdir, capsys):
+    content = b'\0' * (3 * 1024**2)
+    server.files['/data.fts.gz'] = gzip_compress(content)
+    dw = Downloader(decompress=True)
+    download(dw, server.url('data.fts.gz'), str(tmpdir.join('first')))
+
+    # Only the bytes since the results were created are counted
+    results = Results(lambda _: dw.stop(), downloader=dw)
+    dw.download(server.url('data.fts.gz'), str(tmpdir.join('second')),
+                callback=results.require(['file']), errback=results.add_error)
+    results.wait(progress=True)
+    assert results.transferred() == (len(server.files['/data.fts.gz']), len(content))
+    assert dw.written == 2 * len(content)
+    assert capsys.readouterr()[0].endswith("0.0 MB received, 3.0 MB written\n")
+    assert Results(lambda _: None).transferred() is None
+
+
+def test_download_decompress_multiple_members(server, tmpdir):
+    server.files['/data.fts.gz'] = gzip_compress(b'first ') + gzip_compress(b'second')
+    server.files['/data.fts'] = b'plain'
+    dw = Downloader(decompress=True)
+    for name in ('data.fts.gz', 'data.fts'):
+        results = download(dw, server.url(name), str(tmpdir.join(name)))
+        assert not results.errors
+    assert tmpdir.join('data.fts.gz', 'data.fts').read_binary() == b'first second'
+    assert tmpdir.join('data.fts', 'data.fts').read_binary() == b'plain'
+
+
+def test_download_decompress_truncated(server, tmpdir):
+    server.files['/data.fts.gz'] = gzip_compress(os.urandom(1000))[:500]
+    results = download(Downloader(retries=3, backoff=0, decompress=True),
+                       server.url('data.fts.gz'), str(tmpdir))
+    assert isinstance(results.errors[0], zlib.error)
+    assert len(server.requests) == 1
+    assert not tmpdir.join('data.fts').exists()
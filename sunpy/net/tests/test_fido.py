@@ -1,5 +1,6 @@
 import os
 import copy
+import time
 import tempfile
 
 import pytest
@@ -10,7 +11,8 @@ import astropy.units as u
 
 from sunpy.net import attr
 from sunpy.net import Fido, attrs as a
-from sunpy.net.fido_factory import DownloadResponse, UnifiedResponse
+from sunpy.net.fido_factory import (DownloadResponse, UnifiedResponse,
+                                   UnifiedDownloaderFactory)
 from sunpy.net.dataretriever.client import CLIENTS, QueryResponse
 from sunpy.util.datatype_factory_base import NoMatchError, MultipleMatchError
 from sunpy.time import TimeRange, parse_time
@@ -180,3 +182,71 @@ def test_responses():
         assert isinstance(resp, QueryResponse)
 
     assert i + 1 == len(results)
+
+
+"""
+Concurrent search Tests
+"""
+
+
+class FakeResponse(list):
+    pass
+
+
+def make_client(instrument, delay=0, error=None):
+    """A client for one instrument that takes ``delay`` seconds to respond."""
+    class FakeClient(object):
+        @classmethod
+        def _can_handle_query(cls, *query):
+            return any(isinstance(at, a.Instrument) and at.value == instrument
+                       for at in query)
+
+        def query(self, *query):
+            time.sleep(delay)
+            if error is not None:
+                raise error
+            return FakeResponse([instrument])
+
+    FakeClient.__name__ = instrument + 'Client'
+    return FakeClient
+
+
+def make_factory(*clients):
+    return UnifiedDownloaderFactory(
+        registry={client: client._can_handle_query for client in clients},
+        additional_validation_functions=['_can_handle_query'])
+
+
+def test_search_queries_clients_concurrently():
+    factory = make_factory(make_client('one', 0.5), make_client('two', 0.3),
+                           make_client('three', 0.1))
+    start = time.time()
+    results = factory.search(a.Time("2012/1/1", "2012/1/2"),
+                             a.Instrument('one') | a.Instrument('two') | a.Instrument('three'))
+    assert time.time() - start < 0.9
+    # The responses are in the order of the query, not the order they arrived in
+    assert [list(response) for response in results.responses] == [['one'], ['two'], ['three']]
+
+
+def test_search_timeout_partial_results():
+    factory = make_factory(make_client('one'), make_client('slow', 5), make_client('two'))
+    with pytest.warns(UserWarning) as record:
+        results = factory.search(a.Time("2012/1/1", "2012/1/2"),
+                                 a.Instrument('one') | a.Instrument('slow') | a.Instrument('two'),
+                                 timeout=0.5)
+    assert [list(response) for response in results.responses] == [['one'], ['two']]
+    assert len(record) == 1
+    assert 'slowClient did not respond within 0.5 seconds' in str(record[0].message)
+
+
+def test_search_error_partial_results():
+    factory = make_factory(make_client('one'), make_client('down', error=IOError("down")))
+    with pytest.warns(UserWarning) as record:
+        results = factory.search(a.Time("2012/1/1", "2012/1/2"),
+                                 a.Instrument('down') | a.Instrument('one'))
+    assert [list(response) for response in results.responses] == [['one']]
+    assert 'downClient failed' in str(record[0].message)
+
+    # With no results to return the error is raised
+    with pytest.raises(IOError):
+        factory.search(a.Time("2012/1/1", "2012/1/2"), a.Instrument('down'))
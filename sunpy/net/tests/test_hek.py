@@ -5,10 +5,16 @@
 
 from __future__ import absolute_import
 
+import json
+import time
+
 import pytest
 
+from sunpy.extern.six.moves import urllib
 from sunpy.net import hek
 from sunpy.net import attr
+from sunpy.net.cache import QueryCache
+from sunpy.net.tests.server import LocalServer
 
 
 @pytest.fixture
@@ -87,3 +93,79 @@ def test_err_dummyattr_create():
 def test_err_dummyattr_apply():
     with pytest.raises(TypeError):
         hek.attrs.walker.apply(attr.DummyAttr(), {})
+
+
+def test_query_cache(tmpdir, monkeypatch):
+    downloads = []
+
+    def fetch_page(self, data, page):
+        downloads.append(data)
+        return {'result': [{'event_type': data['event_type'], 'kb_archivid': 'x'}],
+                'overmax': False}
+    monkeypatch.setattr(hek.HEKClient, '_fetch_page', fetch_page)
+
+    cache = QueryCache(str(tmpdir), 3600)
+    client = hek.HEKClient(cache=cache)
+    query = (hek.attrs.Time('2011/08/09 07:23:56', '2011/08/09 12:40:29'),
+             hek.attrs.EventType('FL'))
+    first = client.query(*query)
+    second = hek.HEKClient(cache=cache).query(*query)
+    assert len(downloads) == 1
+    assert first == second == [{'event_type': 'FL', 'kb_archivid': 'x'}]
+    assert all(isinstance(result, hek.hek.Response) for result in second)
+    assert cache.stats['hits'] == 1
+
+    # A different query is not a hit
+    client.query(query[0], hek.attrs.EventType('AR'))
+    assert len(downloads) == 2
+    # Nor is a query made without the cache
+    hek.HEKClient(cache=False).query(*query)
+    assert len(downloads) == 3
+
+
+@pytest.fixture
+def her():
+    """ A stand-in for the HEK with five pages of three records for each
+    query, the first record of each page shared by every query. """
+    def search(handler):
+        data = urllib.parse.parse_qs(handler.body.decode('utf-8'))
+        page = int(data['page'][0])
+        time.sleep(0.05)
+        records = [{'kb_archivid': 'ivo://{0}/{1}'.format(
+            'shared' if i == 0 else data['event_starttime'][0], page * 3 + i)}
+            for i in range(3)]
+        body = json.dumps({'result': records if page <= 5 else [],
+                           'overmax': page < 5}).encode('utf-8')
+        handler.send_response(200)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    server = LocalServer({'/her': search}).start()
+    yield server
+    server.stop()
+
+
+def test_query_pages(her):
+    client = hek.HEKClient(url=her.url('her'), cache=False, max_conn=3)
+    records = client.iter_query(hek.attrs.Time('2011/08/09', '2011/08/10'), hek.attrs.FL)
+    first = next(records)
+    assert isinstance(first, hek.hek.Response)
+    # Only the first page has been fetched
+    assert len(her.requests) == 1
+
+    records = [first] + list(records)
+    assert [record['kb_archivid'] for record in records] == [
+        'ivo://{0}/{1}'.format('shared' if i % 3 == 0 else '2011-08-09T00:00:00', i)
+        for i in range(3, 18)]
+    # The later pages are fetched at the same time, with some past the last
+    assert her.max_active == 3
+    assert len(her.requests) <= 5 + 2
+
+
+def test_query_merges_duplicates(her):
+    client = hek.HEKClient(url=her.url('her'), cache=False)
+    records = client.query(hek.attrs.Time('2011/08/09', '2011/08/10') |
+                           hek.attrs.Time('2011/08/11', '2011/08/12'), hek.attrs.FL)
+    ids = [record['kb_archivid'] for record in records]
+    assert len(ids) == len(set(ids)) == 5 + 10 + 10
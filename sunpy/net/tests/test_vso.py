@@ -6,14 +6,17 @@
 from __future__ import absolute_import
 
 import datetime
+import numpy as np
 import pytest
+from suds import sudsobject
 from astropy import units as u
 
 from sunpy.time import TimeRange
 from sunpy.net import vso
 from sunpy.net.vso import attrs as va
-from sunpy.net.vso.vso import QueryResponse
+from sunpy.net.vso.vso import QueryResponse, _suds_to_json, _json_to_suds, _parse_times
 from sunpy.net import attr
+from sunpy.net.cache import QueryCache
 
 
 @pytest.fixture
@@ -207,3 +210,135 @@ def test_str():
 def test_repr():
     qr = QueryResponse([])
     assert "Start Time End Time  Source Instrument   Type" in repr(qr)
+
+
+def make_record(start, end, size=10.0, source='SDO', type_='FULLDISK'):
+    factory = sudsobject.Factory
+    return factory.object('QueryResponseBlock', {
+        'time': factory.object('Time', {'start': start, 'end': end}),
+        'size': size, 'source': source, 'instrument': 'AIA',
+        'extent': factory.object('Extent', {'type': type_})})
+
+
+@pytest.fixture
+def records():
+    return QueryResponse([
+        make_record('20110920000000', '20110920000012', size=-1),
+        make_record('20110921123000', '20110921123012', source=None),
+        make_record(None, '2011-09-22 01:02:03', size=None, type_=None),
+        make_record('20110919235959', None, size=5.5)])
+
+
+def test_parse_times():
+    times = ['20110920000000', '20120229235959', None, '2011-09-22T01:02:03', '19991231120030']
+    expected = [datetime.datetime(2011, 9, 20), datetime.datetime(2012, 2, 29, 23, 59, 59),
+                None, datetime.datetime(2011, 9, 22, 1, 2, 3),
+                datetime.datetime(1999, 12, 31, 12, 0, 30)]
+    parsed = _parse_times(times)
+    assert parsed.dtype == np.dtype('datetime64[s]')
+    assert [None if np.isnat(time) else time.astype(datetime.datetime)
+            for time in parsed] == expected
+    assert len(_parse_times([])) == 0
+
+
+def test_queryresponse_reductions(records):
+    # Negative and missing sizes are left out
+    assert records.total_size() == 15.5
+    assert records.time_range() == (datetime.datetime(2011, 9, 19, 23, 59, 59),
+                                    datetime.datetime(2011, 9, 22, 1, 2, 3))
+
+
+def test_queryresponse_table(records, monkeypatch):
+    table = records.build_table()
+    assert list(table['Start Time']) == ['2011-09-20 00:00:00', '2011-09-21 12:30:00',
+                                         'None', '2011-09-19 23:59:59']
+    assert list(table['End Time'])[2:] == ['2011-09-22 01:02:03', 'None']
+    assert list(table['Source']) == ['SDO', 'None', 'SDO', 'SDO']
+    assert list(table['Type']) == ['FULLDISK', 'FULLDISK', 'N/A', 'FULLDISK']
+    # The table is kept until the records change
+    assert records.build_table() is table
+    records.append(make_record('20110925000000', '20110925000012'))
+    assert len(records.build_table()) == 5
+    assert records.total_size() == 25.5
+
+    monkeypatch.setattr(vso.vso, 'TIME_FORMAT', '%d/%m/%Y %H:%M')
+    assert list(QueryResponse(records).build_table()['Start Time']) == [
+        '20/09/2011 00:00', '21/09/2011 12:30', 'None', '19/09/2011 23:59', '25/09/2011 00:00']
+
+
+def test_queryresponse_mutation(records):
+    table = records.build_table()
+    assert records.total_size() == 15.5
+
+    records.reverse()
+    assert records.build_table() is not table
+    assert list(records.build_table()['Start Time'])[:2] == ['2011-09-19 23:59:59', 'None']
+
+    records[0] = make_record('20110918000000', '20110918000012', size=100.0)
+    assert records.total_size() == 110.0
+    assert records.time_range()[0] == datetime.datetime(2011, 9, 18)
+    assert records.build_table()['Start Time'][0] == '2011-09-18 00:00:00'
+
+    del records[0]
+    records.sort(key=lambda record: record.size or 0)
+    assert records.total_size() == 10.0
+    assert records.time_range() == (datetime.datetime(2011, 9, 20),
+                                    datetime.datetime(2011, 9, 22, 1, 2, 3))
+    assert list(records.build_table()['Source']) == ['SDO', 'SDO', 'None']
+
+    records += [make_record('20110925000000', '20110925000012', size=1.0)]
+    assert records.total_size() == 11.0
+    assert len(records.build_table()) == 4
+
+
+def make_response(fileids):
+    factory = sudsobject.Factory
+    records = [factory.object('QueryResponseBlock', {'fileid': fileid, 'size': 10.0})
+               for fileid in fileids]
+    item = factory.object('ProviderQueryResponse',
+                          {'provider': 'SDAC', 'no_of_records_found': len(records),
+                           'record': factory.object('QueryResponseBlockArray',
+                                                    {'recorditem': records})})
+    return factory.object('QueryResponse', {'provideritem': [item]})
+
+
+def test_suds_to_json():
+    response = make_response(['a', 'b'])
+    restored = _json_to_suds(_suds_to_json(response))
+    assert restored.__class__.__name__ == 'QueryResponse'
+    assert [record.fileid for record in restored.provideritem[0].record.recorditem] == ['a', 'b']
+    assert str(restored) == str(response)
+
+
+class FakeAPI(object):
+    """ Stands in for the suds client, counting the queries made. """
+
+    def __init__(self):
+        self.queries = []
+        self.factory = self
+        self.service = self
+
+    def create(self, atype):
+        return sudsobject.Factory.object(atype, {'block': None})
+
+    def Query(self, request):
+        self.queries.append(request)
+        return make_response(['a', 'b'])
+
+
+def test_query_cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(vso.vso.walker, 'create',
+                        lambda query, api: [api.factory.create('QueryRequestBlock')])
+    cache = QueryCache(str(tmpdir), 3600)
+    api = FakeAPI()
+    client = vso.VSOClient(api=api, cache=cache)
+    query = va.Time('2011/01/01', '2011/01/02')
+    first = client.query(query)
+    second = vso.VSOClient(api=api, cache=cache).query(query)
+    assert len(api.queries) == 1
+    assert [record.fileid for record in second] == [record.fileid for record in first] == ['a', 'b']
+    assert second.total_size() == 20
+    assert cache.stats['hits'] == 1
+
+    vso.VSOClient(api=api, cache=False).query(query)
+    assert len(api.queries) == 2
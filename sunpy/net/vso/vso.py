@@ -20,14 +20,16 @@ import threading
 from datetime import datetime, timedelta
 from functools import partial
 from collections import defaultdict
-from suds import client, TypeNotFound
+from suds import client, sudsobject, TypeNotFound
 
+import numpy as np
 import astropy
 from astropy.table import Table, Column
 import astropy.units as u
 
 from sunpy import config
 from sunpy.net import download
+from sunpy.net.cache import get_query_cache
 from sunpy.net.proxyfix import WellBehavedHttpTransport
 from sunpy.util.progressbar import TTYProgressBar as ProgressBar
 from sunpy.util.net import get_filename, slugify
@@ -81,6 +83,31 @@ def _parse_date(string):
     return {'time_start': start.strip(), 'time_end': end.strip()}
 
 
+def _suds_to_json(obj):
+    """
+    Convert a suds object into lists and dicts that can be stored as JSON,
+    keeping the names of the suds types.
+    """
+    if isinstance(obj, sudsobject.Object):
+        return {'__suds_type__': obj.__class__.__name__,
+                'fields': [[key, _suds_to_json(value)] for key, value in obj]}
+    if isinstance(obj, (list, tuple)):
+        return [_suds_to_json(elem) for elem in obj]
+    return obj
+
+
+def _json_to_suds(obj):
+    """ Inverse of `_suds_to_json`. """
+    if isinstance(obj, dict) and '__suds_type__' in obj:
+        result = sudsobject.Factory.object(obj['__suds_type__'])
+        for key, value in obj['fields']:
+            setattr(result, key, _json_to_suds(value))
+        return result
+    if isinstance(obj, list):
+        return [_json_to_suds(elem) for elem in obj]
+    return obj
+
+
 def iter_records(response):
     for prov_item in response.provideritem:
         if not hasattr(prov_item, 'record') or not prov_item.record:
@@ -89,6 +116,52 @@ def iter_records(response):
             yield record_item
 
 
+def _parse_times(times):
+    """
+    Parse VSO times (in `~sunpy.net.vso.attrs.TIMEFORMAT`) into a
+    ``datetime64[s]`` array, with NaT for missing times. The digits of the
+    usual 14 digit times are converted all at once; any other times are
+    parsed one at a time with `~sunpy.time.parse_time`.
+    """
+    strings = np.array(['' if time is None else time for time in times], dtype='U')
+    result = np.full(len(strings), np.datetime64('NaT'), dtype='datetime64[s]')
+    if not len(strings):
+        return result
+
+    plain = (np.char.str_len(strings) == 14) & np.char.isdigit(strings)
+    digits = (strings[plain].astype('S14').view(np.uint8).reshape(-1, 14) -
+              ord('0')).astype(np.int64)
+    number = lambda first, last: digits[:, first:last].dot(10 ** np.arange(last - first)[::-1])
+    dates = ((number(0, 4) - 1970).astype('datetime64[Y]').astype('datetime64[M]') +
+             (number(4, 6) - 1).astype('timedelta64[M]'))
+    result[plain] = (dates.astype('datetime64[D]') +
+                     (number(6, 8) - 1).astype('timedelta64[D]') +
+                     (number(8, 10) * 3600 + number(10, 12) * 60 +
+                      number(12, 14)).astype('timedelta64[s]'))
+
+    for i in np.flatnonzero(~plain & (strings != '')):
+        result[i] = np.datetime64(parse_time(strings[i]), 's')
+    return result
+
+
+def _format_times(times):
+    """
+    Format a ``datetime64`` array of times with the ``time_format`` of the
+    sunpyrc, as the string 'None' for missing times.
+    """
+    if not len(times):
+        return np.array([])
+    if TIME_FORMAT == '%Y-%m-%d %H:%M:%S':
+        strings = np.char.replace(np.datetime_as_string(times, unit='s'), 'T', ' ')
+    else:
+        # Format each distinct time once.
+        unique, inverse = np.unique(times, return_inverse=True)
+        strings = np.array([datetime.strftime(time.astype(datetime), TIME_FORMAT)
+                            if not np.isnat(time) else ''
+                            for time in unique.astype('datetime64[s]')])[inverse]
+    return np.where(np.isnat(times), 'None', strings)
+
+
 def iter_errors(response):
     for prov_item in response.provideritem:
         if not hasattr(prov_item, 'record') or not prov_item.record:
@@ -96,10 +169,25 @@ def iter_errors(response):
 
 
 class QueryResponse(list):
+    """
+    The records returned by a VSO query.
+
+    Each field shown in the table of the records, or used by `total_size`
+    and `time_range`, is gathered into a numpy array the first time it is
+    needed. The table shown by ``str``, ``repr`` and in the notebook is
+    built from these arrays when it is first shown, and then kept. Both are
+    thrown away whenever the records are changed in place.
+    """
     def __init__(self, lst, queryresult=None, table=None):
         super(QueryResponse, self).__init__(lst)
         self.queryresult = queryresult
         self.errors = []
+        self.table = table
+        self._columns = {}
+
+    def _invalidate(self):
+        """ Forget the columns and table built from the records. """
+        self._columns = {}
         self.table = None
 
     def query(self, *query):
@@ -114,47 +202,52 @@ class QueryResponse(list):
     def create(cls, queryresult):
         return cls(iter_records(queryresult), queryresult)
 
+    def _column(self, name):
+        """
+        Return the ``start`` or ``end`` times (as ``datetime64[s]``, NaT if
+        missing), ``size``, ``source``, ``instrument`` or extent ``type`` of
+        the records as a numpy array.
+        """
+        if name not in self._columns:
+            text = lambda values, missing: np.array(
+                [missing if value is None else str(value) for value in values])
+            if name == 'start':
+                column = _parse_times([record.time.start for record in self])
+            elif name == 'end':
+                column = _parse_times([record.time.end for record in self])
+            elif name == 'size':
+                column = np.array([np.nan if record.size is None else record.size
+                                   for record in self], dtype=float)
+            elif name == 'type':
+                column = text((record.extent.type for record in self), 'N/A')
+            else:
+                column = text((getattr(record, name) for record in self), 'None')
+            self._columns[name] = column
+        return self._columns[name]
+
     def total_size(self):
         """ Total size of data in KB. May be less than the actual
         size because of inaccurate data providers. """
         # Warn about -1 values?
-        return sum(record.size for record in self if record.size > 0)
+        size = self._column('size')
+        return float(size[size > 0].sum())
 
     def time_range(self):
         """ Return total time-range all records span across. """
-        return (
-            datetime.strptime(
-                min(record.time.start for record in self
-                  if record.time.start is not None), TIMEFORMAT),
-            datetime.strptime(
-                max(record.time.end for record in self
-                  if record.time.end is not None), TIMEFORMAT)
-        )
+        start, end = self._column('start'), self._column('end')
+        return (start[~np.isnat(start)].min().astype(datetime),
+                end[~np.isnat(end)].max().astype(datetime))
 
     def build_table(self):
-        keywords = ['Start Time', 'End Time', 'Source', 'Instrument', 'Type']
-        record_items = {}
-        for key in keywords:
-            record_items[key] = []
-
-        def validate_time(time):
-            # Handle if the time is None when coming back from VSO
-            if time is None:
-                return ['None']
-            if record.time.start is not None:
-                return [datetime.strftime(parse_time(time), TIME_FORMAT)]
-            else:
-                return ['N/A']
-
-        for record in self:
-            record_items['Start Time'].append(validate_time(record.time.start))
-            record_items['End Time'].append(validate_time(record.time.end))
-            record_items['Source'].append(str(record.source))
-            record_items['Instrument'].append(str(record.instrument))
-            record_items['Type'].append(str(record.extent.type)
-                                if record.extent.type is not None else ['N/A'])
-
-        return Table(record_items)[keywords]
+        """ Return an `~astropy.table.Table` of the records. """
+        start = self._column('start')
+        if self.table is None:
+            self.table = Table([_format_times(start), _format_times(self._column('end')),
+                                self._column('source'), self._column('instrument'),
+                                self._column('type')],
+                               names=['Start Time', 'End Time', 'Source', 'Instrument',
+                                      'Type'])
+        return self.table
 
     def add_error(self, exception):
         self.errors.append(exception)
@@ -171,6 +264,26 @@ class QueryResponse(list):
         return self.build_table()._repr_html_()
 
 
+def _invalidating(name):
+    """ Wrap the list method ``name`` to invalidate the cached columns. """
+    method = getattr(list, name)
+
+    def mutate(self, *args, **kwargs):
+        self._invalidate()
+        return method(self, *args, **kwargs)
+    mutate.__name__ = name
+    mutate.__doc__ = method.__doc__
+    return mutate
+
+
+for _name in ('__setitem__', '__delitem__', '__setslice__', '__delslice__',
+              '__iadd__', '__imul__', 'append', 'extend', 'insert', 'pop',
+              'remove', 'reverse', 'sort', 'clear'):
+    if hasattr(list, _name):
+        setattr(QueryResponse, _name, _invalidating(_name))
+del _name
+
+
 class DownloadFailed(Exception):
     pass
 
@@ -190,12 +303,18 @@ class UnknownStatus(Exception):
     pass
 
 class VSOClient(object):
-    """ Main VSO Client. """
+    """ Main VSO Client.
+
+    If ``cache`` is True, or a `~sunpy.net.cache.QueryCache`, the results of
+    queries are cached (by default the ``query_cache`` option in the
+    ``[net]`` section of the sunpyrc decides), and repeating a query within
+    the cache's time to live returns the stored result without contacting
+    the VSO. """
     method_order = [
         'URL-TAR_GZ', 'URL-ZIP', 'URL-TAR', 'URL-FILE', 'URL-packaged'
     ]
 
-    def __init__(self, url=None, port=None, api=None):
+    def __init__(self, url=None, port=None, api=None, cache=None):
         if api is None:
             if url is None:
                 url = DEFAULT_URL
@@ -205,6 +324,7 @@ class VSOClient(object):
             api = client.Client(url, transport=WellBehavedHttpTransport())
             api.set_options(port=port)
         self.api = api
+        self.cache = get_query_cache(cache)
 
     def make(self, atype, **kwargs):
         """ Create new SOAP object with attributes specified in kwargs.
@@ -261,9 +381,18 @@ class VSOClient(object):
         value of same type as the one of :py:meth:`VSOClient.query`.
         """
         query = and_(*query)
+        blocks = walker.create(query, self.api)
+
+        if self.cache is not None:
+            key = self.cache.key('VSOClient', self._cache_location(),
+                                 [_suds_to_json(block) for block in blocks])
+            cached = self.cache.get(key)
+            if cached is not None:
+                return QueryResponse.create(_json_to_suds(cached))
 
         responses = []
-        for block in walker.create(query, self.api):
+        failed = False
+        for block in blocks:
             try:
                 responses.append(
                     self.api.service.Query(
@@ -273,10 +402,21 @@ class VSOClient(object):
             except TypeNotFound:
                 pass
             except Exception as ex:
+                failed = True
                 response = QueryResponse.create(self.merge(responses))
                 response.add_error(ex)
 
-        return QueryResponse.create(self.merge(responses))
+        merged = self.merge(responses)
+        # Don't keep results that are missing blocks.
+        if self.cache is not None and not failed:
+            self.cache.put(key, _suds_to_json(merged))
+        return QueryResponse.create(merged)
+
+    def _cache_location(self):
+        """ The WSDL URL and port queried, as part of the query cache key. """
+        wsdl = getattr(self.api, 'wsdl', None)
+        options = getattr(self.api, 'options', None)
+        return getattr(wsdl, 'url', None), getattr(options, 'port', None)
 
     def merge(self, queryresponses):
         """ Merge responses into one. """
@@ -541,11 +681,12 @@ class VSOClient(object):
             downloader.init()
             res = download.Results(
                 lambda _: downloader.stop(), 1,
-                lambda mp: self.link(query_response, mp)
+                lambda mp: self.link(query_response, mp), downloader
             )
         else:
             res = download.Results(
-                lambda _: None, 1, lambda mp: self.link(query_response, mp)
+                lambda _: None, 1, lambda mp: self.link(query_response, mp),
+                downloader
             )
         if path is None:
             path = os.path.join(config.get('downloads', 'download_dir'),
@@ -111,7 +111,9 @@ def rot_hpc(x, y, tstart, tend, frame_time='synodic', rot_type='howard', **kwarg
         Helio-projective y-co-ordinate in arcseconds (can be an array).
 
     tstart : `sunpy.time.time`
-        date/time to which x and y are referred.
+        date/time to which x and y are referred. This can also be a list or
+        array of times, one for each pair of co-ordinates, in which case all
+        of them are rotated in a single calculation.
 
     tend : `sunpy.time.time`
     date/time at which x and y will be rotated to.
@@ -161,9 +163,13 @@ def rot_hpc(x, y, tstart, tend, frame_time='synodic', rot_type='howard', **kwarg
     # Make sure we have enough time information to perform a solar differential
     # rotation
     # Start time
-    dstart = parse_time(tstart)
     dend = parse_time(tend)
-    interval = (dend - dstart).total_seconds() * u.s
+    if isinstance(tstart, (list, np.ndarray)):
+        dstart = np.array([parse_time(t) for t in tstart])
+        interval = np.array([(dend - d).total_seconds() for d in dstart]) * u.s
+    else:
+        dstart = parse_time(tstart)
+        interval = (dend - dstart).total_seconds() * u.s
 
     # Get the Sun's position from the vantage point at the start time
     vstart = kwargs.get("vstart", _calc_P_B0_SD(dstart))
@@ -209,7 +215,7 @@ def _calc_P_B0_SD(date):
     -----------
     date : `sunpy.time.time`
         the time at which to calculate the solar P, B0 angles and the
-        semi-diameter.
+        semi-diameter. This can also be an array of times.
 
     Returns
     -------
@@ -225,7 +231,7 @@ def _calc_P_B0_SD(date):
         http://hesperia.gsfc.nasa.gov/ssw/gen/idl/solar/pb0r.pro
     """
     # number of Julian days since 2415020.0
-    de = julian_day(parse_time(date)) - 2415020.0
+    de = julian_day(date) - 2415020.0
 
     # get the longitude of the sun etc.
     sun_position = _sun_pos(date)
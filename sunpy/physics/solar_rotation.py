@@ -51,26 +51,19 @@ def calculate_solar_rotate_shift(mc, layer_index=0, **kwargs):
         The shifts are given in helioprojective co-ordinates.
 
     """
-    # Size of the data
-    nt = len(mc.maps)
-
-    # Storage for the shifts in arcseconds
-    xshift_arcseconds = np.zeros((nt)) * u.arcsec
-    yshift_arcseconds = np.zeros_like(xshift_arcseconds)
-
-    # Calculate the rotations and the shifts
-    for i, m in enumerate(mc):
-        # Calculate the rotation of the center of the map 'm' at its
-        # observation time to the observation time of the reference layer
-        # indicated by "layer_index".
-        newx, newy = rot_hpc(m.center.x,
-                             m.center.y,
-                             m.date,
-                             mc.maps[layer_index].date, **kwargs)
-
-        # Calculate the shift in arcseconds
-        xshift_arcseconds[i] = newx - mc.maps[layer_index].center.x
-        yshift_arcseconds[i] = newy - mc.maps[layer_index].center.y
+    # Rotate the center of every map at its observation time to the
+    # observation time of the reference layer indicated by "layer_index".
+    # All the layers are rotated in a single calculation.
+    reference_center = mc.maps[layer_index].center
+    centers = [m.center for m in mc.maps]
+    newx, newy = rot_hpc(u.Quantity([center.x for center in centers]),
+                         u.Quantity([center.y for center in centers]),
+                         [m.date for m in mc.maps],
+                         mc.maps[layer_index].date, **kwargs)
+
+    # Calculate the shift in arcseconds
+    xshift_arcseconds = u.Quantity(newx - reference_center.x, u.arcsec)
+    yshift_arcseconds = u.Quantity(newy - reference_center.y, u.arcsec)
 
     return {"x": xshift_arcseconds, "y": yshift_arcseconds}
 
@@ -95,3 +95,17 @@ def test_rot_hpc():
     x.unit == u.arcsec
     isinstance(y, Angle)
     y.unit == u.arcsec
+
+
+def test_rot_hpc_array_of_start_times():
+    # Rotating several points with different start times at once must give
+    # the same answer as rotating them one at a time
+    x = [451.4, -200.0, 10.0] * u.arcsec
+    y = [-108.9, 300.0, 0.0] * u.arcsec
+    tstart = ['2012-06-15', '2012-06-14 12:00', '2012-06-16 03:30:10']
+    tend = '2012-06-15 16:05:23'
+    newx, newy = rot_hpc(x, y, tstart, tend)
+    for i in range(len(tstart)):
+        expected_x, expected_y = rot_hpc(x[i], y[i], tstart[i], tend)
+        assert_quantity_allclose(newx[i], expected_x)
+        assert_quantity_allclose(newy[i], expected_y)
@@ -4,6 +4,8 @@ The following code is heavily based on IDL function get_sun.pro which itself
 is based on algorithms presented in the book Astronomical Formulae for
 Calculators, by Jean Meeus.
 Every function returning a quantity is of type astropy.units.Quantity
+Functions which take a time ``t`` also accept an array of times (a list, a
+``datetime64`` array or an `~astropy.time.Time` array) and return arrays.
 
 A correct answer set to compare to
 
@@ -28,6 +30,7 @@ import astropy.units as u
 from astropy.coordinates import Angle, Longitude, Latitude
 
 from sunpy.time import parse_time, julian_day, julian_centuries
+from sunpy.time.julian import _as_time
 from sunpy.sun import constants
 
 __all__ = ["print_params"
@@ -81,6 +84,7 @@ def solar_semidiameter_angular_size(t='now'):
         Radius_{\odot}[rad]=\frac{<Radius_{\odot}[m]>}{D_{\odot \oplus}(t)[m]}
 
     """
+    t = _as_time(t)
     solar_semidiameter_rad = (constants.radius.to(u.AU)) / sunearth_distance(t)
     return Angle(solar_semidiameter_rad.to(u.arcsec, equivalencies = u.dimensionless_angles()))
 
@@ -88,6 +92,7 @@ def position(t='now'):
     """Returns the position of the Sun (right ascension and declination)
     on the celestial sphere using the equatorial coordinate system in arcsec.
     """
+    t = _as_time(t)
     ra = true_rightascension(t)
     dec = true_declination(t)
     return (ra, dec)
@@ -132,6 +137,7 @@ def geometric_mean_longitude(t='now'):
 
 def equation_of_center(t='now'):
     """Returns the Sun's equation of center (in degrees)"""
+    t = _as_time(t)
     T = julian_centuries(t)
     mna = mean_anomaly(t)
     result = ((1.9194600 - 0.0047890 * T - 0.0000140 * T ** 2) * np.sin(mna)
@@ -144,17 +150,20 @@ def true_longitude(t='now'):
     """Returns the Sun's true geometric longitude (in degrees)
     (Referred to the mean equinox of date.  Question: Should the higher
     accuracy terms from which app_long is derived be added to true_long?)"""
+    t = _as_time(t)
     result = equation_of_center(t) + geometric_mean_longitude(t)
     return Longitude(result)
 
 def true_anomaly(t='now'):
     """Returns the Sun's true anomaly (in degrees)."""
+    t = _as_time(t)
     result = mean_anomaly(t) + equation_of_center(t)
     return Longitude(result)
 
 def sunearth_distance(t='now'):
     """Returns the Sun Earth distance (AU). There are a set of higher
     accuracy terms not included here."""
+    t = _as_time(t)
     ta = true_anomaly(t)
     e = eccentricity_SunEarth_orbit(t)
     result = 1.00000020 * (1.0 - e ** 2) / (1.0 + e * np.cos(ta))
@@ -162,6 +171,7 @@ def sunearth_distance(t='now'):
 
 def apparent_longitude(t='now'):
     """Returns the apparent longitude of the Sun."""
+    t = _as_time(t)
     T = julian_centuries(t)
     omega = (259.18 - 1934.142 * T) * u.deg
     true_long = true_longitude(t)
@@ -185,6 +195,7 @@ def true_obliquity_of_ecliptic(t='now'):
 
 def true_rightascension(t='now'):
     """Return the true right ascension."""
+    t = _as_time(t)
     y = np.cos(true_obliquity_of_ecliptic(t)) * np.sin(true_longitude(t))
     x = np.cos(true_longitude(t))
     true_ra = np.arctan2(y, x)
@@ -192,17 +203,20 @@ def true_rightascension(t='now'):
 
 def true_declination(t='now'):
     """Return the true declination."""
+    t = _as_time(t)
     result = np.arcsin(np.sin(true_obliquity_of_ecliptic(t)) * np.sin(apparent_longitude(t)))
     return Latitude(result.to(u.deg))
 
 def apparent_obliquity_of_ecliptic(t='now'):
     """Return the apparent obliquity of the ecliptic."""
+    t = _as_time(t)
     omega = apparent_longitude(t)
     result = true_obliquity_of_ecliptic(t) + (0.00256 * np.cos(omega)) * u.deg
     return result
 
 def apparent_rightascension(t='now'):
     """Returns the apparent right ascension of the Sun."""
+    t = _as_time(t)
     y = np.cos(apparent_obliquity_of_ecliptic(t)) * np.sin(apparent_longitude(t))
     x = np.cos(apparent_longitude(t))
     app_ra = np.arctan2(y, x)
@@ -210,6 +224,7 @@ def apparent_rightascension(t='now'):
 
 def apparent_declination(t='now'):
     """Returns the apparent declination of the Sun."""
+    t = _as_time(t)
     ob = apparent_obliquity_of_ecliptic(t)
     app_long = apparent_longitude(t)
     result = np.arcsin(np.sin(ob)) * np.sin(app_long)
@@ -217,6 +232,7 @@ def apparent_declination(t='now'):
 
 def solar_north(t='now'):
     """Returns the position of the Solar north pole in degrees."""
+    t = _as_time(t)
     T = julian_centuries(t)
     ob1 = true_obliquity_of_ecliptic(t)
     # in degrees
@@ -233,6 +249,7 @@ def solar_north(t='now'):
 
 def heliographic_solar_center(t='now'):
     """Returns the position of the solar center in heliographic coordinates."""
+    t = _as_time(t)
     jd = julian_day(t)
     T = julian_centuries(t)
     # Heliographic coordinates in degrees
@@ -1,6 +1,9 @@
 from __future__ import absolute_import
 
+import numpy as np
+
 import astropy.units as u
+from astropy.time import Time
 
 from sunpy.sun import sun
 from sunpy.tests.helpers import assert_quantity_allclose
@@ -123,3 +126,17 @@ def test_solar_north():
     assert_quantity_allclose(sun.solar_north("2019/10/10"), 26.260 * u.deg, atol=1e-3 * u.deg)
     assert_quantity_allclose(sun.solar_north("2542/02/20"), -17.981 * u.deg, atol=1e-3 * u.deg)
 
+
+
+def test_array_input():
+    times = ["2012/11/11", "2019/10/10", "2542/02/20"]
+    assert_quantity_allclose(sun.solar_north(times),
+                             [22.346, 26.260, -17.981] * u.deg, atol=1e-3 * u.deg)
+    dates = np.array(["2012-11-11", "2019-10-10"], dtype='datetime64')
+    assert_quantity_allclose(sun.sunearth_distance(dates),
+                             u.Quantity([sun.sunearth_distance(t) for t in times[:2]]))
+    lon, lat = sun.heliographic_solar_center(Time(["2012-11-11", "2019-10-10"]))
+    assert lon.shape == lat.shape == (2,)
+    assert_quantity_allclose(lat[0], sun.heliographic_solar_center("2012/11/11")[1])
+    assert np.allclose(sun.carrington_rotation_number(times),
+                       [sun.carrington_rotation_number(t) for t in times])
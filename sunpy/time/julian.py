@@ -1,16 +1,89 @@
-from __future__ import absolute_import
+from __future__ import absolute_import, division
 
+import numbers
+from collections import OrderedDict
+from datetime import datetime
+
+import numpy as np
+import pandas
 from astropy.time import Time
+
+from sunpy.extern import six
 from sunpy.time import parse_time
 
 __all__ = ['julian_day', 'julian_centuries']
 
+# Julian day of the Unix epoch, 1970-01-01 00:00:00 UTC
+_UNIX_EPOCH_JD = 2440587.5
+
+# Least recently used cache of parsed scalar times, so that repeated calls
+# with the same time string or datetime do not parse it again.
+_TIME_CACHE_SIZE = 256
+_time_cache = OrderedDict()
+
+
+def _datetime64_to_time(t):
+    """
+    Convert an array of `numpy.datetime64` to a UTC `~astropy.time.Time`
+    without going through Python datetime objects.
+    """
+    t = np.asarray(t)
+    # Count in the unit of the input (at least seconds), as casting to a
+    # finer unit overflows for dates far from 1970.
+    unit = np.datetime_data(t.dtype)[0]
+    if unit in ('Y', 'M', 'W', 'D', 'h', 'm', 'generic'):
+        unit = 's'
+    ticks = t.astype('datetime64[{0}]'.format(unit)).astype(np.int64)
+    ticks_per_day = int(np.timedelta64(1, 'D') // np.timedelta64(1, unit))
+    days, remainder = np.divmod(ticks, ticks_per_day)
+    return Time(days + _UNIX_EPOCH_JD, remainder / ticks_per_day, format='jd', scale='utc')
+
+
+def _parse_to_time(t):
+    if isinstance(t, (list, np.ndarray, pandas.Index, pandas.Series)):
+        array = np.asarray(t)
+        if array.dtype.kind == 'M':
+            return _datetime64_to_time(array)
+        return Time([parse_time(ti) for ti in array.ravel()])
+    return Time(parse_time(t))
+
+
+def _as_time(t):
+    """
+    Return the input time(s) as an `~astropy.time.Time`.
+
+    Scalar inputs (strings, datetimes, tuples and utime numbers) are cached,
+    with the exception of 'now'. Lists, arrays (including ``datetime64``
+    arrays) and pandas indexes are converted to an array-valued
+    `~astropy.time.Time`.
+    """
+    if isinstance(t, Time):
+        return t
+    if isinstance(t, six.string_types):
+        if t == 'now':
+            return _parse_to_time(t)
+    elif not isinstance(t, (datetime, tuple, numbers.Real)):
+        return _parse_to_time(t)
+
+    try:
+        time = _time_cache.pop(t)
+    except KeyError:
+        time = _parse_to_time(t)
+        if len(_time_cache) >= _TIME_CACHE_SIZE:
+            _time_cache.popitem(last=False)
+    _time_cache[t] = time
+    return time
+
 
 def julian_day(t='now'):
     """
     Wrap a UTC -> JD conversion from astropy.
+
+    ``t`` may be a single time or an array of times (a list, a
+    ``datetime64`` array or an `~astropy.time.Time` array), in which case an
+    array of Julian days is returned.
     """
-    return Time(parse_time(t)).jd
+    return _as_time(t).jd
 
 
 def julian_centuries(t='now'):
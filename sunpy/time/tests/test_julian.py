@@ -2,9 +2,12 @@ from __future__ import absolute_import, division, print_function
 
 from datetime import datetime
 
+import numpy as np
 from numpy.testing import assert_almost_equal
 import pytest
 
+from astropy.time import Time
+
 from sunpy.time import julian
 
 DATETIME_DATE_1 = datetime(1900, 1, 1, 12, 00, 0)
@@ -107,3 +110,43 @@ def test_julian_centuries6():
     """should raise value error when passed non-date string"""
 
     pytest.raises(ValueError, julian.julian_centuries, 'Are you suggesting coconuts migrate?')
+
+
+def test_julian_day_array():
+    """should return an array of julian days for an array of dates"""
+
+    expected_days = [2415021.0, 2446028.097974537, 2515138.7097222223]
+    dates = [DATETIME_DATE_1, DATETIME_DATE_2, DATETIME_DATE_3]
+    assert_almost_equal(julian.julian_day(dates), expected_days)
+    assert_almost_equal(julian.julian_day([STRING_DATE_1, STRING_DATE_2, STRING_DATE_3]),
+                        expected_days)
+    assert_almost_equal(julian.julian_day(np.array(dates, dtype='datetime64[ns]')),
+                        expected_days)
+    assert_almost_equal(julian.julian_day(Time(dates)), expected_days)
+
+
+def test_julian_day_datetime64_outside_ns_range():
+    """should not overflow for datetime64 dates that don't fit in nanoseconds"""
+
+    dates = [datetime(2542, 2, 20), datetime(1500, 1, 1), datetime(1900, 1, 1)]
+    expected_days = julian.julian_day(dates)
+    for unit in ('D', 's', 'ms', 'us'):
+        assert_almost_equal(julian.julian_day(np.array(dates, dtype='datetime64[{0}]'.format(unit))),
+                            expected_days)
+
+
+def test_julian_centuries_array():
+    """should return an array of julian centuries for an array of dates"""
+
+    expected_centuries = [2.7378507871321012e-05, 0.8489554544705528]
+    dates = np.array([DATETIME_DATE_1, DATETIME_DATE_2], dtype='datetime64[s]')
+    assert_almost_equal(julian.julian_centuries(dates), expected_centuries)
+
+
+def test_julian_day_cache():
+    """should cache parsed scalar times but never 'now'"""
+
+    julian.julian_day(STRING_DATE_2)
+    assert STRING_DATE_2 in julian._time_cache
+    julian.julian_day('now')
+    assert 'now' not in julian._time_cache
@@ -0,0 +1,163 @@
+"""
+An on-disk cache of the data parsed from TimeSeries source files.
+"""
+from __future__ import absolute_import, division, print_function
+
+import os
+import hashlib
+import tempfile
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from sunpy.extern.six.moves import cPickle as pickle
+
+__all__ = ['ParsedFile', 'ParsedFileCache']
+
+ParsedFile = namedtuple('ParsedFile', ['data', 'meta', 'units'])
+"""The (data, meta, units) parsed from a TimeSeries source file."""
+
+
+class ParsedFileCache(object):
+    """
+    An on-disk cache of the data, metadata and units parsed from TimeSeries
+    source files.
+
+    Each parsed file is stored in its own ``.npz`` archive, holding the time
+    index and every data column as separate arrays (the metadata and units are
+    pickled alongside). Entries are keyed on the absolute path, modification
+    time and size of the source file, and on the ``source`` it was read as, so
+    a changed file is parsed again. When the cache grows past ``max_size``
+    bytes the least recently used entries are removed.
+
+    Parameters
+    ----------
+    directory : `str`
+        The directory to store the cache in, created if needed.
+
+    max_size : `int`
+        The maximum total size of the cache in bytes.
+    """
+
+    def __init__(self, directory, max_size):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_size = max_size
+
+    def _entry_path(self, path, source=None):
+        stat = os.stat(path)
+        key = repr((os.path.abspath(path), stat.st_mtime, stat.st_size,
+                    source and source.lower()))
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest() + '.npz'
+        return os.path.join(self.directory, name)
+
+    def get(self, path, source=None):
+        """
+        Return the `ParsedFile` stored for ``path``, or None if there isn't
+        one for the current version of the file.
+        """
+        entry_path = self._entry_path(path, source)
+        try:
+            with np.load(entry_path, allow_pickle=True) as archive:
+                header = pickle.loads(archive['header'].tobytes())
+                index = pd.DatetimeIndex(archive['index'], name=header['index_name'],
+                                         freq=header['index_freq'])
+                columns = [archive['column_{0}'.format(i)]
+                           for i in range(len(header['columns']))]
+        except (IOError, OSError, KeyError, ValueError, EOFError, pickle.UnpicklingError):
+            return None
+
+        # Mark the entry as recently used.
+        os.utime(entry_path, None)
+
+        data = pd.DataFrame(dict(zip(range(len(columns)), columns)), index=index)
+        data.columns = header['columns']
+        return ParsedFile(data, header['meta'], header['units'])
+
+    def put(self, path, parsed, source=None):
+        """
+        Store the `ParsedFile` for ``path``. Data that can't be stored (not
+        indexed by naive datetimes, or with unpicklable metadata) is skipped.
+
+        Returns
+        -------
+        stored : `bool`
+            True if the entry was stored.
+        """
+        data = parsed.data
+        if not isinstance(data, pd.DataFrame) or not isinstance(data.index, pd.DatetimeIndex) \
+                or data.index.tz is not None:
+            return False
+        try:
+            header = pickle.dumps({'columns': list(data.columns),
+                                   'index_name': data.index.name,
+                                   'index_freq': data.index.freqstr,
+                                   'meta': parsed.meta,
+                                   'units': parsed.units}, 2)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+        arrays = {'header': np.frombuffer(header, dtype=np.uint8),
+                  'index': data.index.values}
+        for i, column in enumerate(data.columns):
+            arrays['column_{0}'.format(i)] = data[column].values
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        entry_path = self._entry_path(path, source)
+
+        # Write to a temporary file first so readers never see a partial entry.
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                np.savez(fp, **arrays)
+            if os.path.exists(entry_path):
+                os.remove(entry_path)
+            os.rename(temp_path, entry_path)
+        except (IOError, OSError):
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+        self._evict()
+        return True
+
+    def _entries(self):
+        """Return (last used time, size, path) for every entry in the cache."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz'):
+                entry_path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(entry_path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+        return entries
+
+    def _evict(self):
+        """Remove the least recently used entries until under ``max_size``."""
+        entries = sorted(self._entries())
+        total = sum(entry[1] for entry in entries)
+        for _, size, entry_path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+            total -= size
+
+    @property
+    def size(self):
+        """The total size of the cache in bytes."""
+        if not os.path.isdir(self.directory):
+            return 0
+        return sum(entry[1] for entry in self._entries())
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        if not os.path.isdir(self.directory):
+            return
+        for _, _, entry_path in self._entries():
+            os.remove(entry_path)
@@ -0,0 +1,262 @@
+"""
+Decimation of time series data, for plotting and export.
+
+Each method reduces a `~pandas.DataFrame` with a time index to a fixed number
+of time bins while keeping the features that matter when it is drawn:
+
+* ``'minmax'`` keeps the samples holding the minimum and maximum of each
+  column in each bin, so spikes and dips survive.
+* ``'lttb'`` keeps one sample per bin with the Largest-Triangle-Three-Buckets
+  algorithm, which follows the shape of the curve.
+* ``'mean'`` averages each bin.
+
+The first two return a subset of the original samples.
+"""
+from __future__ import absolute_import, division, print_function
+
+import numbers
+
+import numpy as np
+import pandas as pd
+import matplotlib.dates
+
+__all__ = ['decimate_dataframe', 'plot_decimated']
+
+DECIMATION_METHODS = ('minmax', 'lttb', 'mean')
+
+
+def _index_ns(index):
+    """Return a DatetimeIndex as int64 nanoseconds since the epoch (UTC)."""
+    return np.asarray(index.values, dtype='datetime64[ns]').view(np.int64)
+
+
+def _bin_starts(times, n_bins):
+    """
+    Return the position of the first sample in each non-empty bin, for a
+    sorted array of times split into ``n_bins`` bins of equal duration.
+    """
+    edges = np.linspace(times[0], times[-1], n_bins + 1)[:-1]
+    return np.unique(np.searchsorted(times, edges, side='left'))
+
+
+def _numeric_columns(data):
+    return [column for column in data.columns
+            if np.issubdtype(data[column].dtype, np.number)]
+
+
+def _minmax_positions(values, starts):
+    """
+    Return the positions of the first minimum and first maximum of
+    ``values`` in each bin, ignoring NaNs.
+    """
+    ends = np.append(starts[1:], len(values))
+    positions = []
+    for reduce in (np.fmin, np.fmax):
+        extremes = np.repeat(reduce.reduceat(values, starts), ends - starts)
+        hits = np.flatnonzero(values == extremes)
+        if len(hits) == 0:
+            continue
+        # The first hit at or after the start of each bin, which is only
+        # in the bin if the bin is not entirely NaN.
+        first = hits[np.minimum(np.searchsorted(hits, starts), len(hits) - 1)]
+        positions.append(first[(first >= starts) & (first < ends)])
+    return positions
+
+
+def _lttb_positions(x, y, n_out):
+    """
+    Return the positions of ``n_out`` samples chosen from the non-NaN values
+    of ``y`` with the Largest-Triangle-Three-Buckets algorithm.
+    """
+    valid = np.flatnonzero(~np.isnan(y))
+    if len(valid) <= n_out:
+        return valid
+    x, y = x[valid], y[valid]
+    n = len(x)
+
+    # The first and last points are always kept, the rest are split into
+    # n_out - 2 buckets of (nearly) equal size.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_lo, next_hi = edges[i + 1], edges[i + 2]
+        else:
+            next_lo, next_hi = n - 1, n
+        cx = x[next_lo:next_hi].mean()
+        cy = y[next_lo:next_hi].mean()
+        # Pick the point making the largest triangle with the previously
+        # selected point and the average of the next bucket.
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) -
+                      (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + np.argmax(area)
+        selected[i + 1] = a
+    return valid[selected]
+
+
+def _bin_means(data, times, starts):
+    """Return a DataFrame of the mean of each bin, at the mean time of the bin."""
+    counts = np.diff(np.append(starts, len(times)))
+    offsets = (times - times[0]).astype(np.float64)
+    bin_times = times[0] + (np.add.reduceat(offsets, starts) / counts).astype(np.int64)
+
+    columns = {}
+    numeric = _numeric_columns(data)
+    for column in data.columns:
+        if column in numeric:
+            values = np.asarray(data[column], dtype=np.float64)
+            valid = ~np.isnan(values)
+            sums = np.add.reduceat(np.where(valid, values, 0), starts)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                columns[column] = sums / np.add.reduceat(valid, starts)
+        else:
+            columns[column] = data[column].values[starts]
+
+    index = pd.DatetimeIndex(bin_times.view('datetime64[ns]'), name=data.index.name)
+    if data.index.tz is not None:
+        index = index.tz_localize('UTC').tz_convert(data.index.tz)
+    return pd.DataFrame(columns, index=index, columns=data.columns)
+
+
+def decimate_dataframe(data, n_bins, method='minmax'):
+    """
+    Reduce a time indexed DataFrame to ``n_bins`` time bins.
+
+    Parameters
+    ----------
+    data : `~pandas.DataFrame`
+        The data, with a `~pandas.DatetimeIndex`.
+
+    n_bins : `int`
+        The number of bins (of equal duration for ``'minmax'`` and
+        ``'mean'``, of an equal number of samples for ``'lttb'``).
+
+    method : {'minmax', 'lttb', 'mean'}
+        ``'minmax'`` keeps the minimum and maximum of each column in each bin
+        (up to ``2 * n_bins`` samples per column), ``'lttb'`` keeps
+        ``n_bins`` samples per column chosen with the
+        Largest-Triangle-Three-Buckets algorithm, and ``'mean'`` returns
+        the mean of each bin.
+
+    Returns
+    -------
+    decimated : `~pandas.DataFrame`
+        The decimated data, or a copy of ``data`` if it is already no larger
+        than the output would be.
+    """
+    if method not in DECIMATION_METHODS:
+        raise ValueError("method must be one of {0}".format(DECIMATION_METHODS))
+    n_bins = int(n_bins)
+    if n_bins < (3 if method == 'lttb' else 1):
+        raise ValueError("n_bins is too small for the '{0}' method.".format(method))
+
+    if len(data) <= (2 * n_bins if method == 'minmax' else n_bins):
+        return data.copy()
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+
+    times = _index_ns(data.index)
+    if method == 'mean':
+        return _bin_means(data, times, _bin_starts(times, n_bins))
+
+    numeric = _numeric_columns(data)
+    positions = [np.array([0, len(data) - 1])]
+    if method == 'minmax':
+        starts = _bin_starts(times, n_bins)
+        if not numeric:
+            positions.append(starts)
+        for column in numeric:
+            values = np.asarray(data[column], dtype=np.float64)
+            positions.extend(_minmax_positions(values, starts))
+    else:
+        x = (times - times[0]).astype(np.float64)
+        if not numeric:
+            positions.append(np.linspace(0, len(data) - 1, n_bins).astype(int))
+        for column in numeric:
+            values = np.asarray(data[column], dtype=np.float64)
+            positions.append(_lttb_positions(x, values, n_bins))
+
+    # Samples selected for any column are kept for all of them.
+    return data.iloc[np.unique(np.concatenate(positions))]
+
+
+def plot_decimated(data, axes, decimate=True, method='minmax', **plot_args):
+    """
+    Plot a time indexed DataFrame with `pandas.DataFrame.plot`, decimating it
+    to the resolution of the axes first.
+
+    The lines are decimated again for the visible time range whenever the
+    x limits of the axes change, so zooming in shows the full detail.
+
+    Parameters
+    ----------
+    data : `~pandas.DataFrame`
+        The data to plot.
+
+    axes : `~matplotlib.axes.Axes`
+        The axes to plot on.
+
+    decimate : `bool` or `int`
+        If True, data with many more samples than the axes is wide in pixels
+        is decimated to the width of the axes. A positive integer sets the
+        number of bins to decimate to. False, None or 0 plots every sample.
+
+    method : {'minmax', 'lttb', 'mean'}
+        The decimation method, see `decimate_dataframe`.
+
+    **plot_args : `dict`
+        Passed to `pandas.DataFrame.plot`.
+
+    Returns
+    -------
+    axes : `~matplotlib.axes.Axes`
+        The plot axes.
+    """
+    if decimate is None or decimate is False or decimate == 0:
+        return data.plot(ax=axes, **plot_args)
+    if decimate is not True and not (isinstance(decimate, numbers.Integral) and
+                                     decimate > 0):
+        raise ValueError("decimate must be a bool or a positive integer, "
+                         "not {0!r}".format(decimate))
+
+    def get_n_bins():
+        if decimate is not True:
+            return decimate
+        return max(int(axes.get_window_extent().width), 3)
+
+    if len(data) <= 2 * get_n_bins() or plot_args.get('subplots', False):
+        return data.plot(ax=axes, **plot_args)
+
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+
+    # Plot datetimes directly, rather than as periods, so that the lines can
+    # be given new (irregularly spaced) points when zooming.
+    plot_args.setdefault('x_compat', True)
+    axes = decimate_dataframe(data, get_n_bins(), method).plot(ax=axes, **plot_args)
+
+    columns = _numeric_columns(data)
+    lines = axes.get_lines()[-len(columns):] if columns else []
+    if len(lines) != len(columns):
+        return axes
+
+    def on_xlim_changed(ax):
+        start, end = [pd.Timestamp(matplotlib.dates.num2date(x))
+                      for x in ax.get_xlim()]
+        if data.index.tz is None:
+            start, end = start.tz_convert(None), end.tz_convert(None)
+        first, last = data.index.searchsorted([start, end])
+        # Keep a sample either side so the lines run to the edges.
+        visible = data.iloc[max(first - 1, 0):last + 1]
+        if len(visible) == 0:
+            return
+        decimated = decimate_dataframe(visible, get_n_bins(), method)
+        times = decimated.index.to_pydatetime()
+        for line, column in zip(lines, columns):
+            line.set_data(times, decimated[column].values)
+
+    axes.callbacks.connect('xlim_changed', on_xlim_changed)
+    return axes
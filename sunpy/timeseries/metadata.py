@@ -9,10 +9,116 @@ import copy
 
 import warnings
 import inspect
+from bisect import bisect_left, bisect_right, insort
 
 from sunpy.time import TimeRange, parse_time
 
-class TimeSeriesMetaData:
+
+class _MetaDataList(list):
+    """
+    A list of metadata entries that counts the changes made to it, so a
+    search index built over it can tell when it is out of date.
+    """
+
+    def __init__(self, *args):
+        self.version = 0
+        super(_MetaDataList, self).__init__(*args)
+
+    def _changed(method):
+        def wrapper(self, *args, **kwargs):
+            self.version = getattr(self, 'version', 0) + 1
+            return method(self, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    __setitem__ = _changed(list.__setitem__)
+    __delitem__ = _changed(list.__delitem__)
+    __iadd__ = _changed(list.__iadd__)
+    __imul__ = _changed(list.__imul__)
+    append = _changed(list.append)
+    extend = _changed(list.extend)
+    insert = _changed(list.insert)
+    pop = _changed(list.pop)
+    remove = _changed(list.remove)
+    reverse = _changed(list.reverse)
+    sort = _changed(list.sort)
+    if hasattr(list, 'clear'):
+        clear = _changed(list.clear)
+    if hasattr(list, '__setslice__'):
+        # Python 2 list slice assignment and deletion.
+        __setslice__ = _changed(list.__setslice__)
+        __delslice__ = _changed(list.__delslice__)
+
+    del _changed
+
+
+class _MetaDataIndex(object):
+    """
+    A search index over the entries of a TimeSeriesMetaData object.
+
+    The entries are kept ordered by start time, alongside the running maximum
+    of their end times, so the entries containing a time (or overlapping a
+    time range) are found with two bisections rather than by testing every
+    TimeRange. Column names map to the (sorted) positions of the entries that
+    list them.
+    """
+
+    def __init__(self, metadata):
+        self.order = sorted(range(len(metadata)), key=lambda i: metadata[i][0].start)
+        self.starts = [metadata[i][0].start for i in self.order]
+        self.ends = [metadata[i][0].end for i in self.order]
+        self.maxends = []
+        for end in self.ends:
+            self.maxends.append(max(end, self.maxends[-1]) if self.maxends else end)
+        self.columns = {}
+        for i, entry in enumerate(metadata):
+            for colname in entry[1]:
+                self.columns.setdefault(colname, []).append(i)
+        self.size = len(metadata)
+        # The version of the metadata list the index was built for.
+        self.version = getattr(metadata, 'version', None)
+        # True if the entries are stored in start time order.
+        self.is_sorted = all(i == pos for i, pos in enumerate(self.order))
+
+    def insert(self, pos, entry):
+        """
+        Update the index for ``entry`` being inserted at ``pos``, for entries
+        stored in start time order.
+        """
+        start, end = entry[0].start, entry[0].end
+        self.starts.insert(pos, start)
+        self.ends.insert(pos, end)
+        self.maxends.insert(pos, max(end, self.maxends[pos - 1]) if pos else end)
+        for k in range(pos + 1, len(self.maxends)):
+            if self.maxends[k] >= end:
+                break
+            self.maxends[k] = end
+        self.order.append(self.size)
+        self.size += 1
+
+        # Shift the positions of the entries after the new one.
+        for positions in self.columns.values():
+            first = bisect_left(positions, pos)
+            positions[first:] = [i + 1 for i in positions[first:]]
+        for colname in entry[1]:
+            insort(self.columns.setdefault(colname, []), pos)
+
+    def overlapping(self, start, end):
+        """
+        Return the sorted positions of all entries overlapping the time range
+        from ``start`` to ``end`` (inclusive).
+        """
+        # Entries starting after the end are excluded by the start order, and
+        # those before the first running maximum reaching ``start`` all end
+        # before it.
+        first = bisect_left(self.maxends, start)
+        last = bisect_right(self.starts, end)
+        return sorted(self.order[k] for k in range(first, last)
+                      if self.ends[k] >= start)
+
+
+class TimeSeriesMetaData(object):
     """
     An object used to store metadata for TimeSeries objects that enables multiple
     TimeSeries metadata to be concatenated in an organised fashion.
@@ -51,7 +157,7 @@ class TimeSeriesMetaData:
                 self.metadata.append(meta)
             elif isinstance(meta, list):
                 # Given a complex metadata list (of tuples)
-                self.metadata = copy.copy(meta)
+                self.metadata = meta
         else:
             # In the event no metadata dictionary is sent we default to something usable
             if isinstance(timerange, TimeRange) and isinstance(colnames, list):
@@ -62,6 +168,28 @@ class TimeSeriesMetaData:
             else:
                 raise ValueError("You cannot create a TimeSeriesMetaData object without specifying a TimeRange")
 
+    @property
+    def metadata(self):
+        """
+        The list of ( TimeRange, [ colnames ], MetaDict(metadata) ) tuples.
+
+        Assigning a list stores a copy of it. The search index is rebuilt
+        after any change to the list, so entries can be replaced in place, but
+        the colname lists of the entries should be replaced rather than edited.
+        """
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata):
+        self._metadata = _MetaDataList(metadata)
+        self._index = None
+
+    def _get_index(self):
+        """Return the search index, building it if it is missing or stale."""
+        if self._index is None or self._index.version != self._metadata.version:
+            self._index = _MetaDataIndex(self._metadata)
+        return self._index
+
     def __eq__(self, other):
         """
         Check two TimeSeriesMetaData objects are the same, they have the same
@@ -126,14 +254,19 @@ class TimeSeriesMetaData:
         metadata = MetaDict(metadata)
 
         # Check the types are correct.
-        pos = 0
-        if isinstance(timerange, TimeRange):
+        if not isinstance(timerange, TimeRange):
+            raise ValueError(
+                'Incorrect datatime or data for append to TimeSeriesMetaData.')
+
+        # Find the position after all entries starting before this one.
+        index = self._get_index()
+        if index.is_sorted:
+            pos = bisect_left(index.starts, timerange.start)
+        else:
+            pos = 0
             for i, meta in enumerate(self.metadata):
                 if timerange.start > meta[0].start:
                     pos = i + 1
-        else:
-            raise ValueError(
-                'Incorrect datatime or data for append to TimeSeriesMetaData.')
 
         # Prepare tuple to append.
         new_metadata = (timerange, columns, metadata)
@@ -148,6 +281,11 @@ class TimeSeriesMetaData:
         # Insert into the given position
         if not duplicate:
             self.metadata.insert(pos, new_metadata)
+            if index.is_sorted:
+                index.insert(pos, new_metadata)
+                index.version = self.metadata.version
+            else:
+                self._index = None
 
     def find_indices(self, time=None, colname=None, **kwargs):
         """
@@ -173,24 +311,19 @@ class TimeSeriesMetaData:
         list : `list`
             A list of integers that contain all matching metadata.
         """
-        # Parameters
-        dt = time
-        if not dt:
-            dt = False
-        elif isinstance(dt, str):
-            dt = parse_time(dt)
+        index = self._get_index()
 
         # Find all results with suitable timerange.
-        results_indices = []
-        for i, meta in enumerate(self.metadata):
-            if dt in meta[0] or not(dt):
-                results_indices.append(i)
-
-        # Filter out only those with the correct column.
-        results = []
-        for i in results_indices:
-            if (colname in self.metadata[i][1]) or (not colname):
-                results.append(i)
+        if time:
+            dt = parse_time(time)
+            results = index.overlapping(dt, dt)
+            # Filter out only those with the correct column.
+            if colname:
+                results = [i for i in results if colname in self.metadata[i][1]]
+        elif colname:
+            results = list(index.columns.get(colname, []))
+        else:
+            results = list(range(len(self.metadata)))
 
         return results
 
@@ -288,25 +421,35 @@ class TimeSeriesMetaData:
         # Return a TimeSeriesMetaData object
         return TimeSeriesMetaData(meta=metadata)
 
-    def concatenate(self, tsmetadata2, **kwargs):
+    def concatenate(self, others, **kwargs):
         """
-        Combine the metadata from a TimeSeriesMetaData object with the current
-        TimeSeriesMetaData and return as a new TimeSeriesMetaData object.
+        Combine the metadata from one or more TimeSeriesMetaData objects with
+        the current TimeSeriesMetaData and return as a new TimeSeriesMetaData
+        object.
 
         Parameters
         ----------
-        tsmetadata2 : `~sunpy.timeseries.TimeSeriesMetaData`
-            The second TimeSeriesMetaData object.
+        others : `~sunpy.timeseries.TimeSeriesMetaData` or `list`
+            The second TimeSeriesMetaData object, or a list of them.
         """
-        # Create a copy of the metadata
-        meta = TimeSeriesMetaData(copy.copy(self.metadata))
-
-        # Append each metadata entry from the second TimeSeriesMetaData object
-        # to the original TimeSeriesMetaData object.
-        for entry in tsmetadata2.metadata:
-            meta.append(entry[0], entry[1], entry[2])
-
-        return meta
+        if isinstance(others, TimeSeriesMetaData):
+            others = [others]
+
+        # Gather the new entries in one pass, skipping any that duplicate an
+        # entry already present (same TimeRange and colnames), then order the
+        # lot chronologically with a single stable sort.
+        metadata = copy.copy(self.metadata)
+        seen = set((entry[0].start, entry[0].end, tuple(entry[1]))
+                   for entry in metadata)
+        for tsmetadata in others:
+            for entry in tsmetadata.metadata:
+                key = (entry[0].start, entry[0].end, tuple(entry[1]))
+                if key not in seen:
+                    seen.add(key)
+                    metadata.append((entry[0], entry[1], MetaDict(entry[2])))
+        metadata.sort(key=lambda entry: entry[0].start)
+
+        return TimeSeriesMetaData(metadata)
 
     def update(self, dictionary, time=None, colname=None, row=None, overwrite=False, **kwargs):
         """
@@ -358,8 +501,23 @@ class TimeSeriesMetaData:
         timerange : `sunpy.time.TimeRange`
             Either a time range to truncate to.
         """
+        self.metadata = self._truncated_entries(timerange)
+
+    def _truncated_entries(self, timerange):
+        """Returns the metadata entries truncated to the given TimeRange, as
+        for `_truncate`, without changing this object. The MetaDicts are
+        shared with this object.
+
+        Parameters
+        ----------
+        timerange : `sunpy.time.TimeRange`
+            Either a time range to truncate to.
+        """
+        # Only entries overlapping the new time range are kept.
+        overlapping = self._get_index().overlapping(timerange.start, timerange.end)
+
         truncated = []
-        for metatuple in self.metadata:
+        for metatuple in (self.metadata[i] for i in overlapping):
             # Get metadata time range parameters
             start = metatuple[0].start
             end   = metatuple[0].end
@@ -381,20 +539,15 @@ class TimeSeriesMetaData:
 
             # Add the values if applicable
             if not out_of_range:
-                truncated.append((TimeRange(start, end), metatuple[1], metatuple[2]))
+                truncated.append((TimeRange(start, end), list(metatuple[1]), metatuple[2]))
 
-        # Update the original list
-        self.metadata = truncated
+        return truncated
 
     @property
     def columns(self):
         """Returns a list of all the names of the columns in the metadata."""
-        all_cols = set()
-        for metatuple in self.metadata:
-            all_cols.update(metatuple[1])
-        all_cols = list(all_cols)
-        all_cols.sort()
-        return all_cols
+        columns = self._get_index().columns
+        return sorted(colname for colname in columns if columns[colname])
 
     @property
     def metas(self):
@@ -445,17 +598,15 @@ class TimeSeriesMetaData:
         if isinstance(colnames, str):
             colnames = [ colnames ]
 
-        # Create a new list with all metadata entries without colnames
+        # Create a new list with all metadata entries without colnames. The
+        # colname lists may be shared with other TimeSeriesMetaData objects,
+        # so new lists are made rather than changing them.
         reduced = []
         for metatuple in self.metadata:
-            # Check each colname
-            for colname in colnames:
-                if colname in metatuple[1]:
-                    # Removed from the list.
-                    metatuple[1].remove(colname)
+            remaining = [colname for colname in metatuple[1] if colname not in colnames]
             # Add the column if it still has some columns listed
-            if len(metatuple[1]) > 0:
-                reduced.append(metatuple)
+            if len(remaining) > 0:
+                reduced.append((metatuple[0], remaining, metatuple[2]))
 
         # Update the original list
         self.metadata = reduced
@@ -481,6 +632,7 @@ class TimeSeriesMetaData:
 
             # Replace values
             self.metadata[i] = ( self.metadata[i][0], colnames, self.metadata[i][2] )
+        self._index = None
 
     def _validate_meta(self, meta):
         """
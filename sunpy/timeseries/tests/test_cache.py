@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function
+
+import os
+import shutil
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import astropy.units as u
+
+import sunpy
+import sunpy.data.test
+import sunpy.timeseries
+from sunpy.timeseries.cache import ParsedFile, ParsedFileCache
+from sunpy.util.metadata import MetaDict
+
+filepath = sunpy.data.test.rootdir
+fermi_gbm_filepath = os.path.join(filepath, 'gbm.fits')
+
+
+def make_parsed_file(n=1000, value=1.0):
+    index = pd.date_range('2012-06-01', periods=n, freq='1s', name='time')
+    data = pd.DataFrame({'flux': np.full(n, value), 'flag': np.arange(n) % 2 == 0},
+                        index=index, columns=['flux', 'flag'])
+    meta = MetaDict(OrderedDict([('TELESCOP', 'TEST'), ('COMMENT', 'a comment')]))
+    units = OrderedDict([('flux', u.W / u.m**2), ('flag', u.dimensionless_unscaled)])
+    return ParsedFile(data, meta, units)
+
+
+@pytest.fixture
+def source_file(tmpdir):
+    path = tmpdir.join('source.txt')
+    path.write('data')
+    return str(path)
+
+
+def test_cache_round_trip(tmpdir, source_file):
+    cache = ParsedFileCache(str(tmpdir.join('cache')), 10 * 1024**2)
+    assert cache.get(source_file) is None
+
+    parsed = make_parsed_file()
+    assert cache.put(source_file, parsed)
+    cached = cache.get(source_file)
+    pd.testing.assert_frame_equal(cached.data, parsed.data)
+    assert cached.meta == parsed.meta
+    assert cached.units == parsed.units
+
+    # The source it was read as is part of the key
+    assert cache.get(source_file, source='other') is None
+
+
+def test_cache_invalidated_by_change(tmpdir, source_file):
+    cache = ParsedFileCache(str(tmpdir.join('cache')), 10 * 1024**2)
+    cache.put(source_file, make_parsed_file())
+    with open(source_file, 'a') as fp:
+        fp.write('more data')
+    assert cache.get(source_file) is None
+
+
+def test_cache_eviction(tmpdir):
+    cache = ParsedFileCache(str(tmpdir.join('cache')), 10 * 1024**2)
+    paths = []
+    for i in range(3):
+        path = tmpdir.join('source{0}.txt'.format(i))
+        path.write('data')
+        paths.append(str(path))
+        cache.put(paths[-1], make_parsed_file(value=i))
+        os.utime(cache._entry_path(paths[-1]), (1000 + i, 1000 + i))
+    entry_size = cache.size // 3
+
+    # Using the oldest entry makes the second one the least recently used.
+    assert cache.get(paths[0]) is not None
+    cache.max_size = 3 * entry_size
+    path = tmpdir.join('source3.txt')
+    path.write('data')
+    cache.put(str(path), make_parsed_file(value=3))
+    assert cache.get(paths[1]) is None
+    assert cache.get(paths[0]) is not None
+    assert cache.get(paths[2]) is not None
+    assert cache.size <= cache.max_size
+
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_unsupported_data_not_cached(tmpdir, source_file):
+    cache = ParsedFileCache(str(tmpdir.join('cache')), 10 * 1024**2)
+    parsed = make_parsed_file()
+    data = parsed.data.reset_index(drop=True)
+    assert not cache.put(source_file, ParsedFile(data, parsed.meta, parsed.units))
+    assert cache.get(source_file) is None
+
+
+def test_factory_uses_cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(sunpy.config, 'get', _config_get(str(tmpdir.join('cache'))))
+    path = str(tmpdir.join('gbm.fits'))
+    shutil.copy(fermi_gbm_filepath, path)
+
+    uncached = sunpy.timeseries.TimeSeries(path)
+    first = sunpy.timeseries.TimeSeries(path, cache=True)
+    assert len(os.listdir(str(tmpdir.join('cache')))) == 1
+
+    # A second read of the unchanged file does not parse it
+    def fail(*args, **kwargs):
+        raise AssertionError("File parsed again")
+    monkeypatch.setattr(sunpy.timeseries.GBMSummaryTimeSeries, '_parse_hdus', fail)
+    second = sunpy.timeseries.TimeSeries(path, cache=True)
+
+    for ts in (first, second):
+        assert isinstance(ts, sunpy.timeseries.GBMSummaryTimeSeries)
+        pd.testing.assert_frame_equal(ts.data, uncached.data)
+        assert ts.units == uncached.units
+        assert ts.meta.metas == uncached.meta.metas
+
+
+def _config_get(cache_dir):
+    get = sunpy.config.get
+
+    def config_get(section, option, *args, **kwargs):
+        if (section, option) == ('timeseries', 'cache_dir'):
+            return cache_dir
+        return get(section, option, *args, **kwargs)
+    return config_get
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function
+
+import datetime
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import matplotlib.dates
+
+import astropy.units as u
+
+import sunpy.timeseries
+from sunpy.timeseries.decimation import decimate_dataframe
+from sunpy.util.metadata import MetaDict
+
+
+@pytest.fixture
+def noisy_data():
+    # A day of 1 s data, with a single spike and dip in each column.
+    times = pd.date_range('2012-06-01', periods=86400, freq='1s')
+    np.random.seed(0)
+    data = pd.DataFrame({'a': np.random.normal(size=86400),
+                         'b': np.sin(np.linspace(0, 20, 86400))},
+                        index=times, columns=['a', 'b'])
+    data.iloc[12345, 0] = 100.0
+    data.iloc[54321, 0] = -100.0
+    data.iloc[70000, 1] = np.nan
+    return data
+
+
+def test_small_data_unchanged(noisy_data):
+    small = noisy_data.iloc[:100]
+    assert (decimate_dataframe(small, 50) == small).all().all()
+    assert decimate_dataframe(small, 50) is not small
+
+
+def test_invalid_method(noisy_data):
+    with pytest.raises(ValueError):
+        decimate_dataframe(noisy_data, 100, method='median')
+    with pytest.raises(ValueError):
+        decimate_dataframe(noisy_data, 2, method='lttb')
+
+
+def test_minmax(noisy_data):
+    decimated = decimate_dataframe(noisy_data, 500)
+    assert len(decimated) <= 2 * 500 * 2 + 2
+    # Only original samples, and the extremes of every bin are kept
+    assert decimated.index.isin(noisy_data.index).all()
+    assert decimated.index.is_monotonic_increasing
+    assert decimated.index[0] == noisy_data.index[0]
+    assert decimated.index[-1] == noisy_data.index[-1]
+    assert decimated['a'].max() == 100.0
+    assert decimated['a'].min() == -100.0
+    bins = pd.cut(noisy_data.index.asi8, np.linspace(noisy_data.index.asi8[0], noisy_data.index.asi8[-1], 501),
+                  include_lowest=True, labels=False)
+    for column in ['a', 'b']:
+        expected = noisy_data[column].groupby(bins).agg(['min', 'max'])
+        kept = decimated[column].groupby(bins[noisy_data.index.isin(decimated.index)]).agg(['min', 'max'])
+        np.testing.assert_array_equal(kept.values, expected.values)
+
+
+def test_lttb(noisy_data):
+    decimated = decimate_dataframe(noisy_data[['b']], 300, method='lttb')
+    assert len(decimated) == 300
+    assert decimated.index.isin(noisy_data.index).all()
+    assert decimated.index[0] == noisy_data.index[0]
+    assert decimated.index[-1] == noisy_data.index[-1]
+    # The shape of the sine wave is followed closely
+    assert decimated['b'].max() > 0.999
+    assert decimated['b'].min() < -0.999
+
+
+def test_mean(noisy_data):
+    decimated = decimate_dataframe(noisy_data, 24, method='mean')
+    assert len(decimated) == 24
+    expected = noisy_data.resample('1h').mean()
+    np.testing.assert_allclose(decimated.values, expected.values, atol=1e-3)
+    assert (abs(decimated.index - expected.index - pd.Timedelta('30min')) < pd.Timedelta('1s')).all()
+
+
+def test_timeseries_decimate(noisy_data):
+    meta = MetaDict({'key': 'value'})
+    units = OrderedDict([('a', u.W/u.m**2), ('b', u.W/u.m**2)])
+    ts = sunpy.timeseries.TimeSeries(noisy_data, meta, units)
+    decimated = ts.decimate(100, method='lttb')
+    assert isinstance(decimated, ts.__class__)
+    assert len(decimated.data) <= 200
+    assert decimated.meta.metas == ts.meta.metas
+    assert decimated.units == ts.units
+
+
+def test_plot_decimates_and_refines_on_zoom(noisy_data):
+    ts = sunpy.timeseries.TimeSeries(noisy_data, MetaDict({'key': 'value'}))
+    figure = plt.figure(figsize=(4, 3), dpi=100)
+    axes = ts.plot(axes=figure.gca(), decimate=True)
+    lines = axes.get_lines()
+    assert len(lines) == 2
+    assert len(lines[0].get_xdata()) < 2000
+    assert np.nanmax(lines[0].get_ydata()) == 100.0
+
+    # Zoom in on an hour, the lines are recomputed for the visible range
+    start = datetime.datetime(2012, 6, 1, 3)
+    end = datetime.datetime(2012, 6, 1, 4)
+    axes.set_xlim(matplotlib.dates.date2num(start), matplotlib.dates.date2num(end))
+    xdata = lines[0].get_xdata()
+    assert len(xdata) <= 3602
+    assert pd.Timestamp(xdata[1]) >= pd.Timestamp(start)
+    assert pd.Timestamp(xdata[-2]) <= pd.Timestamp(end)
+    plt.close(figure)
+
+    figure = plt.figure()
+    axes = ts.plot(axes=figure.gca(), decimate=False)
+    assert len(axes.get_lines()[0].get_xdata()) == len(noisy_data)
+    plt.close(figure)
+
+
+@pytest.mark.parametrize('decimate', [None, False, 0])
+def test_plot_without_decimation(noisy_data, decimate):
+    ts = sunpy.timeseries.TimeSeries(noisy_data, MetaDict({'key': 'value'}))
+    figure = plt.figure()
+    kwargs = {} if decimate is None else {'decimate': decimate}
+    axes = ts.plot(axes=figure.gca(), **kwargs)
+    assert len(axes.get_lines()[0].get_xdata()) == len(noisy_data)
+    plt.close(figure)
+
+
+def test_plot_decimate_bins(noisy_data):
+    ts = sunpy.timeseries.TimeSeries(noisy_data, MetaDict({'key': 'value'}))
+    figure = plt.figure()
+    axes = ts.plot(axes=figure.gca(), decimate=100)
+    assert len(axes.get_lines()[0].get_xdata()) <= 2 * 100 * 2 + 2
+    with pytest.raises(ValueError):
+        ts.plot(axes=figure.gca(), decimate=-1)
+    plt.close(figure)
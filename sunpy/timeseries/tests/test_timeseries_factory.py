@@ -312,6 +312,30 @@ class TestTimeSeries(object):
         assert isinstance(ts_concat_3, sunpy.timeseries.timeseriesbase.GenericTimeSeries)
         assert ts_concat_1 == ts_concat_2 == ts_concat_3
 
+    def test_concatenate_many(self):
+        # Three consecutive days of data, given out of order
+        base = datetime.datetime(2012, 6, 1)
+        series = []
+        for day in [2, 0, 1]:
+            times = [base + datetime.timedelta(days=day, minutes=x) for x in range(0, 24 * 60)]
+            data = DataFrame(np.arange(24 * 60) + day, index=times, columns=['intensity'])
+            meta = MetaDict({'day': day})
+            units = OrderedDict([('intensity', u.W/u.m**2)])
+            series.append(sunpy.timeseries.TimeSeries(data, meta, units))
+
+        ts_many = sunpy.timeseries.TimeSeries.concatenate_many(series)
+        assert ts_many.data.index.is_monotonic_increasing
+        assert len(ts_many.data) == 3 * 24 * 60
+        assert [meta['day'] for meta in ts_many.meta.metas] == [0, 1, 2]
+
+        # The same result as folding the series together two at a time
+        ts_pairwise = series[0].concatenate(series[1]).concatenate(series[2])
+        assert ts_many == ts_pairwise
+        assert sunpy.timeseries.TimeSeries(series, concatenate=True) == ts_many
+
+        # Passing the same object twice does not duplicate its data
+        assert len(series[0].concatenate([series[0], series[1]]).data) == 2 * 24 * 60
+
     def test_table_to_ts(self):
         # Generate the data and the corresponding dates
         base = datetime.datetime.today()
@@ -761,6 +761,38 @@ def test_ts_index(generic_ts):
 def test_ts_sort_index(generic_ts):
     assert generic_ts.sort_index().data.equals(generic_ts.data.sort_index())
 
+
+def test_windows_match_truncate(generic_ts):
+    time_ranges = generic_ts.time_range.window(3 * 60 * u.s, 10 * 60 * u.s)
+    windows = list(generic_ts.windows(time_ranges))
+    assert len(windows) == len(time_ranges)
+    for tr, window in zip(time_ranges, windows):
+        truncated = generic_ts.truncate(tr)
+        assert isinstance(window, generic_ts.__class__)
+        assert_frame_equal(window.data, truncated.data)
+        assert window.units == truncated.units
+        assert window.meta == truncated.meta
+
+
+def test_windows_metadata_is_lazy(generic_ts):
+    window = next(generic_ts.iter_windows(60 * u.s, 5 * 60 * u.s))
+    assert window._meta_factory is not None
+    assert window.meta.time_range == TimeRange(window.data.index[0], window.data.index[-1])
+    assert window._meta_factory is None
+    # The metadata is a copy, not shared with the original
+    window.meta.metadata[0][2]['key'] = 'changed'
+    assert generic_ts.meta.metadata[0][2]['key'] == 'value'
+
+
+def test_iter_windows(generic_ts):
+    windows = list(generic_ts.iter_windows(datetime.timedelta(hours=1), 2 * 60 * 60 * u.s))
+    expected = generic_ts.time_range.window(60 * 60 * u.s, 2 * 60 * 60 * u.s)
+    assert len(windows) == len(expected)
+    for tr, window in zip(expected, windows):
+        assert window.data.index[0] == tr.start
+        assert window.data.index[-1] <= tr.end
+        assert len(window.data) == 121 or window.data.index[-1] == generic_ts.data.index.max()
+
 #_validate_units
 
 #_validate_meta
@@ -769,3 +801,31 @@ def test_ts_sort_index(generic_ts):
 ###Extracting column as quantity or array#ts_eve = ts_eve.add_column(colname, qua_new, overwrite=True)
 ###Updating a column using quantity or array#ts_eve = ts_eve.add_column(colname, qua_new, overwrite=True)
 ###Updating the units# ts_eve = ts_eve.add_column(colname, qua_new, unit=unit, overwrite=True)
+
+
+def test_extract_keeps_metadata_index_current(generic_ts):
+    data = DataFrame({'a': generic_ts.data['intensity'], 'b': generic_ts.data['intensity']})
+    ts = sunpy.timeseries.TimeSeries(data, MetaDict({'key': 'value'}),
+                                     OrderedDict([('a', u.W), ('b', u.W)]))
+    assert ts.meta.columns == ['a', 'b']
+
+    extracted = ts.extract('a')
+    assert extracted.meta.columns == ['a']
+    assert extracted.meta.find_indices(colname='b') == []
+    # The original series keeps its columns, and its metadata agrees
+    assert ts.meta.columns == ['a', 'b']
+    assert ts.meta.find_indices(colname='b') == [0]
+    assert ts.meta.metadata[0][1] == ['a', 'b']
+
+
+def test_concatenate_keeps_own_metadata_on_duplicates():
+    def make_ts(start, key):
+        index = pd.date_range(start, periods=10, freq='min')
+        return sunpy.timeseries.TimeSeries(DataFrame({'a': np.arange(10.)}, index=index),
+                                           MetaDict({'key': key}), OrderedDict([('a', u.W)]))
+
+    later = make_ts('2012-01-02', 'own')
+    other = make_ts('2012-01-01', 'earlier').concatenate(make_ts('2012-01-02', 'other'))
+    combined = later.concatenate(other)
+    assert len(combined.data) == 30
+    assert combined.meta.get('key').values() == ['earlier', 'own']
@@ -154,6 +154,12 @@ def test_concatenate(basic_ascending_append_md, basic_4_md, complex_append_md):
     concatenated = concatenated.concatenate(basic_4_md)
     assert concatenated == complex_append_md
 
+def test_concatenate_many(basic_1_md, basic_2_md, basic_3_md, basic_4_md, complex_append_md):
+    concatenated = basic_3_md.concatenate([basic_2_md, basic_4_md, basic_1_md])
+    assert concatenated == complex_append_md
+    # Entries already present are not added a second time
+    assert concatenated.concatenate([basic_1_md, basic_4_md]) == complex_append_md
+
 
 #==============================================================================
 # Test TimeSeriesMetaData Truncation
@@ -263,6 +269,32 @@ def test_find_both_filters(basic_2_md, basic_4_md, complex_append_md):
     assert complex_append_md.find(time='2010-01-02 20:59:57.468999', colname='column2') == basic_2_md
     assert complex_append_md.find(time='2010-01-02 20:59:57.468999', colname='md4_column1') == basic_4_md
 
+def test_find_indices_matches_linear_search():
+    # Many entries, one long one overlapping all the others and some given
+    # out of order, checked against testing every TimeRange in turn.
+    entries = [(TimeRange('2010-01-01 00:00', '2010-02-01 00:00'), ['long'], MetaDict())]
+    for day in [5, 1, 3, 2, 4, 9, 7, 8, 6]:
+        tr = TimeRange('2010-01-{0:02d} 00:00'.format(day), '2010-01-{0:02d} 12:00'.format(day))
+        entries.append((tr, ['day', 'day{0}'.format(day % 2)], MetaDict({'day': day})))
+    md = TimeSeriesMetaData(entries)
+    md.append(TimeRange('2010-01-03 06:00', '2010-01-05 06:00'), ['day1'], MetaDict())
+
+    for time in ['2009-12-31 12:00', '2010-01-01 00:00', '2010-01-03 06:00',
+                 '2010-01-04 18:00', '2010-01-05 12:00', '2010-02-01 00:00']:
+        for colname in [None, 'long', 'day', 'day1', 'missing']:
+            expected = [i for i, entry in enumerate(md.metadata)
+                        if time in entry[0] and (not colname or colname in entry[1])]
+            assert md.find_indices(time=time, colname=colname) == expected
+
+def test_find_after_append_and_truncate(basic_ascending_append_md, basic_2_md, basic_4_md):
+    md = copy.deepcopy(basic_ascending_append_md)
+    md.append(*basic_4_md.metadata[0])
+    assert md.find(time='2010-01-02 20:59:57.468999', colname='md4_column1') == basic_4_md
+    md._truncate(TimeRange('2010-01-02 20:00:00', '2010-01-02 22:00:00'))
+    assert md.columns == ['column1', 'column2', 'md4_column1', 'md4_column2']
+    assert len(md.find(colname='column1').metadata) == 1
+    assert md.find(colname='column1').metas == basic_2_md.metas
+
 
 #==============================================================================
 # Test TimeSeriesMetaData get and update methods
@@ -432,4 +464,29 @@ def test_validate_meta_good(complex_append_md):
 def test_validate_meta_interleaved(basic_1_md, overlap_and_interleave_with_basic_1_md):
     concatenated = copy.deepcopy(basic_1_md)
     concatenated = concatenated.concatenate(overlap_and_interleave_with_basic_1_md)
-    assert concatenated._validate_meta(concatenated)
\ No newline at end of file
+    assert concatenated._validate_meta(concatenated)
+
+def test_remove_columns_from_shared_entries(complex_append_md):
+    # Copies of the metadata share the entries and their column name lists.
+    copied = TimeSeriesMetaData(copy.copy(complex_append_md.metadata))
+    columns = complex_append_md.columns
+    indices = complex_append_md.find_indices(colname=columns[0])
+    assert copied.columns == columns
+
+    copied._remove_columns([columns[0]])
+    assert copied.columns == columns[1:]
+    assert copied.find_indices(colname=columns[0]) == []
+    assert complex_append_md.columns == columns
+    assert complex_append_md.find_indices(colname=columns[0]) == indices
+
+def test_find_after_entry_replaced(complex_append_md):
+    md = copy.deepcopy(complex_append_md)
+    time = md.metadata[0][0].start
+    assert md.find_indices(time=time) == [0]
+
+    # Replacing an entry in place keeps the length, but not the old index.
+    entry = md.metadata[-1]
+    md.metadata[0] = (entry[0], ['new'], entry[2])
+    assert md.find_indices(time=time) == []
+    assert md.find_indices(colname='new') == [0]
+    assert 'new' in md.columns
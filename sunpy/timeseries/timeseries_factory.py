@@ -16,6 +16,7 @@ import astropy.units as u
 
 import sunpy
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries, TIMESERIES_CLASSES
+from sunpy.timeseries.cache import ParsedFile, ParsedFileCache
 from sunpy.util.metadata import MetaDict
 from sunpy.time import parse_time
 
@@ -56,7 +57,13 @@ class TimeSeriesFactory(BasicRegistrationFactory):
 
     concatenate : `bool`, optional, default:False
         If set, combine any resulting list of TimeSeries objects into a single
-        TimeSeries, using successive concatenate methods.
+        TimeSeries, using `~sunpy.timeseries.TimeSeriesFactory.concatenate_many`.
+
+    cache : `bool`, optional
+        If set, keep the data parsed from each source file in an on-disk
+        cache (see `~sunpy.timeseries.cache.ParsedFileCache`), and read it
+        from there the next time the unchanged file is given. Defaults to the
+        ``cache`` option in the ``[timeseries]`` section of the sunpyrc.
 
     Examples
     --------
@@ -109,10 +116,39 @@ class TimeSeriesFactory(BasicRegistrationFactory):
     >>> my_timeseries = sunpy.timeseries.TimeSeries((data, header), data2, header2, 'file1.fits', url, 'eit_*.fits')   # doctest: +SKIP
     """
 
+    _parsed_file_cache = None
+
+    def _get_parsed_file_cache(self, cache=None):
+        """
+        Return the parsed file cache if it is in use, otherwise None.
+
+        Parameters
+        ----------
+
+        cache : `bool` or None
+            Whether to use the cache. If None the ``[timeseries]`` section of
+            the sunpyrc decides.
+        """
+        if cache is None:
+            cache = sunpy.config.getboolean('timeseries', 'cache')
+        if not cache:
+            return None
+
+        directory = sunpy.config.get('timeseries', 'cache_dir')
+        max_size = int(float(sunpy.config.get('timeseries', 'cache_size')) * 1024**2)
+        if (self._parsed_file_cache is None or
+                self._parsed_file_cache.directory != os.path.abspath(directory)):
+            self._parsed_file_cache = ParsedFileCache(directory, max_size)
+        self._parsed_file_cache.max_size = max_size
+        return self._parsed_file_cache
+
     def _read_file(self, fname, **kwargs):
         """
         Test reading a file with sunpy.io for automatic source detection.
 
+        If the parsed file cache is in use the file is parsed completely, and
+        the result taken from (or added to) the cache.
+
         Parameters
         ----------
 
@@ -126,10 +162,22 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         parsed :  bool
             True if file has been reading
 
-        pairs : list or string
+        pairs : list or string or `~sunpy.timeseries.cache.ParsedFile`
             List of (data, header) pairs if ``parsed`` is ``True`` or ``fname``
-            if ``False``
+            if ``False``. The (data, meta, units) from the file if it was
+            parsed using the parsed file cache.
         """
+        parsed_file_cache = self._get_parsed_file_cache(kwargs.pop('cache', None))
+        if parsed_file_cache is not None:
+            source = kwargs.get('source', None)
+            parsed = parsed_file_cache.get(fname, source=source)
+            if parsed is None:
+                parsed = self._parse_whole_file(fname, **kwargs)
+                if parsed is not None:
+                    parsed_file_cache.put(fname, parsed, source=source)
+            if parsed is not None:
+                return True, parsed
+
         if 'source' not in kwargs.keys() or not kwargs['source']:
             try:
                 pairs = read_file(fname, **kwargs)
@@ -147,6 +195,64 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         else:
             return False, fname
 
+    def _parse_whole_file(self, fname, **kwargs):
+        """
+        Read and parse a file with the matching TimeSeries source class.
+
+        Returns
+        -------
+
+        parsed : `~sunpy.timeseries.cache.ParsedFile` or None
+            The (data, meta, units) from the file, or None if no single source
+            class matches it.
+        """
+        read, result = self._read_file(fname, cache=False, **kwargs)
+        try:
+            if read:
+                return ParsedFile(*self._parse_hdu_pairs(result, **kwargs))
+            WidgetType = self._get_matching_widget(filepath=fname, **kwargs)
+            return ParsedFile(*WidgetType._parse_file(fname))
+        except (NoMatchError, MultipleMatchError, ValidationFunctionError):
+            return None
+
+    def _parse_hdu_pairs(self, pairs, **kwargs):
+        """
+        Find the TimeSeries class matching the HDUs read by sunpy.io from a
+        file, and parse them with it.
+
+        Returns
+        -------
+
+        triple : `tuple`
+            The (data, header, units) parsed from the HDUs.
+        """
+        # Pairs may be x long where x is the number of HDUs in the file.
+        headers = [pair.header for pair in pairs]
+
+        types = []
+        for header in headers:
+            try:
+                match = self._get_matching_widget(meta=header, **kwargs)
+                if not match == GenericTimeSeries:
+                    types.append(match)
+            except (MultipleMatchError, NoMatchError):
+                continue
+
+        if not types:
+            # If no specific classes have been found we can read the data
+            # if we only have one data header pair:
+            if len(pairs) == 1:
+                return pairs[0].data, pairs[0].header, OrderedDict()
+            else:
+                raise NoMatchError("Input read by sunpy.io can not find a "
+                                   "matching class for reading multiple HDUs")
+        if len(set(types)) > 1:
+            raise MultipleMatchError("Multiple HDUs return multiple matching classes.")
+
+        cls = types[0]
+
+        return cls._parse_hdus(pairs)
+
     def _validate_meta(self, meta):
         """
         Validate a meta argument for use as metadata.
@@ -315,7 +421,9 @@ class TimeSeriesFactory(BasicRegistrationFactory):
 
                 read, result = self._read_file(path, **kwargs)
 
-                if read:
+                if isinstance(result, ParsedFile):
+                    data_header_unit_tuples.append(result)
+                elif read:
                     data_header_pairs.append(result)
                 else:
                     filepaths.append(result)
@@ -330,7 +438,9 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                     # returns a boolean telling us if it were read and either a
                     # tuple or the original filepath for reading by a source
                     read, result = self._read_file(afile, **kwargs)
-                    if read:
+                    if isinstance(result, ParsedFile):
+                        data_header_unit_tuples.append(result)
+                    elif read:
                         data_header_pairs.append(result)
                     else:
                         filepaths.append(result)
@@ -345,7 +455,9 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                     # returns a boolean telling us if it were read and either a
                     # tuple or the original filepath for reading by a source
                     read, result = self._read_file(afile, **kwargs)
-                    if read:
+                    if isinstance(result, ParsedFile):
+                        data_header_unit_tuples.append(result)
+                    elif read:
                         data_header_pairs.append(result)
                     else:
                         filepaths.append(result)
@@ -360,9 +472,13 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                 default_dir = sunpy.config.get("downloads", "download_dir")
                 url = arg
                 path = download_file(url, default_dir)
-                pairs = self._read_file(path, **kwargs)
-                #data_header_pairs += pairs
-                filepaths.append(pairs[1])
+                read, result = self._read_file(path, **kwargs)
+                if isinstance(result, ParsedFile):
+                    data_header_unit_tuples.append(result)
+                elif read:
+                    data_header_pairs.append(result)
+                else:
+                    filepaths.append(result)
 
             else:
                 #raise ValueError("File not found or invalid input")
@@ -397,9 +513,10 @@ class TimeSeriesFactory(BasicRegistrationFactory):
 
         # Hack to get around Python 2.x not backporting PEP 3102.
         silence_errors = kwargs.pop('silence_errors', False)
+        cache = kwargs.pop('cache', None)
 
         (data_header_unit_tuples, data_header_pairs,
-         already_timeseries, filepaths) = self._parse_args(*args, **kwargs)
+         already_timeseries, filepaths) = self._parse_args(*args, cache=cache, **kwargs)
 
         new_timeseries = list()
 
@@ -420,33 +537,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         # data_header_unit_tuples by calling the _parse_hdus method
         # of the class.
         for pairs in data_header_pairs:
-            # Pairs may be x long where x is the number of HDUs in the file.
-            headers = [pair.header for pair in pairs]
-
-            types = []
-            for header in headers:
-                try:
-                    match = self._get_matching_widget(meta=header, **kwargs)
-                    if not match == GenericTimeSeries:
-                        types.append(match)
-                except (MultipleMatchError, NoMatchError):
-                    continue
-
-            if not types:
-                # If no specific classes have been found we can read the data
-                # if we only have one data header pair:
-                if len(pairs) == 1:
-                    already_timeseries.append(GenericTimeSeries(pairs[0].data,
-                                                                pairs[0].header))
-                else:
-                    raise NoMatchError("Input read by sunpy.io can not find a "
-                                       "matching class for reading multiple HDUs")
-            if len(set(types)) > 1:
-                raise MultipleMatchError("Multiple HDUs return multiple matching classes.")
-
-            cls = types[0]
-
-            data_header_unit_tuples.append(cls._parse_hdus(pairs))
+            data_header_unit_tuples.append(self._parse_hdu_pairs(pairs, **kwargs))
 
         # Loop over each registered type and check to see if WidgetType
         # matches the arguments.  If it does, use that type
@@ -475,11 +566,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         concatenate = kwargs.get('concatenate', False)
         if concatenate:
             # Merge all these timeseries into one.
-            full_timeseries = new_timeseries.pop(0)
-            for timeseries in new_timeseries:
-                full_timeseries = full_timeseries.concatenate(timeseries)
-
-            new_timeseries = [full_timeseries]
+            new_timeseries = [self.concatenate_many(new_timeseries)]
 
         # Sanitize any units OrderedDict details
         for timeseries in new_timeseries:
@@ -490,6 +577,31 @@ class TimeSeriesFactory(BasicRegistrationFactory):
             return new_timeseries[0]
         return new_timeseries
 
+    def concatenate_many(self, series, **kwargs):
+        """
+        Concatenate a list of TimeSeries into a single TimeSeries.
+
+        The series are ordered by start time and joined with a single
+        `pandas.concat`, and their metadata is merged in one pass, rather
+        than folding them together two at a time.
+
+        Parameters
+        ----------
+        series : `list` of `~sunpy.timeseries.GenericTimeSeries`
+            The time series to concatenate.
+
+        kwargs
+            Passed to `~sunpy.timeseries.GenericTimeSeries.concatenate`.
+
+        Returns
+        -------
+        newts : `~sunpy.timeseries.GenericTimeSeries`
+        """
+        series = list(series)
+        if not series:
+            raise ValueError("No TimeSeries given to concatenate.")
+        return series[0].concatenate(series[1:], **kwargs)
+
     def _get_matching_widget(self, **kwargs):
         candidate_widget_types = list()
 
@@ -13,12 +13,15 @@ from collections import OrderedDict
 import copy
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 from sunpy import config
 from sunpy.time import TimeRange
 from sunpy.extern import six
 from sunpy.timeseries import TimeSeriesMetaData
+from sunpy.timeseries.decimation import decimate_dataframe, plot_decimated
+from sunpy.timeseries.windowing import window_times, time_range_bounds, iter_windows
 from sunpy.util.metadata import MetaDict
 
 import astropy
@@ -138,6 +141,23 @@ class GenericTimeSeries:
 
 # #### Attribute definitions #### #
 
+    # Windows of a time series only truncate the metadata when it is used.
+    _meta = None
+    _meta_factory = None
+
+    @property
+    def meta(self):
+        """The `~sunpy.timeseries.metadata.TimeSeriesMetaData` of the time series."""
+        if self._meta_factory is not None:
+            self._meta = self._meta_factory()
+            self._meta_factory = None
+        return self._meta
+
+    @meta.setter
+    def meta(self, meta):
+        self._meta = meta
+        self._meta_factory = None
+
     @property
     def source(self):
         """Returns a string/object used to specify the source class of the TimeSeries."""
@@ -275,22 +295,113 @@ class GenericTimeSeries:
             end   = b
 
         # If an interval integer was given then use in truncation.
-        truncated_data = self.data.sort_index()[start:end:int]
+        data = self.data
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
+        truncated_data = data[start:end:int].copy()
 
         # Truncate the metadata
-        # Check there is data still
-        truncated_meta = TimeSeriesMetaData([])
-        if len(truncated_data) > 0:
-            tr = TimeRange(truncated_data.index.min(), truncated_data.index.max())
-            truncated_meta = TimeSeriesMetaData(copy.deepcopy(self.meta.metadata))
-            truncated_meta._truncate(tr)
+        truncated_meta = self._truncated_meta(truncated_data)
 
         # Build similar TimeSeries object and sanatise metadata and units.
-        object = self.__class__(truncated_data.sort_index(), truncated_meta, copy.copy(self.units))
+        object = self.__class__(truncated_data, truncated_meta, copy.copy(self.units))
         object._sanitize_metadata()
         object._sanitize_units()
         return object
 
+    def _truncated_meta(self, data):
+        """Returns a copy of the metadata truncated to the time range of the
+        given data (a part of this time series' data)."""
+        # Check there is data still
+        if len(data) == 0:
+            return TimeSeriesMetaData([])
+        tr = TimeRange(data.index.min(), data.index.max())
+        return TimeSeriesMetaData(copy.deepcopy(self.meta._truncated_entries(tr)))
+
+    def windows(self, time_ranges):
+        """Returns an iterator over the parts of the TimeSeries in each of the
+        given time ranges, such as those from `sunpy.time.TimeRange.window`.
+
+        Unlike `truncate`, the data of each window is a view of this time
+        series' data rather than a copy (see
+        `sunpy.timeseries.windowing.iter_windows`), and its metadata is only
+        truncated when it is first used.
+
+        Parameters
+        ----------
+        time_ranges : `list` of `~sunpy.time.TimeRange`
+            The time ranges of the windows, inclusive of both ends.
+
+        Returns
+        -------
+        windows : iterator of `~sunpy.timeseries.TimeSeries`
+            A time series for each time range.
+        """
+        return iter_windows(self.data, *time_range_bounds(time_ranges),
+                            make_window=self._window)
+
+    def iter_windows(self, cadence, width, start=None, end=None):
+        """Returns an iterator over windows of the TimeSeries ``width`` long,
+        starting every ``cadence``, in the same way as `windows`.
+
+        Parameters
+        ----------
+        cadence : `astropy.units.Quantity`, `datetime.timedelta`
+            The time between the start of successive windows.
+
+        width : `astropy.units.Quantity`, `datetime.timedelta`
+            The length of each window.
+
+        start, end : `str` or `datetime.datetime`, optional
+            The time to start the first window at, and the time the last
+            window reaches. Default to the start and end of the data.
+
+        Returns
+        -------
+        windows : iterator of `~sunpy.timeseries.TimeSeries`
+            A time series for each window.
+        """
+        start = self.data.index.min() if start is None else start
+        end = self.data.index.max() if end is None else end
+        return iter_windows(self.data, *window_times(start, end, cadence, width),
+                            make_window=self._window)
+
+    def _window(self, window_data):
+        """Returns a time series of part of this one's data, with the
+        metadata truncated to it when it is first used."""
+        window = self.__class__(window_data, self.meta, copy.copy(self.units))
+        window._meta_factory = lambda: self._truncated_meta(window_data)
+        return window
+
+    def decimate(self, n_bins, method='minmax'):
+        """Returns a decimated version of the TimeSeries object, with the data
+        reduced to ``n_bins`` time bins in a way that keeps its appearance
+        when plotted.
+
+        Parameters
+        ----------
+        n_bins : `int`
+            The number of time bins to reduce the data to.
+
+        method : `str`
+            ``'minmax'`` (the default) keeps the samples with the minimum and
+            maximum of each column in each bin, ``'lttb'`` keeps one sample
+            per bin for each column chosen with the
+            Largest-Triangle-Three-Buckets algorithm, and ``'mean'`` averages
+            each bin.
+
+        Returns
+        -------
+        newts : `~sunpy.timeseries.TimeSeries`
+            A new time series with the decimated data.
+        """
+        data = decimate_dataframe(self.data, n_bins, method=method)
+
+        # Build similar TimeSeries object and sanatise units.
+        object = self.__class__(data, TimeSeriesMetaData(copy.copy(self.meta.metadata)), copy.copy(self.units))
+        object._sanitize_units()
+        return object
+
     def extract(self, column_name):
         """Returns a new time series with the chosen column.
 
@@ -321,14 +432,20 @@ class GenericTimeSeries:
         return object
 
     def concatenate(self, otherts, **kwargs):
-        """Concatenate with another TimeSeries. This function will check and
-        remove any duplicate times. It will keep the column values from the
-        original time series to which the new time series is being added.
+        """Concatenate with another TimeSeries, or a list of TimeSeries.
+
+        A list of time series is joined in a single pass: the sources are
+        ordered by start time and combined with one `pandas.concat`, and
+        their metadata is merged once, so folding many files together does
+        not copy the accumulated data at each step. The rows of every time
+        series are kept, including rows at the same time. Where metadata
+        entries duplicate each other, the one from this time series is kept,
+        followed by the others in the order given.
 
         Parameters
         ----------
-        otherts : `~sunpy.timeseries.TimeSeries`
-            Another time series.
+        otherts : `~sunpy.timeseries.TimeSeries` or `list`
+            Another time series, or a list of time series.
 
         same_source : `bool` Optional
             Set to true to check if the sources of the time series match.
@@ -337,35 +454,52 @@ class GenericTimeSeries:
         -------
         newts : `~sunpy.timeseries.TimeSeries`
             A new time series.
-
-        Debate: decide if we want to be able to concatenate multiple time series
-        at once.
         """
-
-        # check to see if nothing needs to be done
-        if self == otherts:
+        if isinstance(otherts, GenericTimeSeries):
+            # check to see if nothing needs to be done
+            if self == otherts:
+                return self
+            otherts = [otherts]
+
+        # Drop repeats of the same object, there is nothing to add from them.
+        series = [self]
+        for ts in otherts:
+            if not any(ts is other for other in series):
+                series.append(ts)
+        if len(series) == 1:
             return self
 
         # Check the sources match if specified.
-        same_source = kwargs.get('same_source', False)
-        if same_source and not (isinstance(otherts, self.__class__)):
+        same_source = kwargs.pop('same_source', False)
+        if same_source and not all(isinstance(ts, self.__class__) for ts in series):
             raise TypeError("TimeSeries classes must match if specified.")
 
-        # Concatenate the metadata and data
-        meta = self.meta.concatenate(otherts.meta)
-        data = pd.concat([self.data.copy(), otherts.data], **kwargs)
-
         # Add all the new units to the dictionary.
         units = OrderedDict()
-        units.update(self.units)
-        units.update(otherts.units)
+        for ts in series:
+            units.update(ts.units)
+
+        # When stacking rows, join the sources in chronological order so the
+        # resulting index rarely needs sorting afterwards.
+        ordered = series
+        if kwargs.get('axis', 0) in (0, 'index'):
+            empty = [ts for ts in series if ts.data.empty]
+            ordered = sorted((ts for ts in series if not ts.data.empty),
+                             key=lambda ts: ts.data.index.min()) + empty
+
+        # Concatenate the metadata, in the order given so this time series
+        # wins any duplicates, and the data
+        meta = self.meta.concatenate([ts.meta for ts in series[1:]])
+        data = pd.concat([ts.data for ts in ordered], **kwargs)
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
 
         # If sources match then build similar TimeSeries.
-        if self.__class__ == otherts.__class__:
-            object = self.__class__(data.sort_index(), meta, units)
+        if all(ts.__class__ == self.__class__ for ts in series):
+            object = self.__class__(data, meta, units)
         else:
             # Build generic time series if the sources don't match.
-            object = GenericTimeSeries(data.sort_index(), meta, units)
+            object = GenericTimeSeries(data, meta, units)
 
         # Sanatise metadata and units
         object._sanitize_metadata()
@@ -374,7 +508,7 @@ class GenericTimeSeries:
 
 # #### Plotting Methods #### #
 
-    def plot(self, axes=None, **plot_args):
+    def plot(self, axes=None, decimate=False, decimate_method='minmax', **plot_args):
         """Plot a plot of the time series
 
         Parameters
@@ -383,6 +517,15 @@ class GenericTimeSeries:
             If provided the image will be plotted on the given axes. Otherwise
             the current axes will be used.
 
+        decimate : `bool` or `int`
+            Whether to decimate the data to the width of the axes (True), or
+            a number of bins, before plotting, see
+            `~sunpy.timeseries.decimation.plot_decimated`. Default is False.
+
+        decimate_method : `str`
+            The method used to decimate, see
+            `~sunpy.timeseries.GenericTimeSeries.decimate`.
+
         **plot_args : `dict`
             Any additional plot arguments that should be used
             when plotting.
@@ -397,7 +540,8 @@ class GenericTimeSeries:
         if axes is None:
             axes = plt.gca()
 
-        axes = self.data.plot(ax=axes, **plot_args)
+        axes = plot_decimated(self.data, axes, decimate, decimate_method,
+                              **plot_args)
 
         return axes
 
@@ -0,0 +1,127 @@
+"""
+Splitting time indexed data into windows.
+
+The window boundaries are found for all windows at once, with a vectorised
+binary search of the (sorted) time index, so each window can be taken as a
+positional slice of the data.
+"""
+from __future__ import absolute_import, division, print_function
+
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from sunpy.time import parse_time
+
+__all__ = ['window_times', 'time_range_bounds', 'window_slices', 'iter_windows']
+
+
+def _as_ns(times):
+    """Return times as int64 nanoseconds since the epoch."""
+    return np.asarray(times, dtype='datetime64[ns]').view(np.int64)
+
+
+def _timedelta_ns(value):
+    """Return a `~astropy.units.Quantity` or `~datetime.timedelta` in nanoseconds."""
+    if not isinstance(value, timedelta):
+        value = timedelta(seconds=value.to('s').value)
+    return pd.Timedelta(value).value
+
+
+def window_times(start, end, cadence, width):
+    """
+    Return the start and end times of windows ``width`` long separated by
+    ``cadence``, from ``start`` until a window reaches ``end``. These are
+    the same windows as `sunpy.time.TimeRange.window` gives.
+
+    Parameters
+    ----------
+    start, end : `datetime.datetime` or `str`
+        The start and end of the time range to split into windows.
+
+    cadence : `astropy.units.Quantity`, `datetime.timedelta`
+        The time between the start of successive windows.
+
+    width : `astropy.units.Quantity`, `datetime.timedelta`
+        The length of each window.
+
+    Returns
+    -------
+    starts, ends : `numpy.ndarray`
+        The start and end times of the windows, as ``datetime64[ns]`` arrays.
+    """
+    start = pd.Timestamp(parse_time(start)).value
+    end = pd.Timestamp(parse_time(end)).value
+    cadence = _timedelta_ns(cadence)
+    width = _timedelta_ns(width)
+    if cadence <= 0:
+        raise ValueError("The cadence must be positive.")
+
+    # The number of windows until one finishes at or after the end.
+    remaining = end - start - width
+    n_windows = 1 if remaining <= 0 else -(-remaining // cadence) + 1
+
+    starts = start + cadence * np.arange(n_windows, dtype=np.int64)
+    return starts.view('datetime64[ns]'), (starts + width).view('datetime64[ns]')
+
+
+def time_range_bounds(time_ranges):
+    """
+    Return the start and end times of a list of `~sunpy.time.TimeRange`, as
+    ``datetime64[ns]`` arrays.
+    """
+    starts = np.array([tr.start for tr in time_ranges], dtype='datetime64[ns]')
+    ends = np.array([tr.end for tr in time_ranges], dtype='datetime64[ns]')
+    return starts, ends
+
+
+def window_slices(index, starts, ends):
+    """
+    Return the positions bounding each window in a sorted time index.
+
+    Parameters
+    ----------
+    index : `pandas.DatetimeIndex`
+        The time index, in ascending order.
+
+    starts, ends : array-like
+        The start and end times of the windows. Both ends are inclusive, as
+        for label based slicing of the data.
+
+    Returns
+    -------
+    lows, highs : `numpy.ndarray`
+        The data in window ``i`` is ``data.iloc[lows[i]:highs[i]]``.
+    """
+    times = _as_ns(index.values)
+    return (np.searchsorted(times, _as_ns(starts), side='left'),
+            np.searchsorted(times, _as_ns(ends), side='right'))
+
+
+def iter_windows(data, starts, ends, make_window):
+    """
+    Iterate over the parts of time indexed data in each window.
+
+    The bounds of all the windows are found with a single binary search of
+    the time index (sorting the data first if it is not in time order), and
+    the data of each window is a positional slice, so a view rather than a
+    copy of the data.
+
+    Parameters
+    ----------
+    data : `~pandas.DataFrame`
+        The time indexed data.
+
+    starts, ends : array-like
+        The start and end times of the windows, inclusive of both ends.
+
+    make_window : callable
+        Called with the data of each window to make the object to yield,
+        e.g. a time series holding it.
+    """
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+    lows, highs = window_slices(data.index, starts, ends)
+    for low, high in zip(lows, highs):
+        yield make_window(data.iloc[low:high])
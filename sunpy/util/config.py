@@ -37,7 +37,10 @@ def load_config():
     # Use absolute filepaths and adjust OS-dependent paths as needed
     filepaths = [
         ('downloads', 'download_dir'),
-        ('downloads', 'sample_dir')
+        ('downloads', 'sample_dir'),
+        ('downloads', 'cache_dir'),
+        ('net', 'query_cache_dir'),
+        ('timeseries', 'cache_dir')
     ]
     _fix_filepaths(config, filepaths)
 
@@ -3,10 +3,17 @@ from __future__ import absolute_import, division, print_function
 import os
 import datetime
 import re
+import time
+import threading
+import warnings
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 from bs4 import BeautifulSoup
 from sunpy.extern import six
 from sunpy.extern.six.moves import range, zip
+from sunpy.extern.six.moves.http_client import HTTPException
+from sunpy.extern.six.moves.urllib.error import HTTPError
 from sunpy.extern.six.moves.urllib.request import urlopen
 
 __all__ = ['Scraper']
@@ -20,6 +27,67 @@ TIME_CONVERSIONS = {'%Y': '\d{4}', '%y': '\d{2}',
                     '%M': '\d{2}',
                     '%S': '\d{2}', '%e': '\d{3}', '%f': '\d{6}'}
 
+# Matches the targets of the links in a directory listing.
+HREF_RE = re.compile(r'''<a\s[^>]*?href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''',
+                     re.IGNORECASE)
+
+
+def _extract_hrefs(html):
+    """
+    Return the targets of the links in the HTML page ``html``.
+
+    A regular expression finds the links in the plain directory listings
+    served by most archives; pages it finds no links in are parsed with
+    BeautifulSoup instead.
+    """
+    hrefs = [''.join(match).replace('&amp;', '&') for match in HREF_RE.findall(html)]
+    if hrefs:
+        return hrefs
+    soup = BeautifulSoup(html, "lxml")
+    return [link.get("href") for link in soup.find_all("a") if link.get("href")]
+
+
+class _ListingCache(object):
+    """
+    The links found in the directories listed by any `Scraper`, by URL.
+
+    Directories for a period of time that has ended are not expected to
+    change, so their listings are kept until the cache is full. Listings of
+    the current (or a future) period expire after ``ttl`` seconds. At most
+    ``max_entries`` listings are kept, dropping the least recently used.
+    """
+
+    def __init__(self, ttl=60, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._listings = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        with self._lock:
+            entry = self._listings.pop(url, None)
+            if entry is None:
+                return None
+            hrefs, closed, stored = entry
+            if not closed and time.time() - stored > self.ttl:
+                return None
+            self._listings[url] = entry
+            return hrefs
+
+    def put(self, url, hrefs, closed):
+        with self._lock:
+            self._listings.pop(url, None)
+            self._listings[url] = (hrefs, closed, time.time())
+            while len(self._listings) > self.max_entries:
+                self._listings.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._listings.clear()
+
+
+_listing_cache = _ListingCache()
+
 
 class Scraper(object):
     """
@@ -90,20 +158,39 @@ class Scraper(object):
             range given. Notice that these directories may not exist
             in the archive.
         """
+        return [directory for directory, _ in self._directory_dates(timerange)]
+
+    def _directory_dates(self, timerange):
+        """
+        The directories for a time range, as in `range`, each with a time
+        in the period it holds (or None if the pattern has no directories
+        by date).
+        """
         #find directory structure - without file names
         directorypattern = os.path.dirname(self.pattern) + '/'
         #TODO what if there's not slashes?
         rangedelta = timerange.dt
         timestep = self._smallerPattern(directorypattern)
         if timestep is None:
-            return [directorypattern]
+            return [(directorypattern, None)]
         else:
             # Number of elements in the time range (including end)
             n_steps = rangedelta.total_seconds()/timestep.total_seconds()
             TotalTimeElements = int(round(n_steps)) + 1
-            directories = [(timerange.start + n * timestep).strftime(directorypattern)
-                        for n in range(TotalTimeElements)] #todo if date <= endate
-            return directories
+            dates = [timerange.start + n * timestep
+                     for n in range(TotalTimeElements)] #todo if date <= endate
+            return [(date.strftime(directorypattern), date) for date in dates]
+
+    def _is_closed(self, date):
+        """
+        Whether the directory holding ``date`` is for a period of time which
+        has ended, so no more files will be added to it.
+        """
+        if date is None:
+            return False
+        directorypattern = os.path.dirname(self.pattern) + '/'
+        now = datetime.datetime.utcnow()
+        return date < now and date.strftime(directorypattern) != now.strftime(directorypattern)
 
     def _URL_followsPattern(self, url):
         """Check whether the url provided follows the pattern"""
@@ -161,11 +248,16 @@ class Scraper(object):
         return datetime.datetime.strptime(' '.join(final_date),
                                           ' '.join(final_pattern))
 
-    def filelist(self, timerange):
+    def filelist(self, timerange, max_conn=5):
         """
         Returns the list of existent files in the archive for the
         given time range.
 
+        The directories are listed ``max_conn`` at a time. Listings are
+        cached for the session: those of directories for periods of time
+        which have ended are kept, and those of current directories are
+        fetched again after a minute.
+
         Parameters
         ----------
 
@@ -173,6 +265,9 @@ class Scraper(object):
             Time interval where to find the directories for a given
             pattern.
 
+        max_conn : int
+            The largest number of directories to list at the same time.
+
         Returns
         -------
 
@@ -186,28 +281,59 @@ class Scraper(object):
         >>> print(solmon.filelist(timerange))
         ['http://solarmonitor.org/data/2015/01/01/fits/swap/swap_00174_fd_20150101_025423.fts.gz']
         """
-        directories = self.range(timerange)
+        directories = OrderedDict()
+        for directory, date in self._directory_dates(timerange):
+            directories.setdefault(directory, date)
+
+        pool = ThreadPool(max(1, min(max_conn, len(directories))))
+        try:
+            listings = pool.map(self._list_directory, list(directories.items()))
+        finally:
+            pool.close()
+
         filesurls = []
-        for directory in directories:
-            try:
-                opn = urlopen(directory)
-                try:
-                    soup = BeautifulSoup(opn, "lxml")
-                    for link in soup.find_all("a"):
-                        href = link.get("href")
-                        if href.endswith(self.pattern.split('.')[-1]):
-                            fullpath = directory + href
-                            if self._URL_followsPattern(fullpath):
-                                datehref = self._extractDateURL(fullpath)
-                                if (datehref >= timerange.start and
-                                    datehref <= timerange.end):
-                                    filesurls.append(fullpath)
-                finally:
-                    opn.close()
-            except:
-                pass
+        extension = self.pattern.split('.')[-1]
+        for directory, hrefs in zip(directories, listings):
+            for href in hrefs:
+                if href.endswith(extension):
+                    fullpath = directory + href
+                    if self._URL_followsPattern(fullpath):
+                        datehref = self._extractDateURL(fullpath)
+                        if (datehref >= timerange.start and
+                            datehref <= timerange.end):
+                            filesurls.append(fullpath)
         return filesurls
 
+    def _list_directory(self, directory_date):
+        """
+        Return the links in a directory listing, from the listing cache if
+        it is there. Directories which can't be listed have no links, and
+        a warning is given unless they do not exist.
+        """
+        directory, date = directory_date
+        hrefs = _listing_cache.get(directory)
+        if hrefs is not None:
+            return hrefs
+        try:
+            opn = urlopen(directory)
+            try:
+                html = opn.read()
+            finally:
+                opn.close()
+        except HTTPError as error:
+            if error.code != 404:
+                warnings.warn("Could not list {0}: {1}".format(directory, error))
+            return []
+        except (IOError, HTTPException) as error:
+            # URLError and socket errors are IOErrors.
+            warnings.warn("Could not list {0}: {1}".format(directory, error))
+            return []
+        if not isinstance(html, six.text_type):
+            html = html.decode('utf-8', 'replace')
+        hrefs = _extract_hrefs(html)
+        _listing_cache.put(directory, hrefs, self._is_closed(date))
+        return hrefs
+
     def _smallerPattern(self, directoryPattern):
         """Obtain the smaller time step for the given pattern"""
         try:
@@ -6,7 +6,9 @@ import os
 
 import sunpy.data.test
 from sunpy.time import TimeRange
+from sunpy.util import scraper
 from sunpy.util.scraper import Scraper
+from sunpy.net.tests.server import LocalServer
 
 PATTERN_EXAMPLES = [
     ('%b%y', datetime.timedelta(days=31)),
@@ -112,6 +114,87 @@ def testURL_patternMilliseconds():
     assert not s._URL_followsPattern('fd_20130410_231211.fts.gz')
     assert not s._URL_followsPattern('fd_20130410_ar_231211.fts.gz')
 
+def listing(*names):
+    links = ''.join('<a href="{0}">{0}</a>\n'.format(name) for name in names)
+    return '<html><body><a href="../">Parent</a>\n{0}</body></html>'.format(links).encode()
+
+
+@pytest.fixture
+def archive():
+    scraper._listing_cache.clear()
+    files = {'/2014/05/{0:02d}/'.format(day): listing(
+        'fd_201405{0:02d}_000000.fts'.format(day), 'fd_201405{0:02d}_120000.fts'.format(day),
+        'fd_201405{0:02d}_120000.txt'.format(day)) for day in range(1, 6)}
+    server = LocalServer(files, delay=0.05).start()
+    server.delay_event.clear()
+    yield server
+    server.stop()
+    scraper._listing_cache.clear()
+
+
+def test_filelist_local(archive):
+    s = Scraper(archive.url('%Y/%m/%d/fd_%Y%m%d_%H%M%S.fts'))
+    timerange = TimeRange('2014-05-01T06:00:00', '2014-05-05T06:00:00')
+    files = s.filelist(timerange, max_conn=3)
+    assert files == [archive.url('2014/05/{0:02d}/fd_201405{0:02d}_{1}.fts'.format(day, time))
+                     for day in range(1, 6) for time in ('000000', '120000')][1:-1]
+    assert sorted(archive.requests) == ['/2014/05/0{0}/'.format(day) for day in range(1, 6)]
+    # The directories are listed at the same time, up to max_conn
+    assert archive.max_active == 3
+
+    # Past directories are not listed again
+    assert s.filelist(timerange) == files
+    assert len(archive.requests) == 5
+
+
+def test_filelist_missing_directory(archive):
+    s = Scraper(archive.url('%Y/%m/%d/fd_%Y%m%d_%H%M%S.fts'))
+    files = s.filelist(TimeRange('2014-05-05T06:00:00', '2014-05-06T06:00:00'))
+    assert files == [archive.url('2014/05/05/fd_20140505_120000.fts')]
+    # Directories that can't be listed are tried again
+    s.filelist(TimeRange('2014-05-05T06:00:00', '2014-05-06T06:00:00'))
+    assert archive.requests.count('/2014/05/06/') == 2
+
+
+def test_filelist_unlistable_directory(archive, recwarn):
+    s = Scraper(archive.url('%Y/%m/%d/fd_%Y%m%d_%H%M%S.fts'))
+    timerange = TimeRange('2014-05-05T06:00:00', '2014-05-06T06:00:00')
+    # Missing directories are skipped quietly
+    s.filelist(timerange)
+    assert not recwarn.list
+
+    archive.files['/2014/05/06/'] = lambda handler: handler.send_error(500)
+    with pytest.warns(UserWarning) as record:
+        files = s.filelist(timerange)
+    assert files == [archive.url('2014/05/05/fd_20140505_120000.fts')]
+    assert len(record) == 1
+    assert archive.url('2014/05/06/') in str(record[0].message)
+
+
+def test_listing_cache_current_directory(monkeypatch):
+    s = Scraper('http://example.com/%Y/%m/%d/fd_%Y%m%d_%H%M%S.fts')
+    now = datetime.datetime.utcnow()
+    assert s._is_closed(now - datetime.timedelta(days=2))
+    assert not s._is_closed(now)
+    assert not s._is_closed(now + datetime.timedelta(days=2))
+    assert not Scraper('http://example.com/fd_%Y%m%d_%H%M%S.fts')._is_closed(None)
+
+    cache = scraper._ListingCache(ttl=60)
+    monkeypatch.setattr(scraper.time, 'time', lambda: 1000)
+    cache.put('old/', ['a'], closed=True)
+    cache.put('new/', ['b'], closed=False)
+    assert cache.get('new/') == ['b']
+    monkeypatch.setattr(scraper.time, 'time', lambda: 1000 + 61)
+    assert cache.get('new/') is None
+    assert cache.get('old/') == ['a']
+
+
+def test_extract_hrefs():
+    html = ('<A HREF="a.fts">a</A> <a class=x href=\'b.fts\'>b</a> '
+            '<a href=c.fts?x=1&amp;y=2>c</a>')
+    assert scraper._extract_hrefs(html) == ['a.fts', 'b.fts', 'c.fts?x=1&y=2']
+    assert scraper._extract_hrefs('<p>No links</p>') == []
+
 # Local files don't work
 # def testFilesRange_sameDirectory_local():
 #     s = Scraper('/'.join(['file:/',sunpy.data.test.rootdir,
@@ -161,6 +161,71 @@ def test_convert_back():
     assert_allclose(wcs.convert_hpc_hg(*wcs.convert_hg_hpc(*coord)),
                     coord, rtol=1e-2, atol=0)
 
+def chained_hcc_hg(x, y, b0_deg=0, l0_deg=0):
+    # The per-step implementation replaced by the fused kernels, kept as the
+    # reference for them
+    z = np.sqrt(wcs.wcs.rsun_meters**2 - x**2 - y**2)
+    cosb = np.cos(np.deg2rad(b0_deg))
+    sinb = np.sin(np.deg2rad(b0_deg))
+    hecr = np.sqrt(x**2 + y**2 + z**2)
+    hgln = np.arctan2(x, z * cosb - y * sinb) + np.deg2rad(l0_deg)
+    hglt = np.arcsin((y * cosb + z * sinb) / hecr)
+    return np.rad2deg(hgln), np.rad2deg(hglt)
+
+def test_kernels_match_chained_conversions(dsun, b0, l0):
+    # The fused conversions must agree with chaining the individual steps
+    x, y = np.meshgrid(np.linspace(-1000, 1000, 101), np.linspace(-1000, 1000, 101))
+    hccx, hccy = wcs.convert_hpc_hcc(x, y, dsun_meters=dsun)
+    expected = chained_hcc_hg(hccx, hccy, b0_deg=b0, l0_deg=l0)
+    assert_allclose(wcs.convert_hcc_hg(hccx, hccy, b0_deg=b0, l0_deg=l0),
+                    expected, rtol=0, atol=1e-10)
+    result = wcs.convert_hpc_hg(x, y, b0_deg=b0, l0_deg=l0, dsun_meters=dsun)
+    assert_allclose(result, expected, rtol=0, atol=1e-6)
+
+    lon, lat = np.meshgrid(np.linspace(-80, 80, 101), np.linspace(-80, 80, 101))
+    hccx, hccy = wcs.convert_hg_hcc(lon, lat, b0_deg=b0, l0_deg=l0)
+    expected = wcs.convert_hcc_hpc(hccx, hccy, dsun_meters=dsun)
+    result = wcs.convert_hg_hpc(lon, lat, b0_deg=b0, l0_deg=l0, dsun_meters=dsun)
+    assert_allclose(result, expected, rtol=1e-10, atol=0)
+
+def test_kernels_angle_units(dsun, b0, l0):
+    lon, lat = np.array([10.0, -30.0]), np.array([20.0, 5.0])
+    arcsec = wcs.convert_hg_hpc(lon, lat, b0_deg=b0, l0_deg=l0, dsun_meters=dsun)
+    for unit, factor in [('arcmin', 60.0), ('degrees', 3600.0), ('mas', 1e-3)]:
+        result = wcs.convert_hg_hpc(lon, lat, b0_deg=b0, l0_deg=l0, dsun_meters=dsun,
+                                    angle_units=unit)
+        assert_allclose(np.multiply(result, factor), arcsec, rtol=1e-12)
+    with pytest.raises(ValueError):
+        wcs.convert_hg_hpc(lon, lat, angle_units='radians')
+
+def test_kernels_dtype_and_chunks(dsun, b0, l0):
+    x, y = np.meshgrid(np.linspace(-900, 900, 50), np.linspace(-900, 900, 40))
+    expected = wcs.convert_hpc_hg(x, y, b0_deg=b0, l0_deg=l0, dsun_meters=dsun)
+
+    result = wcs.convert_hpc_hg(x, y, b0_deg=b0, l0_deg=l0, dsun_meters=dsun, chunk_size=7)
+    assert result[0].shape == x.shape
+    assert_allclose(result, expected, rtol=0, atol=0)
+
+    result = wcs.convert_hpc_hg(x, y, b0_deg=b0, l0_deg=l0, dsun_meters=dsun, dtype=np.float32)
+    assert result[0].dtype == np.float32
+    assert_allclose(result, expected, rtol=0, atol=1e-4)
+
+    hccx = np.linspace(-6e8, 6e8, 25)
+    result = wcs.convert_hcc_hg(hccx, 1e8, b0_deg=b0, l0_deg=l0, radius=True,
+                                dtype=np.float32, chunk_size=4)
+    assert all(r.dtype == np.float32 and r.shape == hccx.shape for r in result)
+
+def test_kernels_array_parameters(dsun):
+    # B0, L0 and the observer distance may vary from point to point
+    x, y = np.array([100.0, -400.0, 700.0]), np.array([-50.0, 300.0, 20.0])
+    b0, l0 = np.array([-7.0, 0.5, 6.0]), np.array([0.0, 10.0, 20.0])
+    dsuns = dsun * np.array([0.99, 1.0, 1.01])
+    lon, lat = wcs.convert_hpc_hg(x, y, b0_deg=b0, l0_deg=l0, dsun_meters=dsuns, chunk_size=2)
+    for i in range(len(x)):
+        assert_allclose((lon[i], lat[i]),
+                        wcs.convert_hpc_hg(x[i], y[i], b0_deg=b0[i], l0_deg=l0[i],
+                                           dsun_meters=dsuns[i]))
+
 # Ensures that further testing involving wcs uses the "constants" value
 # of the solar radius in meters.  There is a line above that resets the
 # wcs value of the solar radius for the purposes of these tests.  The
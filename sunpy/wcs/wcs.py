@@ -29,6 +29,177 @@ def _convert_angle_units(unit='arcsec'):
     else:
         raise ValueError("The units specified are either invalid or is not supported at this time.")
 
+
+# Number of elements each coordinate kernel processes at a time. Working on
+# chunks keeps the double precision temporaries small regardless of the size
+# of the input arrays.
+_CHUNK_SIZE = 2**16
+
+
+def _apply_in_chunks(kernel, inputs, nout, dtype=None, chunk_size=None, **kwargs):
+    """
+    Apply a coordinate kernel to broadcast inputs, one chunk at a time.
+
+    Each chunk of the inputs is copied into a double precision buffer which
+    the kernel is free to overwrite, and the kernel writes its results into
+    slices of preallocated output arrays of type ``dtype``. Inputs which are
+    None are passed through to the kernel unchanged. Keyword arguments which
+    are arrays (e.g. a different B0 angle for each point) are broadcast
+    against the inputs and chunked along with them.
+    """
+    array_kwargs = [key for key, value in kwargs.items() if np.ndim(value) > 0]
+    arrays = np.broadcast_arrays(*([np.asarray(arg) for arg in inputs if arg is not None] +
+                                   [np.asarray(kwargs[key]) for key in array_kwargs]))
+    if dtype is None:
+        dtype = np.float64
+    if chunk_size is None:
+        chunk_size = _CHUNK_SIZE
+    shape = arrays[0].shape
+    arrays = iter(arrays)
+    inputs = [None if arg is None else next(arrays) for arg in inputs]
+    array_kwargs = dict((key, next(arrays)) for key in array_kwargs)
+    outputs = [np.empty(shape, dtype=dtype) for _ in range(nout)]
+    flat_outputs = [out.reshape(-1) for out in outputs]
+
+    for start in range(0, int(np.prod(shape)), chunk_size):
+        stop = start + chunk_size
+        chunks = [None if arg is None else np.asarray(arg.flat[start:stop], dtype=np.float64)
+                  for arg in inputs]
+        kwargs.update((key, value.flat[start:stop]) for key, value in array_kwargs.items())
+        kernel(*(chunks + [out[start:stop] for out in flat_outputs]), **kwargs)
+
+    if shape == ():
+        return tuple(out[()] for out in outputs)
+    return tuple(outputs)
+
+
+def _hpc_hg_kernel(x, y, lon, lat, scale, dsun, b0, l0):
+    """
+    Helioprojective-Cartesian to Stonyhurst Heliographic (degrees) in place.
+
+    Combines Eqs. (15) and (12) of Thompson (2006), reusing the buffers of
+    ``x`` and ``y`` for intermediate values.
+    """
+    cosb = np.cos(np.deg2rad(b0))
+    sinb = np.sin(np.deg2rad(b0))
+
+    x *= scale
+    y *= scale
+    cosx = np.cos(x)
+    sinx = np.sin(x, out=x)
+    cosy = np.cos(y)
+    siny = np.sin(y, out=y)
+
+    cosxy = np.multiply(cosx, cosy, out=cosx)
+    distance = cosxy * dsun
+    root = np.multiply(distance, distance)
+    root += rsun_meters ** 2 - dsun ** 2
+    np.sqrt(root, out=root)
+    distance -= root
+
+    rx = np.multiply(sinx, cosy, out=sinx)
+    rx *= distance
+    ry = np.multiply(siny, distance, out=siny)
+    rz = np.multiply(cosxy, distance, out=cosxy)
+    np.subtract(dsun, rz, out=rz)
+
+    np.multiply(rz, cosb, out=root)
+    root -= np.multiply(ry, sinb, out=cosy)
+    np.arctan2(rx, root, out=root)
+    root += np.deg2rad(l0)
+    np.rad2deg(root, out=lon)
+
+    ry *= cosb
+    rz *= sinb
+    ry += rz
+    ry /= rsun_meters
+    np.arcsin(ry, out=ry)
+    np.rad2deg(ry, out=lat)
+
+
+def _hg_hpc_kernel(lon, lat, x, y, b0, l0, dsun, scale, occultation):
+    """
+    Stonyhurst Heliographic (degrees) to Helioprojective-Cartesian in place.
+
+    Combines Eqs. (11) and (16) of Thompson (2006), reusing the buffers of
+    ``lon`` and ``lat`` for intermediate values.
+    """
+    cosb = np.cos(np.deg2rad(b0))
+    sinb = np.sin(np.deg2rad(b0))
+
+    lon -= l0
+    np.deg2rad(lon, out=lon)
+    np.deg2rad(lat, out=lat)
+    cosx = np.cos(lon)
+    sinx = np.sin(lon, out=lon)
+    cosy = np.cos(lat)
+    siny = np.sin(lat, out=lat)
+
+    hccx = np.multiply(cosy, sinx, out=sinx)
+    hccx *= rsun_meters
+    cosxy = np.multiply(cosx, cosy, out=cosx)
+    hccy = siny * cosb
+    hccy -= np.multiply(cosxy, sinb, out=cosy)
+    hccy *= rsun_meters
+    hccz = np.multiply(siny, sinb, out=siny)
+    cosxy *= cosb
+    hccz += cosxy
+    hccz *= rsun_meters
+
+    if occultation:
+        behind = hccz < 0
+        hccx[behind] = np.nan
+        hccy[behind] = np.nan
+
+    zeta = np.abs(hccz, out=hccz)
+    np.subtract(dsun, zeta, out=zeta)
+    distance = np.multiply(hccx, hccx, out=cosxy)
+    distance += hccy * hccy
+    distance += zeta * zeta
+    np.sqrt(distance, out=distance)
+
+    np.arctan2(hccx, zeta, out=hccx)
+    hccy /= distance
+    np.arcsin(hccy, out=hccy)
+
+    np.divide(hccx, scale, out=x)
+    np.divide(hccy, scale, out=y)
+
+
+def _hcc_hg_kernel(x, y, z, lon, lat, r=None, b0=0, l0=0):
+    """
+    Heliocentric-Cartesian to Stonyhurst Heliographic (degrees) in place.
+
+    Implements Eq. (12) of Thompson (2006). If ``z`` is None the points are
+    assumed to lie on the solar surface.
+    """
+    cosb = np.cos(np.deg2rad(b0))
+    sinb = np.sin(np.deg2rad(b0))
+
+    hecr = np.multiply(x, x)
+    hecr += y * y
+    if z is None:
+        z = np.subtract(rsun_meters ** 2, hecr)
+        np.sqrt(z, out=z)
+    hecr += z * z
+    np.sqrt(hecr, out=hecr)
+    if r is not None:
+        r[...] = hecr
+
+    denominator = z * cosb
+    denominator -= y * sinb
+    np.arctan2(x, denominator, out=denominator)
+    denominator += np.deg2rad(l0)
+    np.rad2deg(denominator, out=lon)
+
+    y *= cosb
+    z *= sinb
+    y += z
+    y /= hecr
+    np.arcsin(y, out=y)
+    np.rad2deg(y, out=lat)
+
+
 @deprecated("0.8.0", alternative="sunpy.map.GenericMap.pixel_to_data")
 def convert_pixel_to_data(size, scale, reference_pixel,
                           reference_coordinate, x=None, y=None):
@@ -260,7 +431,8 @@ def convert_hcc_hpc(x, y, dsun_meters=None, angle_units='arcsec'):
 
 
 @deprecated("0.8.0", alternative="sunpy.coordinates")
-def convert_hcc_hg(x, y, z=None, b0_deg=0, l0_deg=0, radius=False):
+def convert_hcc_hg(x, y, z=None, b0_deg=0, l0_deg=0, radius=False, dtype=None,
+                   chunk_size=None):
     """
     Convert from Heliocentric-Cartesian (HCC) (given in meters) to
     Stonyhurst Heliographic coordinates (HG) given in degrees, with
@@ -282,6 +454,12 @@ def convert_hcc_hg(x, y, z=None, b0_deg=0, l0_deg=0, radius=False):
     radius : Bool
         If true, forces the output to return a triple of (lon, lat, r). If
         false, return (lon, lat) only.
+    dtype : `numpy.dtype`
+        Data type of the output, e.g. ``np.float32``. Default is
+        ``np.float64``. The calculation itself is always done in double
+        precision.
+    chunk_size : int
+        Number of elements converted at a time. Default is 65536.
 
     Returns
     -------
@@ -302,20 +480,8 @@ def convert_hcc_hg(x, y, z=None, b0_deg=0, l0_deg=0, radius=False):
     ...                          z=695508000.0 + 8000000.0, radius=True)
     (0.01873188196651189, 3.6599471896203317, 704945784.41465974)
     """
-    if z is None:
-        z = np.sqrt(rsun_meters**2 - x**2 - y**2)
-
-    cosb = np.cos(np.deg2rad(b0_deg))
-    sinb = np.sin(np.deg2rad(b0_deg))
-
-    hecr = np.sqrt(x**2 + y**2 + z**2)
-    hgln = np.arctan2(x, z * cosb - y * sinb) + np.deg2rad(l0_deg)
-    hglt = np.arcsin((y * cosb + z * sinb) / hecr)
-
-    if radius:
-        return np.rad2deg(hgln), np.rad2deg(hglt), hecr
-    else:
-        return np.rad2deg(hgln), np.rad2deg(hglt)
+    return _apply_in_chunks(_hcc_hg_kernel, [x, y, z], 3 if radius else 2,
+                            dtype=dtype, chunk_size=chunk_size, b0=b0_deg, l0=l0_deg)
 
 
 @deprecated("0.8.0", alternative="sunpy.coordinates")
@@ -390,7 +556,7 @@ def convert_hg_hcc(hglon_deg, hglat_deg, b0_deg=0, l0_deg=0, occultation=False,
 
 @deprecated("0.8.0", alternative="sunpy.coordinates")
 def convert_hg_hpc(hglon_deg, hglat_deg, b0_deg=0, l0_deg=0, dsun_meters=None, angle_units='arcsec',
-                   occultation=False):
+                   occultation=False, dtype=None, chunk_size=None):
     """
     Convert from Heliographic coordinates (HG) to Helioprojective-Cartesian
     (HPC).
@@ -410,7 +576,13 @@ def convert_hg_hpc(hglon_deg, hglat_deg, b0_deg=0, l0_deg=0, dsun_meters=None, a
     dsun_meters : float (meters)
         Distance between the observer and the Sun.
     angle_units : str
-
+        Units of the output data coordinates. Default is arcsec.
+    dtype : `numpy.dtype`
+        Data type of the output, e.g. ``np.float32``. Default is
+        ``np.float64``. The calculation itself is always done in double
+        precision.
+    chunk_size : int
+        Number of elements converted at a time. Default is 65536.
 
     Returns
     -------
@@ -428,12 +600,19 @@ def convert_hg_hpc(hglon_deg, hglat_deg, b0_deg=0, l0_deg=0, dsun_meters=None, a
     (380.05656560308898, 743.78281283290016)
     """
 
-    tempx, tempy = convert_hg_hcc(hglon_deg, hglat_deg, b0_deg=b0_deg, l0_deg=l0_deg, occultation=occultation)
-    x, y = convert_hcc_hpc(tempx, tempy, dsun_meters=dsun_meters, angle_units=angle_units)
-    return x, y
+    if dsun_meters is None:
+        dsun_meters = sun.constants.au.si.value
+    elif isinstance(dsun_meters, u.Quantity):
+        dsun_meters = dsun_meters.si.value
+
+    return _apply_in_chunks(_hg_hpc_kernel, [hglon_deg, hglat_deg], 2, dtype=dtype,
+                            chunk_size=chunk_size, b0=b0_deg, l0=l0_deg, dsun=dsun_meters,
+                            scale=_convert_angle_units(unit=angle_units),
+                            occultation=occultation)
 
 @deprecated("0.8.0", alternative="sunpy.coordinates")
-def convert_hpc_hg(x, y, b0_deg=0, l0_deg=0, dsun_meters=None, angle_units='arcsec'):
+def convert_hpc_hg(x, y, b0_deg=0, l0_deg=0, dsun_meters=None, angle_units='arcsec', dtype=None,
+                   chunk_size=None):
     """
     Convert from Helioprojective-Cartesian (HPC) to Heliographic coordinates
     (HG) in degrees.
@@ -452,6 +631,12 @@ def convert_hpc_hg(x, y, b0_deg=0, l0_deg=0, dsun_meters=None, angle_units='arcs
         Distance between the observer and the Sun.
     angle_units : str
         Units used for input x and y. Default is arcsec.
+    dtype : `numpy.dtype`
+        Data type of the output, e.g. ``np.float32``. Default is
+        ``np.float64``. The calculation itself is always done in double
+        precision.
+    chunk_size : int
+        Number of elements converted at a time. Default is 65536.
 
     Returns
     -------
@@ -468,9 +653,14 @@ def convert_hpc_hg(x, y, b0_deg=0, l0_deg=0, dsun_meters=None, angle_units='arcs
     >>> sunpy.wcs.convert_hpc_hg(382, 748, b0_deg=-7.064078, l0_deg=0.0)
     (34.504653439914669, 45.443143275518182)
     """
-    tempx, tempy = convert_hpc_hcc(x, y, dsun_meters=dsun_meters, angle_units=angle_units)
-    lon, lat = convert_hcc_hg(tempx, tempy, b0_deg=b0_deg, l0_deg=l0_deg)
-    return lon, lat
+    if dsun_meters is None:
+        dsun_meters = sun.constants.au.si.value
+    elif isinstance(dsun_meters, u.Quantity):
+        dsun_meters = dsun_meters.si.value
+
+    return _apply_in_chunks(_hpc_hg_kernel, [x, y], 2, dtype=dtype, chunk_size=chunk_size,
+                            scale=_convert_angle_units(unit=angle_units), dsun=dsun_meters,
+                            b0=b0_deg, l0=l0_deg)
 
 
 @deprecated("0.8.0", alternative="sunpy.map")
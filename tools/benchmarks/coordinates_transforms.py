@@ -0,0 +1,68 @@
+"""
+Time transforming a large `~astropy.coordinates.SkyCoord` between every pair
+of `sunpy.coordinates` frames.
+
+Every transformation is run twice, the second run benefiting from any cached
+ephemeris values for the (shared) observation time.
+
+Usage::
+
+    python tools/benchmarks/coordinates_transforms.py [npoints]
+"""
+from __future__ import absolute_import, division, print_function
+
+import itertools
+import sys
+import time
+
+import numpy as np
+
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+
+from sunpy.coordinates import transformations
+from sunpy.coordinates.frames import (HeliographicStonyhurst, HeliographicCarrington,
+                                      Heliocentric, Helioprojective)
+
+DATEOBS = "2011/06/07T06:33:00"
+
+
+def make_coordinates(npoints):
+    """
+    Points on the visible disk, in each of the sunpy frames.
+    """
+    rng = np.random.RandomState(0)
+    hpc = SkyCoord(rng.uniform(-900, 900, npoints) * u.arcsec,
+                   rng.uniform(-900, 900, npoints) * u.arcsec,
+                   frame=Helioprojective, dateobs=DATEOBS, B0=0.3 * u.deg)
+    coords = {'hpc': hpc}
+    for name, frame in [('hcc', Heliocentric), ('hgs', HeliographicStonyhurst),
+                        ('hgc', HeliographicCarrington)]:
+        coords[name] = hpc.transform_to(frame(dateobs=DATEOBS))
+    return coords
+
+
+def target_frames():
+    return {'hpc': Helioprojective(dateobs=DATEOBS, B0=1.2 * u.deg, L0=3 * u.deg),
+            'hcc': Heliocentric(dateobs=DATEOBS, B0=0.3 * u.deg),
+            'hgs': HeliographicStonyhurst(dateobs=DATEOBS),
+            'hgc': HeliographicCarrington(dateobs=DATEOBS)}
+
+
+def main(npoints=10**6):
+    coords = make_coordinates(npoints)
+    frames = target_frames()
+    print('{0} points'.format(npoints))
+    for source, target in itertools.product(sorted(coords), sorted(frames)):
+        transformations._carrington_offset_cache.clear()
+        timings = []
+        for _ in range(2):
+            start = time.time()
+            coords[source].transform_to(frames[target])
+            timings.append(time.time() - start)
+        print('  {0} -> {1}: {2:7.3f} s cold, {3:7.3f} s cached'.format(source, target,
+                                                                        *timings))
+
+
+if __name__ == '__main__':
+    main(*[int(float(arg)) for arg in sys.argv[1:]])
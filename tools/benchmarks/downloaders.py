@@ -0,0 +1,67 @@
+"""
+Compare the thread per file `~sunpy.net.download.Downloader` with the asyncio
+`~sunpy.net.asyncdownload.AsyncDownloader`, downloading many small files from
+a local HTTP server.
+
+Usage::
+
+    python tools/benchmarks/downloaders.py [nfiles] [size]
+"""
+from __future__ import absolute_import, division, print_function
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+
+from sunpy.net.download import Downloader
+from sunpy.net.asyncdownload import AsyncDownloader
+from sunpy.net.tests.server import LocalServer
+
+
+def download_all(downloader, urls, directory):
+    remaining = [len(urls)]
+    lock = threading.Lock()
+
+    def finished(*args):
+        with lock:
+            remaining[0] -= 1
+            if not remaining[0]:
+                downloader.stop()
+
+    for url in urls:
+        downloader.download(url, directory, callback=finished, errback=finished)
+    downloader.wait()
+
+
+def main(nfiles=2000, size=10000):
+    files = {'/file{0:05d}.dat'.format(i): os.urandom(size) for i in range(nfiles)}
+    server = LocalServer(files).start()
+    urls = [server.url(path) for path in sorted(files)]
+
+    print('{0} files of {1} bytes from a local server'.format(nfiles, size))
+    try:
+        for label, make_downloader in [('threads', lambda: Downloader(5, 20)),
+                                       ('asyncio', lambda: AsyncDownloader(5, 20))]:
+            directory = tempfile.mkdtemp()
+            connections = server.connections
+            downloader = make_downloader()
+            start = time.time()
+            download_all(downloader, urls, directory)
+            seconds = time.time() - start
+            if isinstance(downloader, AsyncDownloader):
+                downloader.close()
+            complete = sum(os.path.getsize(os.path.join(directory, path.lstrip('/'))) == size
+                           for path in files)
+            shutil.rmtree(directory)
+            print('  {0:<8} {1:8.3f} s  {2:8.1f} files/s  {3:5d} connections  '
+                  '{4} files complete'.format(label, seconds, nfiles / seconds,
+                                              server.connections - connections, complete))
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,102 @@
+"""
+Compare the chunked RHESSI back projection with the (pixels x events) phase
+matrix formulation it replaces, on a synthetic calibrated event list, for
+speed, accuracy and peak memory.
+
+Usage::
+
+    python tools/benchmarks/rhessi_backprojection.py [nevents] [npix]
+"""
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+import warnings
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+warnings.simplefilter('ignore')
+
+from sunpy.instr import rhessi  # noqa
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+
+def synthetic_events(nevents, seed=0):
+    """Random event list columns, as read by `rhessi._read_detector_events`."""
+    random = np.random.RandomState(seed)
+    return (random.uniform(0, 2 * np.pi, nevents),
+            random.uniform(0, 1, nevents),
+            random.uniform(0, 2 * np.pi, nevents),
+            random.uniform(0.2, 0.3, nevents),
+            random.poisson(20, nevents).astype(np.float64))
+
+
+def outer_backproject(events, detector, image_dim):
+    """The phase matrix formulation, with one (pixels x events) array."""
+    roll_angle, modamp, phase_map_center, grid_transmission, count = events
+    grid_angle = np.pi / 2. - rhessi.grid_orientation[detector - 1]
+    harm_ang_pitch = rhessi.grid_pitch[detector - 1]
+    npix = image_dim[0] * image_dim[1]
+    tempa = (np.arange(npix) % image_dim[0]) - (image_dim[0] - 1) / 2.
+    tempb = tempa.reshape(image_dim).transpose().reshape(npix)
+    phase_pixel = (2 * np.pi / harm_ang_pitch) * (
+        np.outer(tempa, np.cos(roll_angle - grid_angle)) -
+        np.outer(tempb, np.sin(roll_angle - grid_angle))) + phase_map_center
+    probability_of_transmission = (modamp * grid_transmission * np.cos(phase_pixel) +
+                                   grid_transmission)
+    return np.inner(probability_of_transmission, count).reshape(image_dim)
+
+
+def all_detectors(backproject, detector_events, threads=1):
+    pool = ThreadPool(threads)
+    try:
+        images = pool.map(lambda args: backproject(*args), detector_events)
+    finally:
+        pool.close()
+    return sum(images)
+
+
+def peak_memory(func):
+    if tracemalloc is None:
+        return float('nan')
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main(nevents=5000, npix=64):
+    image_dim = (npix, npix)
+    detector_events = [(synthetic_events(nevents, seed=detector), detector)
+                       for detector in range(1, 10)]
+
+    def chunked(events, detector):
+        return rhessi._backproject_events(events, detector, image_dim=image_dim)
+
+    def outer(events, detector):
+        return outer_backproject(events, detector, image_dim)
+
+    print('9 detectors, {0} events each, {1}x{1} image'.format(nevents, npix))
+    expected = None
+    for label, backproject, threads in [('outer', outer, 1),
+                                        ('chunked', chunked, 1),
+                                        ('threaded', chunked, 9)]:
+        start = time.time()
+        image = all_detectors(backproject, detector_events, threads)
+        seconds = time.time() - start
+        if expected is None:
+            expected = image
+        error = np.abs(image - expected).max() / np.abs(expected).max()
+        memory = peak_memory(lambda: all_detectors(backproject, detector_events[:1]))
+        print('  {0:<10} {1:8.3f} s  {2:9.1f} MiB peak per detector  '
+              'max rel error {3:.2e}'.format(label, seconds, memory, error))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
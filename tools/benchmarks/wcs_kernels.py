@@ -0,0 +1,88 @@
+"""
+Compare the fused `sunpy.wcs` coordinate conversions with the chained
+numpy expressions they replace, for speed, accuracy and peak memory.
+
+The chained reference keeps its own copy of the per-step HCC to HG
+conversion, as `sunpy.wcs.convert_hcc_hg` now uses the fused kernel itself.
+
+Usage::
+
+    python tools/benchmarks/wcs_kernels.py [npix]
+"""
+from __future__ import absolute_import, division, print_function
+
+import sys
+import timeit
+import warnings
+
+import numpy as np
+
+warnings.simplefilter('ignore')
+
+import sunpy.wcs as wcs  # noqa
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+B0, L0, DSUN = -6.82, 10.0, 147724815128.0
+
+
+def chained_hcc_hg(x, y, b0_deg=0, l0_deg=0):
+    z = np.sqrt(wcs.wcs.rsun_meters**2 - x**2 - y**2)
+    cosb = np.cos(np.deg2rad(b0_deg))
+    sinb = np.sin(np.deg2rad(b0_deg))
+    hecr = np.sqrt(x**2 + y**2 + z**2)
+    hgln = np.arctan2(x, z * cosb - y * sinb) + np.deg2rad(l0_deg)
+    hglt = np.arcsin((y * cosb + z * sinb) / hecr)
+    return np.rad2deg(hgln), np.rad2deg(hglt)
+
+
+def chained_hpc_hg(x, y):
+    hccx, hccy = wcs.convert_hpc_hcc(x, y, dsun_meters=DSUN)
+    return chained_hcc_hg(hccx, hccy, b0_deg=B0, l0_deg=L0)
+
+
+def chained_hg_hpc(lon, lat):
+    hccx, hccy = wcs.convert_hg_hcc(lon, lat, b0_deg=B0, l0_deg=L0)
+    return wcs.convert_hcc_hpc(hccx, hccy, dsun_meters=DSUN)
+
+
+def peak_memory(func):
+    if tracemalloc is None:
+        return float('nan')
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def report(name, reference, candidates, repeat=3):
+    expected = reference()
+    print(name)
+    for label, func in [('chained', reference)] + candidates:
+        seconds = min(timeit.repeat(func, number=1, repeat=repeat))
+        error = max(np.nanmax(np.abs(np.asarray(r, dtype=float) - e))
+                    for r, e in zip(func(), expected))
+        print('  {0:<10} {1:8.3f} s  {2:9.1f} MiB peak  max abs error {3:.2e}'.format(
+            label, seconds, peak_memory(func), error))
+
+
+def main(npix=4096):
+    x, y = np.meshgrid(np.linspace(-1100, 1100, npix), np.linspace(-1100, 1100, npix))
+    report('hpc -> hg ({0}x{0})'.format(npix), lambda: chained_hpc_hg(x, y), [
+        ('fused', lambda: wcs.convert_hpc_hg(x, y, b0_deg=B0, l0_deg=L0, dsun_meters=DSUN)),
+        ('float32', lambda: wcs.convert_hpc_hg(x, y, b0_deg=B0, l0_deg=L0, dsun_meters=DSUN,
+                                               dtype=np.float32))])
+
+    lon, lat = x / 15, y / 15
+    report('hg -> hpc ({0}x{0})'.format(npix), lambda: chained_hg_hpc(lon, lat), [
+        ('fused', lambda: wcs.convert_hg_hpc(lon, lat, b0_deg=B0, l0_deg=L0, dsun_meters=DSUN)),
+        ('float32', lambda: wcs.convert_hg_hpc(lon, lat, b0_deg=B0, l0_deg=L0, dsun_meters=DSUN,
+                                               dtype=np.float32))])
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])